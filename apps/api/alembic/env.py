@@ -11,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 # Import settings and SQLModel
 from app.core.config import settings
+from app.core.config.constants import ASSET_VECTOR_INDEXES
 from sqlmodel import SQLModel
 
 # Import all models to ensure they're registered with SQLModel.metadata
@@ -34,6 +35,16 @@ if config.config_file_name is not None:
 # Set target_metadata for autogenerate support
 target_metadata = SQLModel.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # catalog_change is written with raw SQL by app/services/catalog_version.py and has no model.
+    if type_ == "table" and name == "catalog_change":
+        return False
+    # The asset vector ANN index follows VECTOR_CANDIDATE_MODE (data/vector_index.py),
+    # so autogenerate must not drop or recreate it.
+    return not (type_ == "index" and name in ASSET_VECTOR_INDEXES.values())
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -58,6 +69,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -78,7 +90,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,44 @@
+"""Add HNSW indexes on asset.asset_vector and userprofile.profile_vector
+
+Revision ID: 3f9a1c2d7b44
+Revises: ce564a4a65b1
+Create Date: 2026-10-17 09:12:40.118532
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "3f9a1c2d7b44"
+down_revision: str | Sequence[str] | None = "ce564a4a65b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Cosine ops to match the `<=>` operator used by search and recommendations.
+    op.create_index(
+        "idx_asset_asset_vector_hnsw",
+        "asset",
+        ["asset_vector"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"asset_vector": "vector_cosine_ops"},
+    )
+    op.create_index(
+        "idx_userprofile_profile_vector_hnsw",
+        "userprofile",
+        ["profile_vector"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"profile_vector": "vector_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_userprofile_profile_vector_hnsw", table_name="userprofile", postgresql_using="hnsw"
+    )
+    op.drop_index("idx_asset_asset_vector_hnsw", table_name="asset", postgresql_using="hnsw")
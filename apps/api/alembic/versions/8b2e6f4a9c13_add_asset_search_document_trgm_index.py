@@ -0,0 +1,40 @@
+"""Add asset.search_document with a pg_trgm GIN index
+
+Revision ID: 8b2e6f4a9c13
+Revises: 3f9a1c2d7b44
+Create Date: 2026-10-17 14:05:12.604318
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "8b2e6f4a9c13"
+down_revision: str | Sequence[str] | None = "3f9a1c2d7b44"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Requires the pg_trgm extension (enabled in scripts/init.sql).
+    op.add_column("asset", sa.Column("search_document", sa.Text(), nullable=True))
+    # Backfill existing rows; ingest maintains the column from here on.
+    op.execute(
+        "UPDATE asset SET search_document = CONCAT_WS("
+        "' ', name_th, name_en, description_th, description_en)"
+    )
+    op.create_index(
+        "idx_asset_search_document_trgm",
+        "asset",
+        ["search_document"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_document": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_asset_search_document_trgm", table_name="asset", postgresql_using="gin")
+    op.drop_column("asset", "search_document")
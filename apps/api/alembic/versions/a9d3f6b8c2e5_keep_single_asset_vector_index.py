@@ -0,0 +1,48 @@
+"""Keep a single ANN index on asset vectors (halfvec HNSW)
+
+Revision ID: a9d3f6b8c2e5
+Revises: f2c7d9a4e6b1
+Create Date: 2026-10-17 23:05:41.218734
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "a9d3f6b8c2e5"
+down_revision: str | Sequence[str] | None = "f2c7d9a4e6b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Every HNSW index is updated on each asset write, so keep only the one the default
+    # candidate mode (halfvec) scans: half the size of the float32 index at nearly the same
+    # recall once the shortlist is re-ranked with asset_vector, which stays in the table.
+    # Other modes build their own index with `python -m data.vector_index --mode <mode>`.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_asset_asset_vector_halfvec_hnsw ON asset "
+        "USING hnsw ((asset_vector::halfvec(768)) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_asset_asset_vector_hnsw")
+    op.execute("DROP INDEX IF EXISTS idx_asset_asset_vector_binary_hnsw")
+    op.execute("DROP INDEX IF EXISTS idx_asset_asset_vector_reduced_hnsw")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_asset_asset_vector_reduced_hnsw ON asset "
+        "USING hnsw (asset_vector_reduced vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_asset_asset_vector_binary_hnsw ON asset "
+        "USING hnsw ((binary_quantize(asset_vector)::bit(768)) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_asset_asset_vector_hnsw ON asset "
+        "USING hnsw (asset_vector vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
@@ -0,0 +1,37 @@
+"""Add the catalog change log shared by all workers
+
+Revision ID: b6e1f4c8d2a7
+Revises: a9d3f6b8c2e5
+Create Date: 2026-10-17 23:48:12.604215
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "b6e1f4c8d2a7"
+down_revision: str | Sequence[str] | None = "a9d3f6b8c2e5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # One row per catalog version; asset_ids is NULL for bulk writes such as ingests.
+    op.create_table(
+        "catalog_change",
+        sa.Column("version", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column("asset_ids", postgresql.ARRAY(sa.Integer()), nullable=True),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_change")
@@ -0,0 +1,48 @@
+"""Add indexed asset.location_geog geography column
+
+Revision ID: c71d3e5f2a86
+Revises: 8b2e6f4a9c13
+Create Date: 2026-10-17 15:21:47.093152
+"""
+
+from collections.abc import Sequence
+
+import geoalchemy2
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "c71d3e5f2a86"
+down_revision: str | Sequence[str] | None = "8b2e6f4a9c13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Stored geography so ST_DWithin in metres can use a GiST index instead of
+    # casting location_geom::geography for every row.
+    op.add_column(
+        "asset",
+        sa.Column(
+            "location_geog",
+            geoalchemy2.types.Geography(
+                geometry_type="POINT",
+                srid=4326,
+                from_text="ST_GeogFromText",
+                name="geography",
+                spatial_index=False,
+            ),
+            nullable=True,
+        ),
+    )
+    op.execute(
+        "UPDATE asset SET location_geog = location_geom::geography WHERE location_geom IS NOT NULL"
+    )
+    op.create_index(
+        "idx_asset_location_geog", "asset", ["location_geog"], unique=False, postgresql_using="gist"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_asset_location_geog", table_name="asset", postgresql_using="gist")
+    op.drop_column("asset", "location_geog")
@@ -0,0 +1,37 @@
+"""Add halfvec and binary-quantized HNSW expression indexes on asset.asset_vector
+
+Revision ID: d4a7e2b9f310
+Revises: c71d3e5f2a86
+Create Date: 2026-10-17 17:02:18.554019
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "d4a7e2b9f310"
+down_revision: str | Sequence[str] | None = "c71d3e5f2a86"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Requires pgvector >= 0.7. The compact forms live only in the indexes, which
+    # Postgres computes from asset_vector (so building them is the backfill, and
+    # ingest needs no changes); full vectors stay in the table for re-ranking.
+    # Query expressions must match these exactly (see COMPACT_DISTANCE_SQL).
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_asset_asset_vector_halfvec_hnsw ON asset "
+        "USING hnsw ((asset_vector::halfvec(768)) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_asset_asset_vector_binary_hnsw ON asset "
+        "USING hnsw ((binary_quantize(asset_vector)::bit(768)) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_asset_asset_vector_binary_hnsw")
+    op.execute("DROP INDEX IF EXISTS idx_asset_asset_vector_halfvec_hnsw")
@@ -0,0 +1,45 @@
+"""Add PCA-projected asset.asset_vector_reduced with an HNSW index
+
+Revision ID: e5b8c1d2a7f4
+Revises: d4a7e2b9f310
+Create Date: 2026-10-17 18:40:05.317268
+"""
+
+from collections.abc import Sequence
+
+import pgvector.sqlalchemy
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "e5b8c1d2a7f4"
+down_revision: str | Sequence[str] | None = "d4a7e2b9f310"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Filled by `python -m data.fit_projection` (fits PCA and backfills every row);
+    # ingest and asset writes keep it in sync once a projection file exists.
+    op.add_column(
+        "asset",
+        sa.Column(
+            "asset_vector_reduced", pgvector.sqlalchemy.vector.VECTOR(dim=256), nullable=True
+        ),
+    )
+    op.create_index(
+        "idx_asset_asset_vector_reduced_hnsw",
+        "asset",
+        ["asset_vector_reduced"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"asset_vector_reduced": "vector_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_asset_asset_vector_reduced_hnsw", table_name="asset", postgresql_using="hnsw"
+    )
+    op.drop_column("asset", "asset_vector_reduced")
@@ -0,0 +1,27 @@
+"""Add asset.embedding_hash for skipping unchanged re-embeds
+
+Revision ID: f2c7d9a4e6b1
+Revises: e5b8c1d2a7f4
+Create Date: 2026-10-17 21:12:47.902315
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "f2c7d9a4e6b1"
+down_revision: str | Sequence[str] | None = "e5b8c1d2a7f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # No backfill: rows without a hash are re-embedded (and hashed) on their next
+    # write or ingest, after which unchanged rows skip the encode.
+    op.add_column("asset", sa.Column("embedding_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("asset", "embedding_hash")
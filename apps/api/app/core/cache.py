@@ -0,0 +1,180 @@
+"""
+In-process LRU cache with optional TTL expiry and hit/miss counters,
+plus an optional SQLite-backed store for entries that should persist.
+Shared by services that memoize expensive per-request work.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe LRU cache; `ttl_seconds=None` disables time-based expiry."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> V | Any:
+        """Return the cached value (refreshing its recency) or `default`."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        """Return size and hit/miss counters."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def normalize_text_key(value: str) -> str:
+    """Collapse whitespace and casefold so trivially different queries share a key."""
+    return " ".join(value.split()).casefold()
+
+
+class SQLiteCacheStore:
+    """
+    Persistent JSON key/value store backed by a local SQLite file.
+    Survives restarts and is safe to share between worker processes; each process
+    keeps one connection (reopened after a fork). Calls block on disk I/O and on
+    other processes' write locks, so async callers should run them in a thread.
+    Expired rows are purged on write, at most every `purge_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        ttl_seconds: float | None = None,
+        purge_interval_seconds: float = 300.0,
+    ) -> None:
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._last_purge = time.monotonic()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_created_at ON {table} (created_at)"
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        """This process's connection, opened on first use; call with `_lock` held."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key: str) -> Any | None:
+        """Return the decoded value for `key`, or None when absent or expired."""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        value, created_at = row
+        if self.ttl_seconds and created_at + self.ttl_seconds < time.time():
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Insert or replace `key` with a JSON-serializable value."""
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, encoded, time.time()),
+                )
+                if time.monotonic() - self._last_purge >= self.purge_interval_seconds:
+                    self._purge(conn)
+
+    def purge_expired(self) -> int:
+        """Delete expired rows now; returns how many were removed."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                return self._purge(conn)
+
+    def _purge(self, conn: sqlite3.Connection) -> int:
+        self._last_purge = time.monotonic()
+        if not self.ttl_seconds:
+            return 0
+        cursor = conn.execute(
+            f"DELETE FROM {self.table} WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close this process's connection; the next call reopens it."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
@@ -3,6 +3,8 @@
 # Model configuration
 EMBEDDING_MODEL_NAME = "paraphrase-multilingual-mpnet-base-v2"
 EMBEDDING_DIMENSION = 768
+# PCA-projected embedding size (asset.asset_vector_reduced)
+PROJECTION_DIMENSION = 256
 LLM_MODEL_NAME = "gemma3:4b"
 PARSER_MODEL_NAME = "gemma3:4b"
 
@@ -12,6 +14,50 @@ MAX_PAGE_SIZE = 100
 VECTOR_SEARCH_TOP_K = 3
 GEOSPATIAL_RADIUS_METERS = 10000
 LOCATION_DISTANCE_NORMALIZATION = 50000
+# Mean Earth radius for in-memory radius filters (PostGIS geography uses the spheroid)
+EARTH_RADIUS_METERS = 6371008.8
+SEARCH_COUNT_CAP_MAX = 100000
+SEARCH_BATCH_MAX_SIZE = 20
+SEARCH_LATENCY_BUDGET_MAX_MS = 30000
+# Autocomplete: suggestions per request, and index keys scanned per prefix lookup
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_SCAN_LIMIT = 1000
+# Price histogram bucket edges (THB) for search facets
+FACET_PRICE_EDGES = (
+    1_000_000,
+    2_000_000,
+    3_000_000,
+    5_000_000,
+    10_000_000,
+    20_000_000,
+    50_000_000,
+)
+# Asset write batches remembered for incremental refresh of in-memory snapshots
+CATALOG_CHANGELOG_SIZE = 256
+
+# Lexical (pg_trgm) scoring weights for search
+LEXICAL_WEIGHT_NAME = 2.0
+LEXICAL_WEIGHT_DOCUMENT = 1.0
+
+# Hybrid rank fusion (ranking="rrf" / "weighted")
+RRF_K = 60
+FUSION_WEIGHT_VECTOR = 0.7
+FUSION_WEIGHT_LEXICAL = 0.3
+SEARCH_FUSION_K_MAX = 1000
+
+# Vector index configuration (HNSW build parameters)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+HNSW_EF_SEARCH_MAX = 1000
+# ANN index on asset per vector candidate mode; only the configured mode's index is kept
+# (see data/vector_index.py), full vectors stay in asset_vector for re-ranking.
+ASSET_VECTOR_INDEXES = {
+    "full": "idx_asset_asset_vector_hnsw",
+    "halfvec": "idx_asset_asset_vector_halfvec_hnsw",
+    "binary": "idx_asset_asset_vector_binary_hnsw",
+    "projected": "idx_asset_asset_vector_reduced_hnsw",
+}
 
 # Recommendation configuration
 ITEM_RECOMMENDATIONS_LIMIT = 5
@@ -31,6 +77,9 @@ ACTION_WEIGHTS = {"click": ACTION_WEIGHT_CLICK, "save": ACTION_WEIGHT_SAVE}
 
 # Timeout configuration
 OLLAMA_TIMEOUT_SECONDS = 10.0
+OLLAMA_CONNECT_TIMEOUT_SECONDS = 2.0
+# Startup model preload; a cold load from disk can take far longer than a parse
+OLLAMA_PRELOAD_TIMEOUT_SECONDS = 120.0
 GEOCODER_TIMEOUT_SECONDS = 5.0
 
 # Batch processing
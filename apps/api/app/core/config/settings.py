@@ -3,6 +3,8 @@ Configuration settings loaded from environment variables.
 Uses pydantic-settings for type-safe configuration management.
 """
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,6 +23,115 @@ class Settings(BaseSettings):
 
     # Ollama Configuration
     OLLAMA_BASE_URL: str = "http://localhost:11434"
+    # Pooled keep-alive connections shared by query parser requests.
+    ollama_max_connections: int = 10
+    # Consecutive failures (errors, timeouts, 5xx) that open the parser's Ollama circuit;
+    # while open, parses fall back without calling Ollama until the reset window passes.
+    ollama_circuit_failure_threshold: int = 3
+    ollama_circuit_reset_seconds: float = 30.0
+
+    # Startup Warmup Configuration
+    # Load the Ollama chat and parser models during warmup, before reporting ready.
+    startup_preload_ollama: bool = True
+    # Report ready once the embedding model is warm instead of after every stage (including
+    # the Ollama preload); first parses and chats may then pay the cold-model cost.
+    startup_ready_after_embedding: bool = False
+
+    # Vector Index Configuration
+    # Default HNSW candidate list size; higher improves recall at the cost of latency.
+    hnsw_ef_search: int = 40
+    # Requires pgvector >= 0.8; keeps filtered ANN scans from returning short pages.
+    hnsw_iterative_scan: str | None = "relaxed_order"
+    # Vector candidate generation: "halfvec"/"binary" scan the compact expression index
+    # (pgvector >= 0.7), "projected" the PCA-reduced column, "full" the float32 vectors;
+    # compact modes re-rank a shortlist with full vectors. Only the halfvec index is built
+    # by migrations; build another mode's with data/vector_index.py before switching.
+    vector_candidate_mode: Literal["full", "halfvec", "binary", "projected"] = "halfvec"
+    # Shortlist size as a multiple of the requested neighbours for compact modes.
+    vector_rerank_factor: int = 4
+    # PCA projection fitted by data/fit_projection.py (default: data/embedding_projection.npz).
+    embedding_projection_path: str | None = None
+
+    # Embedding Backend Configuration
+    # "torch" (SentenceTransformer on PyTorch) or "onnx" (ONNX Runtime, needs
+    # sentence-transformers[onnx]); ONNX falls back to PyTorch if it cannot load.
+    embedding_backend: Literal["torch", "onnx"] = "torch"
+    # Directory from data/export_onnx_embedding.py; unset exports the hub model on load.
+    embedding_onnx_path: str | None = None
+    # ONNX file inside the model directory, e.g. "onnx/model_qint8_avx512_vnni.onnx".
+    embedding_onnx_file: str | None = None
+    # ONNX Runtime intra-op threads; unset lets onnxruntime use every core.
+    embedding_onnx_threads: int | None = None
+
+    # Embedding Batching Configuration
+    # Single-text encodes from concurrent requests are grouped into one model call of up
+    # to this many texts, waiting at most this long after the first request.
+    embedding_batch_max_size: int = 32
+    embedding_batch_max_wait_ms: float = 5.0
+    # Requests waiting for a batch; when full, callers wait to enqueue (backpressure).
+    embedding_batch_queue_size: int = 1024
+
+    # Query Embedding Cache Configuration
+    embedding_cache_size: int = 4096
+    embedding_cache_ttl_seconds: float | None = 24 * 60 * 60
+
+    # Lexical Search Configuration
+    # pg_trgm word similarity (0-1) a row needs to count as a lexical match.
+    lexical_similarity_threshold: float = 0.4
+    # Candidates taken from each index (vector, lexical) before rank fusion.
+    search_fusion_k: int = 100
+
+    # Search Pipeline Configuration
+    # Thread pool size for CPU-bound pre-SQL stages (batch search query encoding).
+    search_pipeline_workers: int = 4
+    # Rows counted before a capped search total is reported as "N+".
+    search_count_cap: int = 1000
+    # Default wait (ms) for the LLM query parse before ranking the raw query; unset waits.
+    search_latency_budget_ms: int | None = None
+
+    # Search Result Cache Configuration
+    # Ranked ids and totals per normalized request; asset writes invalidate them.
+    search_result_cache_size: int = 1024
+    # Bounds staleness from writes that did not bump the catalog version.
+    search_result_cache_ttl_seconds: float | None = 5 * 60
+
+    # Search Facet Cache Configuration
+    # Facet counts per normalized query and filters; asset writes invalidate them.
+    search_facet_cache_size: int = 512
+    search_facet_cache_ttl_seconds: float | None = 5 * 60
+
+    # Catalog Version Configuration
+    # How often the shared catalog version is re-read from the database; bounds how long
+    # caches in this worker miss writes made by other workers or the ingest CLI.
+    catalog_version_poll_seconds: float = 1.0
+
+    # Autocomplete Index Configuration
+    # Full rebuild interval; picks up writes made without bumping the catalog version.
+    suggest_index_max_age_seconds: float | None = 10 * 60
+
+    # In-Process Vector Mirror Configuration
+    # Answer vector + filter ranking from an in-memory numpy snapshot of asset vectors.
+    vector_mirror_enabled: bool = False
+    # Full reload interval; picks up writes made without bumping the catalog version.
+    vector_mirror_max_age_seconds: float | None = 10 * 60
+
+    # Query Parser Configuration
+    # Share of the query the rule parser must explain (0-1) to skip the LLM; > 1 disables it.
+    rule_parser_min_confidence: float = 0.8
+
+    # Query Parser Cache Configuration
+    parser_cache_size: int = 2048
+    parser_cache_ttl_seconds: float | None = 24 * 60 * 60
+    # Optional SQLite file so parsed queries survive restarts and are shared by workers.
+    parser_cache_path: str | None = None
+
+    # Geocoding Configuration
+    # Minimum difflib ratio for a fuzzy gazetteer match (0-1).
+    gazetteer_fuzzy_cutoff: float = 0.85
+    # Query Nominatim (off the event loop) when the offline gazetteer has no match.
+    geocoder_nominatim_fallback: bool = True
+    geocode_cache_size: int = 2048
+    geocode_cache_ttl_seconds: float | None = 7 * 24 * 60 * 60
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -4,9 +4,10 @@ This file initializes the FastAPI app, sets up logging,
 CORS middleware, and includes API routers.
 """
 
+import asyncio
 import time
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,6 +15,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
 from .core.config.logging import get_logger, setup_logging
 from .routers import assets, chat, health, ingest, recommend, search
+from .services.embedding_dispatcher import embedding_dispatcher
+from .services.ollama_client import close_ollama_client, start_ollama_client
+from .services.warmup import warm_up
 
 # Setup logging configuration
 setup_logging()
@@ -25,8 +29,17 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for startup and shutdown events."""
     logger.info("Starting up application...")
+    start_ollama_client()
+    embedding_dispatcher.start()
+    # Models load in the background so liveness probes pass while /health/ready reports 503.
+    warmup_task = asyncio.create_task(warm_up(), name="startup-warmup")
     yield
     logger.info("Shutting down application...")
+    warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    await embedding_dispatcher.stop()
+    await close_ollama_client()
 
 
 # Initialize FastAPI app
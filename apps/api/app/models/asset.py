@@ -2,11 +2,13 @@
 
 from typing import Optional
 
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, DateTime, Numeric, Text, func
+from sqlalchemy import Column, DateTime, Index, Numeric, String, Text, func
 from sqlmodel import Field, SQLModel
 
+from app.core.config.constants import PROJECTION_DIMENSION
+
 
 class AssetType(SQLModel, table=True):
     """Asset type model (e.g., Condo, House, Land)."""
@@ -22,6 +24,16 @@ class Asset(SQLModel, table=True):
     """Asset model representing real estate properties."""
 
     __tablename__ = "asset"
+    # The vector ANN index depends on VECTOR_CANDIDATE_MODE and is managed by
+    # migrations and data/vector_index.py, not declared here.
+    __table_args__ = (
+        Index(
+            "idx_asset_search_document_trgm",
+            "search_document",
+            postgresql_using="gin",
+            postgresql_ops={"search_document": "gin_trgm_ops"},
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     asset_code: str = Field(index=True)
@@ -51,6 +63,22 @@ class Asset(SQLModel, table=True):
         default=None,
         sa_column=Column(Geometry("POINT", srid=4326), nullable=True),
     )
+    location_geog: Optional[str] = Field(
+        default=None,
+        sa_column=Column(Geography("POINT", srid=4326), nullable=True),
+    )
     asset_vector: Optional[list[float]] = Field(
         default=None, sa_column=Column(Vector(768), nullable=True)
     )
+    # PCA projection of asset_vector (see app/services/projection.py)
+    asset_vector_reduced: Optional[list[float]] = Field(
+        default=None, sa_column=Column(Vector(PROJECTION_DIMENSION), nullable=True)
+    )
+    search_document: Optional[str] = Field(
+        default=None, sa_column=Column(Text, nullable=True)
+    )
+    # SHA-256 of the embedding model version and build_doc text behind asset_vector;
+    # writes skip re-encoding while it matches (see ingest_service.embed_if_changed)
+    embedding_hash: Optional[str] = Field(
+        default=None, sa_column=Column(String(64), nullable=True)
+    )
@@ -4,14 +4,25 @@ from datetime import datetime
 from typing import Optional
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy import Column, DateTime, Index, String, func
 from sqlmodel import Field, SQLModel
 
+from app.core.config.constants import HNSW_EF_CONSTRUCTION, HNSW_M
+
 
 class UserProfile(SQLModel, table=True):
     """User profile model with vector embeddings for recommendations."""
 
     __tablename__ = "userprofile"
+    __table_args__ = (
+        Index(
+            "idx_userprofile_profile_vector_hnsw",
+            "profile_vector",
+            postgresql_using="hnsw",
+            postgresql_with={"m": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION},
+            postgresql_ops={"profile_vector": "vector_cosine_ops"},
+        ),
+    )
 
     client_id: str = Field(sa_column=Column(String, primary_key=True))
     profile_vector: Optional[list[float]] = Field(
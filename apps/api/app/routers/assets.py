@@ -1,6 +1,6 @@
 """Asset CRUD router."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import func
 from sqlmodel import Session, select
 
@@ -14,12 +14,23 @@ from app.schemas.asset import (
     AssetTypeListResponse,
     AssetUpdate,
 )
-from app.services.ingest_service import build_doc, embed_record
+from app.services.catalog_version import bump_catalog_version
+from app.services.ingest_service import (
+    apply_location,
+    apply_projection,
+    build_doc,
+    build_search_document,
+    embed_if_changed,
+)
+from app.services.pagination import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
+# Set on PUT/PATCH: 1 when the stored vector was kept because the embedding text is unchanged.
+ENCODES_SKIPPED_HEADER = "X-Embedding-Encodes-Skipped"
+
 
 def get_asset_or_404(asset_id: int, session: Session) -> Asset:
     asset = session.get(Asset, asset_id)
@@ -32,13 +43,24 @@ def get_asset_or_404(asset_id: int, session: Session) -> Asset:
 def list_assets(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    cursor: str | None = Query(None, description="`next_cursor` from the previous page"),
     session: Session = Depends(get_session),
 ) -> AssetListResponse:
-    offset = (page - 1) * page_size
-    stmt = select(Asset).offset(offset).limit(page_size)
+    stmt = select(Asset).order_by(Asset.id).limit(page_size)
+    total: int | None = None
+    if cursor:
+        try:
+            (last_id,) = decode_cursor("assets", cursor, 1)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        stmt = stmt.where(Asset.id > last_id)
+    else:
+        stmt = stmt.offset((page - 1) * page_size)
+        # Only page-number requests count; cursor clients keep the first page's total.
+        total = session.exec(select(func.count()).select_from(Asset)).one()
     items = session.exec(stmt).all()
-    total = session.exec(select(func.count()).select_from(Asset)).one()
-    return AssetListResponse(items=items, total=total)
+    next_cursor = encode_cursor("assets", [items[-1].id]) if len(items) == page_size else None
+    return AssetListResponse(items=items, total=total, next_cursor=next_cursor)
 
 
 @router.get("/asset-types", response_model=AssetTypeListResponse)
@@ -57,32 +79,55 @@ def get_asset(asset_id: int, session: Session = Depends(get_session)) -> AssetRe
 
 @router.post("", response_model=AssetResponse, status_code=201)
 def create_asset(payload: AssetCreate, session: Session = Depends(get_session)) -> AssetResponse:
-    vector = embed_record(build_doc(payload.model_dump()))  # type: ignore[arg-type]
-    asset = Asset(**payload.model_dump(), asset_vector=vector)
+    data = payload.model_dump()
+    doc = build_doc(data)  # type: ignore[arg-type]
+    vector, content_hash, _ = embed_if_changed(doc, None, batched=True)
+    asset = Asset(
+        **data,
+        asset_vector=vector,
+        embedding_hash=content_hash,
+        search_document=build_search_document(data),
+    )
+    apply_location(asset)
+    apply_projection(asset)
     session.add(asset)
     session.commit()
     session.refresh(asset)
+    bump_catalog_version([asset.id])
     return asset
 
 
 @router.put("/{asset_id}", response_model=AssetResponse)
 def replace_asset(
-    asset_id: int, payload: AssetCreate, session: Session = Depends(get_session)
+    asset_id: int,
+    payload: AssetCreate,
+    response: Response,
+    session: Session = Depends(get_session),
 ) -> AssetResponse:
     asset = get_asset_or_404(asset_id, session)
-    vector = embed_record(build_doc(payload.model_dump()))  # type: ignore[arg-type]
+    doc = build_doc(payload.model_dump())  # type: ignore[arg-type]
+    vector, content_hash, encoded = embed_if_changed(doc, asset, batched=True)
+    response.headers[ENCODES_SKIPPED_HEADER] = str(int(not encoded and vector is not None))
     for key, value in payload.model_dump().items():
         setattr(asset, key, value)
     asset.asset_vector = vector
+    asset.embedding_hash = content_hash
+    asset.search_document = build_search_document(asset.__dict__)
+    apply_location(asset)
+    apply_projection(asset)
     session.add(asset)
     session.commit()
     session.refresh(asset)
+    bump_catalog_version([asset.id])
     return asset
 
 
 @router.patch("/{asset_id}", response_model=AssetResponse)
 def update_asset(
-    asset_id: int, payload: AssetUpdate, session: Session = Depends(get_session)
+    asset_id: int,
+    payload: AssetUpdate,
+    response: Response,
+    session: Session = Depends(get_session),
 ) -> AssetResponse:
     asset = get_asset_or_404(asset_id, session)
 
@@ -92,11 +137,21 @@ def update_asset(
     for key, value in data.items():
         setattr(asset, key, value)
 
+    skipped = 0
     if not skip_embedding:
-        vector = embed_record(build_doc(asset.__dict__))
+        vector, content_hash, encoded = embed_if_changed(
+            build_doc(asset.__dict__), asset, batched=True
+        )
+        skipped = int(not encoded and vector is not None)
         asset.asset_vector = vector
+        asset.embedding_hash = content_hash
+    response.headers[ENCODES_SKIPPED_HEADER] = str(skipped)
+    asset.search_document = build_search_document(asset.__dict__)
+    apply_location(asset)
+    apply_projection(asset)
 
     session.add(asset)
     session.commit()
     session.refresh(asset)
+    bump_catalog_version([asset.id])
     return asset
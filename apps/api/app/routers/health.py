@@ -13,10 +13,14 @@ from app.core.config.logging import get_logger
 from app.schemas.health import (
     ApiStatus,
     DetailedHealthCheckResponse,
+    EmbeddingBatchingStats,
     HealthCheckResponse,
+    ReadinessResponse,
     ServiceStatus,
 )
 from app.services import chat_service
+from app.services.embedding_dispatcher import embedding_dispatcher
+from app.services.warmup import readiness
 
 logger = get_logger(__name__)
 
@@ -138,7 +142,7 @@ async def check_chat_service() -> ServiceStatus:
 
 @router.get("", response_model=HealthCheckResponse)
 async def health_check() -> HealthCheckResponse:
-    """Basic health check endpoint - checks if API is running."""
+    """Basic health check endpoint (liveness) - checks if API is running."""
     logger.debug("Health check endpoint accessed")
     return HealthCheckResponse(
         status="healthy",
@@ -218,4 +222,35 @@ async def detailed_health_check() -> DetailedHealthCheckResponse:
     return health_response
 
 
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"description": "Service Unavailable - Startup warmup not finished yet"}},
+)
+async def readiness_check() -> ReadinessResponse:
+    """
+    Readiness endpoint - 200 once startup warmup has finished and the embedding model
+    is warmed up, 503 before; see `stages` and `errors` for per-stage progress.
+    """
+    response = ReadinessResponse(
+        status=readiness.status,
+        ready_ms=readiness.ready_ms,
+        startup_ms=readiness.startup_ms,
+        stages=readiness.stages,
+        errors=readiness.errors,
+    )
+    if not readiness.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=response.model_dump(),
+        )
+    return response
+
+
+@router.get("/embedding", response_model=EmbeddingBatchingStats)
+async def embedding_batching_stats() -> EmbeddingBatchingStats:
+    """Batch size and queue wait metrics of the embedding dispatcher."""
+    return EmbeddingBatchingStats(**embedding_dispatcher.stats())
+
+
 # test
@@ -36,7 +36,7 @@ async def recommend_user(
 ) -> list[AssetResultSchema]:
     """Get user-based recommendations by profile vector."""
     try:
-        return recommend_service.get_user_recommendations(x_client_id, db)
+        return await recommend_service.get_user_recommendations(x_client_id, db)
     except Exception as exc:  # noqa: BLE001
         logger.error("Error in /recommend/user for %s: %s", x_client_id, exc)
         return []
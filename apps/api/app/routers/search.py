@@ -1,18 +1,38 @@
 """Search router for hybrid search endpoint."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
 
-from app.core.config.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.config.constants import (
+    DEFAULT_PAGE_SIZE,
+    HNSW_EF_SEARCH_MAX,
+    MAX_PAGE_SIZE,
+    SEARCH_COUNT_CAP_MAX,
+    SEARCH_FUSION_K_MAX,
+    SEARCH_LATENCY_BUDGET_MAX_MS,
+    SUGGEST_DEFAULT_LIMIT,
+    SUGGEST_MAX_LIMIT,
+)
 from app.core.config.logging import get_logger
 from app.db import get_session
 from app.schemas.search import (
     PaginationSchema,
+    SearchBatchRequestSchema,
+    SearchBatchResponseSchema,
+    SearchFacetsRequestSchema,
+    SearchFacetsResponseSchema,
     SearchFilterSchema,
+    SearchOptionsSchema,
     SearchRequestSchema,
     SearchResponseSchema,
+    SuggestionSchema,
+    SuggestResponseSchema,
 )
-from app.services.search_service import hybrid_search
+from app.services.facet_service import search_facets
+from app.services.search_service import batch_search, hybrid_search
+from app.services.suggest_index import suggest_index
 
 logger = get_logger(__name__)
 
@@ -31,6 +51,13 @@ async def search_assets_get(
     asset_type_id: list[int] | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    ef_search: int | None = Query(None, ge=1, le=HNSW_EF_SEARCH_MAX),
+    count_mode: Literal["exact", "capped"] = "exact",
+    count_cap: int | None = Query(None, ge=1, le=SEARCH_COUNT_CAP_MAX),
+    ranking: Literal["lexical_first", "rrf", "weighted"] = "lexical_first",
+    fusion_k: int | None = Query(None, ge=1, le=SEARCH_FUSION_K_MAX),
+    latency_budget_ms: int | None = Query(None, ge=1, le=SEARCH_LATENCY_BUDGET_MAX_MS),
     db: Session = Depends(get_session),
 ) -> SearchResponseSchema:
     """Hybrid search endpoint using query parameters."""
@@ -43,10 +70,19 @@ async def search_assets_get(
                 price_max=price_max,
                 bedrooms_min=bedrooms_min,
             ),
-            pagination=PaginationSchema(page=page, page_size=page_size),
+            pagination=PaginationSchema(page=page, page_size=page_size, cursor=cursor),
+            options=SearchOptionsSchema(
+                ef_search=ef_search,
+                count_mode=count_mode,
+                count_cap=count_cap,
+                ranking=ranking,
+                fusion_k=fusion_k,
+                latency_budget_ms=latency_budget_ms,
+            ),
         )
-        results, total_pages = await hybrid_search(request, db)
-        return SearchResponseSchema(results=results, total_pages=total_pages)
+        return await hybrid_search(request, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
         logger.error(f"Search service error: {e}")
         raise HTTPException(status_code=503, detail=str(e))
@@ -62,11 +98,97 @@ async def search_assets_post(
 ) -> SearchResponseSchema:
     """Hybrid search via JSON body."""
     try:
-        results, total_pages = await hybrid_search(request, db)
-        return SearchResponseSchema(results=results, total_pages=total_pages)
+        return await hybrid_search(request, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except RuntimeError as e:
         logger.error(f"Search service error: {e}")
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in /search: {e}")
         raise HTTPException(status_code=500, detail="Internal server error in search.")
+
+
+@router.post("/batch", response_model=SearchBatchResponseSchema)
+async def search_assets_batch(
+    request: SearchBatchRequestSchema,
+    db: Session = Depends(get_session),
+) -> SearchBatchResponseSchema:
+    """Several hybrid searches in one call, sharing parsing, embedding and the DB session."""
+    try:
+        responses = await batch_search(request.searches, db)
+        return SearchBatchResponseSchema(responses=responses)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        logger.error(f"Search service error: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in /search/batch: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error in search.")
+
+
+@router.get("/facets", response_model=SearchFacetsResponseSchema)
+async def search_facets_get(
+    query_text: str = "",
+    price_min: int | None = None,
+    price_max: int | None = None,
+    bedrooms_min: int | None = None,
+    asset_type_id: list[int] | None = Query(None),
+    db: Session = Depends(get_session),
+) -> SearchFacetsResponseSchema:
+    """Price histogram, bedroom and asset type counts for a search's filtered assets."""
+    try:
+        request = SearchFacetsRequestSchema(
+            query_text=query_text,
+            filters=SearchFilterSchema(
+                asset_type_id=asset_type_id,
+                price_min=price_min,
+                price_max=price_max,
+                bedrooms_min=bedrooms_min,
+            ),
+        )
+        return await search_facets(request, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in /search/facets: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error in search facets.")
+
+
+@router.post("/facets", response_model=SearchFacetsResponseSchema)
+async def search_facets_post(
+    request: SearchFacetsRequestSchema,
+    db: Session = Depends(get_session),
+) -> SearchFacetsResponseSchema:
+    """Search facets via JSON body."""
+    try:
+        return await search_facets(request, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in /search/facets: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error in search facets.")
+
+
+@router.get("/suggest", response_model=SuggestResponseSchema)
+async def search_suggest(
+    q: str = "",
+    limit: int = Query(SUGGEST_DEFAULT_LIMIT, ge=1, le=SUGGEST_MAX_LIMIT),
+) -> SuggestResponseSchema:
+    """
+    Prefix autocomplete over place, asset type and asset names (in-memory index).
+    Returns no suggestions until the index has been built at startup.
+    """
+    try:
+        snapshot = suggest_index.current()
+        suggestions = snapshot.lookup(q, limit) if snapshot is not None else []
+        return SuggestResponseSchema(
+            query=q,
+            suggestions=[
+                SuggestionSchema(text=item.text, kind=item.kind, id=item.id) for item in suggestions
+            ],
+        )
+    except Exception as e:
+        logger.error(f"Error in /search/suggest: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error in suggest.")
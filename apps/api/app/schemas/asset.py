@@ -47,7 +47,10 @@ class AssetResponse(AssetBase):
 
 class AssetListResponse(BaseModel):
     items: list[AssetResponse]
-    total: int
+    total: int | None = Field(
+        None, description="Number of assets; null on cursor pages, which skip counting"
+    )
+    next_cursor: str | None = None
 
 
 class AssetTypeResponse(BaseModel):
@@ -42,3 +42,33 @@ class DetailedHealthCheckResponse(BaseModel):
     services: dict[str, ApiStatus | ServiceStatus] = Field(
         ..., description="Status of each service"
     )
+
+
+class ReadinessResponse(BaseModel):
+    """Startup warmup state; the worker takes traffic once `status` is "ready"."""
+
+    status: Literal["starting", "ready", "failed"] = Field(..., description="Readiness status")
+    ready_ms: float | None = Field(None, description="Import to readiness in milliseconds")
+    startup_ms: float | None = Field(
+        None, description="Import to end of all warmup stages in milliseconds, once finished"
+    )
+    stages: dict[str, float] = Field(
+        default_factory=dict, description="Wall time of each finished warmup stage (ms)"
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="Warmup stages that failed, with their error"
+    )
+
+
+class EmbeddingBatchingStats(BaseModel):
+    """Embedding dispatcher counters; means and p95 cover the most recent batches."""
+
+    batches: int = Field(..., description="Batched model calls since startup")
+    items: int = Field(..., description="Encode requests served by those calls")
+    queue_depth: int = Field(..., description="Requests currently waiting for a batch")
+    queue_size: int = Field(..., description="Queue bound; callers wait when it is full")
+    mean_batch_size: float = Field(..., description="Mean requests per batch")
+    max_batch_size: int = Field(..., description="Largest batch since startup")
+    mean_queue_wait_ms: float = Field(..., description="Mean wait before the encode starts")
+    p95_queue_wait_ms: float = Field(..., description="95th percentile queue wait")
+    max_queue_wait_ms: float = Field(..., description="Longest queue wait since startup")
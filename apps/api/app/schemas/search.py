@@ -4,6 +4,14 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from app.core.config.constants import (
+    HNSW_EF_SEARCH_MAX,
+    SEARCH_BATCH_MAX_SIZE,
+    SEARCH_COUNT_CAP_MAX,
+    SEARCH_FUSION_K_MAX,
+    SEARCH_LATENCY_BUDGET_MAX_MS,
+)
+
 
 class SearchFilterSchema(BaseModel):
     """Filters for search queries."""
@@ -19,6 +27,52 @@ class PaginationSchema(BaseModel):
 
     page: int = 1
     page_size: int = 20
+    cursor: str | None = Field(
+        None, description="`next_cursor` from the previous page; takes precedence over `page`"
+    )
+
+
+class SearchOptionsSchema(BaseModel):
+    """Per-request tuning knobs trading recall for latency."""
+
+    ef_search: int | None = Field(
+        None,
+        ge=1,
+        le=HNSW_EF_SEARCH_MAX,
+        description="HNSW candidate list size; defaults to the `hnsw_ef_search` setting",
+    )
+    count_mode: Literal["exact", "capped"] = Field(
+        "exact",
+        description="`exact` counts every match; `capped` stops counting at `count_cap`",
+    )
+    count_cap: int | None = Field(
+        None,
+        ge=1,
+        le=SEARCH_COUNT_CAP_MAX,
+        description="Cap for `capped` totals; defaults to the `search_count_cap` setting",
+    )
+    ranking: Literal["lexical_first", "rrf", "weighted"] = Field(
+        "lexical_first",
+        description=(
+            "`lexical_first` ranks lexical matches before vector distance; `rrf` and "
+            "`weighted` fuse the top-K of the vector and lexical indexes"
+        ),
+    )
+    fusion_k: int | None = Field(
+        None,
+        ge=1,
+        le=SEARCH_FUSION_K_MAX,
+        description="Candidates per index for fusion; defaults to the `search_fusion_k` setting",
+    )
+    latency_budget_ms: int | None = Field(
+        None,
+        ge=1,
+        le=SEARCH_LATENCY_BUDGET_MAX_MS,
+        description=(
+            "Longest wait for the LLM query parse; past it, results rank the raw query text "
+            "with the explicit filters only. Defaults to the `search_latency_budget_ms` setting"
+        ),
+    )
 
 
 class SearchRequestSchema(BaseModel):
@@ -27,6 +81,7 @@ class SearchRequestSchema(BaseModel):
     query_text: str = ""
     filters: SearchFilterSchema = Field(default_factory=SearchFilterSchema)
     pagination: PaginationSchema = Field(default_factory=PaginationSchema)
+    options: SearchOptionsSchema = Field(default_factory=SearchOptionsSchema)
 
 
 class AssetResultSchema(BaseModel):
@@ -47,7 +102,90 @@ class SearchResponseSchema(BaseModel):
     """Response body for search endpoint."""
 
     results: list[AssetResultSchema]
-    total_pages: int
+    total_pages: int | None = Field(
+        None, description="Null on cursor pages, which skip counting; keep the first page's"
+    )
+    total_count: int | None = None
+    total_count_exact: bool = True
+    total_count_label: str | None = Field(
+        None, description='Display form of the total, e.g. "1000+" when capped'
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the following page; null on the last page"
+    )
+    speculative: bool = Field(
+        False,
+        description="True when the query parse missed the latency budget and was not applied",
+    )
+
+
+class SearchBatchRequestSchema(BaseModel):
+    """Request body for running several searches in one call."""
+
+    searches: list[SearchRequestSchema] = Field(..., min_length=1, max_length=SEARCH_BATCH_MAX_SIZE)
+
+
+class SearchBatchResponseSchema(BaseModel):
+    """Responses for a batch search, in the order of the requested searches."""
+
+    responses: list[SearchResponseSchema]
+
+
+class SearchFacetsRequestSchema(BaseModel):
+    """Request body for facet counts over a search's filtered asset set."""
+
+    query_text: str = ""
+    filters: SearchFilterSchema = Field(default_factory=SearchFilterSchema)
+
+
+class PriceBucketSchema(BaseModel):
+    """Histogram bucket of prices in [price_from, price_to); open-ended edges are null."""
+
+    price_from: int | None = None
+    price_to: int | None = None
+    count: int
+
+
+class BedroomCountSchema(BaseModel):
+    """Number of matching assets with exactly `bedrooms` bedrooms."""
+
+    bedrooms: int
+    count: int
+
+
+class AssetTypeCountSchema(BaseModel):
+    """Number of matching assets of one asset type."""
+
+    asset_type_id: int
+    name_th: str | None = None
+    name_en: str | None = None
+    count: int
+
+
+class SearchFacetsResponseSchema(BaseModel):
+    """Aggregations over the assets a search with the same query and filters would rank."""
+
+    total_count: int
+    price_min: float | None = None
+    price_max: float | None = None
+    price_histogram: list[PriceBucketSchema]
+    bedrooms: list[BedroomCountSchema]
+    asset_types: list[AssetTypeCountSchema]
+
+
+class SuggestionSchema(BaseModel):
+    """Autocomplete entry; `id` is the asset or asset type id (null for places)."""
+
+    text: str
+    kind: Literal["location", "asset_type", "asset"]
+    id: int | None = None
+
+
+class SuggestResponseSchema(BaseModel):
+    """Autocomplete suggestions for a typed prefix, best first."""
+
+    query: str
+    suggestions: list[SuggestionSchema]
 
 
 class TrackActionSchema(BaseModel):
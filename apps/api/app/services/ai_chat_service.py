@@ -1,15 +1,11 @@
 """
 Basic AI chat service using LangChain ChatOllama for general questions.
-Maintains conversation history per session.
+Maintains conversation history per session. LangChain is imported and the
+chain built by `init_ai_chat_service`, run by the app lifespan at startup.
 """
 
 import asyncio
 
-from langchain_core.messages import AIMessage, HumanMessage
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_ollama import ChatOllama
-
 from app.core.config import settings
 from app.core.config.constants import LLM_MODEL_NAME
 from app.core.config.logging import get_logger
@@ -21,14 +17,7 @@ chat_chain = None
 
 conversation_history: dict[str, list] = {}
 
-try:
-    logger.info("Starting AI chat service initialization...")
-
-    logger.info("Initializing ChatOllama for AI chat...")
-    llm = ChatOllama(model=LLM_MODEL_NAME, base_url=settings.OLLAMA_BASE_URL)
-    logger.info("ChatOllama initialized successfully")
-
-    system_prompt = """คุณเป็นผู้ช่วย AI ที่เชี่ยวชาญด้านการประมูลอสังหาริมทรัพย์ในประเทศไทย
+AI_CHAT_SYSTEM_PROMPT = """คุณเป็นผู้ช่วย AI ที่เชี่ยวชาญด้านการประมูลอสังหาริมทรัพย์ในประเทศไทย
 คุณช่วยตอบคำถามทั่วไปเกี่ยวกับ:
 - ขั้นตอนการประมูลอสังหาริมทรัพย์
 - วิธีการเข้าร่วมประมูล
@@ -37,21 +26,37 @@ try:
 
 ตอบคำถามเป็นภาษาไทยอย่างเป็นมิตรและชัดเจน"""
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_prompt),
-            MessagesPlaceholder(variable_name="history"),
-            ("human", "{question}"),
-        ]
-    )
 
-    chat_chain = prompt | llm | StrOutputParser()
-    logger.info("AI chat chain initialized successfully")
+def init_ai_chat_service() -> None:
+    """Build the chat chain; on failure `chat_chain` stays None and chat reports unavailable."""
+    global llm, chat_chain
+    if chat_chain is not None:
+        return
+    try:
+        logger.info("Starting AI chat service initialization...")
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+        from langchain_ollama import ChatOllama
+
+        logger.info("Initializing ChatOllama for AI chat...")
+        llm = ChatOllama(model=LLM_MODEL_NAME, base_url=settings.OLLAMA_BASE_URL)
+        logger.info("ChatOllama initialized successfully")
+
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", AI_CHAT_SYSTEM_PROMPT),
+                MessagesPlaceholder(variable_name="history"),
+                ("human", "{question}"),
+            ]
+        )
+
+        chat_chain = prompt | llm | StrOutputParser()
+        logger.info("AI chat chain initialized successfully")
 
-except Exception as e:
-    logger.critical(f"CRITICAL ERROR during AI chat service initialization: {e}")
-    logger.exception("AI chat service initialization traceback:")
-    chat_chain = None
+    except Exception as e:
+        logger.critical(f"CRITICAL ERROR during AI chat service initialization: {e}")
+        logger.exception("AI chat service initialization traceback:")
+        chat_chain = None
 
 
 def get_conversation_history(session_id: str) -> list:
@@ -61,6 +66,8 @@ def get_conversation_history(session_id: str) -> list:
 
 def add_to_history(session_id: str, human_message: str, ai_message: str) -> None:
     """Add messages to conversation history."""
+    from langchain_core.messages import AIMessage, HumanMessage
+
     if session_id not in conversation_history:
         conversation_history[session_id] = []
 
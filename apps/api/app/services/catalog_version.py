@@ -0,0 +1,123 @@
+"""
+Asset catalog version.
+Shared by every worker through the `catalog_change` table: each bump, made
+after asset writes commit, inserts a row whose serial `version` is the new
+catalog version and whose `asset_ids` lists the assets it touched (NULL for
+bulk writes). Caches and in-memory snapshots compare versions to tell
+whether they are stale and read the log to refresh only what changed. The
+latest version is re-read at most every `catalog_version_poll_seconds`, so
+writes from other processes (uvicorn workers, the ingest CLI) are seen
+within that interval.
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.config.constants import CATALOG_CHANGELOG_SIZE
+from app.core.config.logging import get_logger
+from app.db.database import engine
+
+logger = get_logger(__name__)
+
+_lock = threading.Lock()
+_version = 0
+_checked_at: float | None = None
+
+
+def read_catalog_version() -> int:
+    """Latest version in the database (0 before the first write)."""
+    with engine.connect() as connection:
+        return int(
+            connection.execute(
+                text("SELECT COALESCE(MAX(version), 0) FROM catalog_change")
+            ).scalar_one()
+        )
+
+
+def current_catalog_version() -> int:
+    """
+    Return the version of the asset catalog, re-read from the database at most
+    every `catalog_version_poll_seconds`; keeps the last known version when
+    the database cannot be reached.
+    """
+    global _version, _checked_at
+    with _lock:
+        now = time.monotonic()
+        if _checked_at is not None and now - _checked_at < settings.catalog_version_poll_seconds:
+            return _version
+        _checked_at = now
+        try:
+            _version = max(_version, read_catalog_version())
+        except SQLAlchemyError as e:
+            logger.error(f"Could not read catalog version: {e}")
+        return _version
+
+
+def bump_catalog_version(asset_ids: Iterable[int] | None = None) -> int:
+    """
+    Mark the catalog as changed; call after committing asset writes.
+    Pass the written ids when known; bulk writes such as ingests pass None.
+    Log entries older than the last `CATALOG_CHANGELOG_SIZE` are pruned.
+    """
+    global _version, _checked_at
+    ids = sorted(set(asset_ids)) if asset_ids is not None else None
+    try:
+        with engine.begin() as connection:
+            version = int(
+                connection.execute(
+                    text(
+                        "INSERT INTO catalog_change (asset_ids) VALUES (:asset_ids) "
+                        "RETURNING version"
+                    ).bindparams(asset_ids=ids)
+                ).scalar_one()
+            )
+            connection.execute(
+                text("DELETE FROM catalog_change WHERE version <= :oldest").bindparams(
+                    oldest=version - CATALOG_CHANGELOG_SIZE
+                )
+            )
+    except SQLAlchemyError as e:
+        # The write itself has committed; other workers pick it up through their cache TTLs.
+        logger.error(f"Could not bump catalog version: {e}")
+        return current_catalog_version()
+    with _lock:
+        _version = max(_version, version)
+        _checked_at = time.monotonic()
+        return _version
+
+
+def changes_since(version: int) -> frozenset[int] | None:
+    """
+    Asset ids changed after `version`, or None when a bulk write happened, the
+    log no longer reaches back that far or the database cannot be read
+    (callers should reload everything).
+    """
+    try:
+        with engine.connect() as connection:
+            oldest = connection.execute(
+                text("SELECT MIN(version) FROM catalog_change")
+            ).scalar_one()
+            rows = connection.execute(
+                text(
+                    "SELECT asset_ids FROM catalog_change WHERE version > :version ORDER BY version"
+                ).bindparams(version=version)
+            ).all()
+    except SQLAlchemyError as e:
+        logger.error(f"Could not read catalog changes: {e}")
+        return None
+    if not rows:
+        return frozenset()
+    # Without an entry at or before `version`, older changes may have been pruned.
+    if oldest is None or oldest > version:
+        return None
+    changed: set[int] = set()
+    for (asset_ids,) in rows:
+        if asset_ids is None:
+            return None
+        changed.update(asset_ids)
+    return frozenset(changed)
@@ -1,27 +1,42 @@
 """
 RAG Chatbot service using LangChain to connect pgvector database to Ollama.
+LangChain is imported and the chain (with its PGVector connection) is built by
+`init_chat_service`, which the app lifespan runs during startup warmup.
 """
 
-import asyncio
+from __future__ import annotations
 
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableLambda, RunnableParallel
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_ollama import ChatOllama
-from langchain_postgres import PGVector
+import asyncio
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
 from app.core.config.constants import (
-    EMBEDDING_MODEL_NAME,
     LLM_MODEL_NAME,
     VECTOR_SEARCH_TOP_K,
 )
 from app.core.config.logging import get_logger
+from app.services.embedding import encode, encode_batch
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
 
 logger = get_logger(__name__)
 
 
+def shared_model_embeddings() -> Embeddings:
+    """LangChain embeddings backed by the process-wide model in `app.services.embedding`."""
+    from langchain_core.embeddings import Embeddings
+
+    class SharedModelEmbeddings(Embeddings):
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            return encode_batch(texts)
+
+        def embed_query(self, text: str) -> list[float]:
+            return encode(text)
+
+    return SharedModelEmbeddings()
+
+
 def format_docs(docs):
     """Format retrieved documents into a readable string."""
     formatted = []
@@ -42,34 +57,7 @@ def format_docs(docs):
     return "\n\n---\n\n".join(formatted)
 
 
-embeddings = None
-llm = None
-retriever = None
-rag_chain = None
-
-try:
-    logger.info("Starting chat service initialization...")
-
-    logger.info("Loading embeddings model...")
-    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
-    logger.info("Embeddings loaded successfully")
-
-    logger.info("Initializing ChatOllama...")
-    llm = ChatOllama(model=LLM_MODEL_NAME, base_url=settings.OLLAMA_BASE_URL)
-    logger.info("ChatOllama initialized successfully")
-
-    logger.info("Initializing PGVector connection...")
-    vector_store = PGVector(
-        embeddings=embeddings,
-        connection=settings.DATABASE_URL,
-        collection_name="asset",
-    )
-    logger.info("PGVector connected successfully")
-
-    retriever = vector_store.as_retriever(search_kwargs={"k": VECTOR_SEARCH_TOP_K})
-    logger.info("Retriever created successfully")
-
-    template = """
+RAG_PROMPT_TEMPLATE = """
     You are a helpful Thai real estate assistant.
     Answer the user's question based ONLY on the following context.
     If the information is not in the context, say "I'm sorry, I don't have that information."
@@ -82,34 +70,71 @@ try:
 
     Answer:
     """
-    prompt = PromptTemplate.from_template(template)
-    logger.info("Prompt template created")
-
-    logger.info("Building RAG chain...")
-
-    def extract_question(input_dict):
-        if isinstance(input_dict, dict):
-            return input_dict.get("question", "")
-        return input_dict
-
-    rag_chain = (
-        RunnableParallel(
-            {
-                "context": RunnableLambda(extract_question) | retriever | format_docs,
-                "question": RunnableLambda(extract_question),
-            }
+
+embeddings = None
+llm = None
+retriever = None
+rag_chain = None
+
+
+def init_chat_service() -> None:
+    """Build the RAG chain; on failure `rag_chain` stays None and chat reports unavailable."""
+    global embeddings, llm, retriever, rag_chain
+    if rag_chain is not None:
+        return
+    try:
+        logger.info("Starting chat service initialization...")
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.prompts import PromptTemplate
+        from langchain_core.runnables import RunnableLambda, RunnableParallel
+        from langchain_ollama import ChatOllama
+        from langchain_postgres import PGVector
+
+        embeddings = shared_model_embeddings()
+
+        logger.info("Initializing ChatOllama...")
+        llm = ChatOllama(model=LLM_MODEL_NAME, base_url=settings.OLLAMA_BASE_URL)
+        logger.info("ChatOllama initialized successfully")
+
+        logger.info("Initializing PGVector connection...")
+        vector_store = PGVector(
+            embeddings=embeddings,
+            connection=settings.DATABASE_URL,
+            collection_name="asset",
+        )
+        logger.info("PGVector connected successfully")
+
+        retriever = vector_store.as_retriever(search_kwargs={"k": VECTOR_SEARCH_TOP_K})
+        logger.info("Retriever created successfully")
+
+        prompt = PromptTemplate.from_template(RAG_PROMPT_TEMPLATE)
+        logger.info("Prompt template created")
+
+        logger.info("Building RAG chain...")
+
+        def extract_question(input_dict):
+            if isinstance(input_dict, dict):
+                return input_dict.get("question", "")
+            return input_dict
+
+        rag_chain = (
+            RunnableParallel(
+                {
+                    "context": RunnableLambda(extract_question) | retriever | format_docs,
+                    "question": RunnableLambda(extract_question),
+                }
+            )
+            | prompt
+            | llm
+            | StrOutputParser()
         )
-        | prompt
-        | llm
-        | StrOutputParser()
-    )
 
-    logger.info("RAG chain initialized successfully")
+        logger.info("RAG chain initialized successfully")
 
-except Exception as e:
-    logger.critical(f"CRITICAL ERROR during chat service initialization: {e}")
-    logger.exception("Chat service initialization traceback:")
-    rag_chain = None
+    except Exception as e:
+        logger.critical(f"CRITICAL ERROR during chat service initialization: {e}")
+        logger.exception("Chat service initialization traceback:")
+        rag_chain = None
 
 
 async def get_rag_response(query: str) -> str:
@@ -0,0 +1,139 @@
+"""
+Shared embedding model.
+One SentenceTransformer instance per process, loaded on first use, serves
+every embedding: search queries, ingest, asset writes and the chat retriever.
+Encodes are serialized because the Hugging Face tokenizer must not be used
+from several threads at once; batch texts with `encode_batch` instead.
+The backend is PyTorch by default, or ONNX Runtime (optionally an int8
+quantized export, see `data/export_onnx_embedding.py`) via `embedding_backend`.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from app.core.config import settings
+from app.core.config.constants import EMBEDDING_MODEL_NAME
+from app.core.config.logging import get_logger
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = get_logger(__name__)
+
+_model: SentenceTransformer | None = None
+_model_version: str | None = None
+_load_failed = False
+_load_lock = threading.Lock()
+_encode_lock = threading.Lock()
+
+
+def load_embedding_model(
+    backend: str = "torch",
+    onnx_path: str | None = None,
+    onnx_file: str | None = None,
+    onnx_threads: int | None = None,
+) -> SentenceTransformer:
+    """
+    Load the embedding model on the given backend. `onnx_path` is a directory
+    written by `data/export_onnx_embedding.py` (default: the hub model, exported
+    on the fly), `onnx_file` picks e.g. a quantized file inside it, and
+    `onnx_threads` sets ONNX Runtime's intra-op thread count.
+    The ONNX backend needs `sentence-transformers[onnx]` (optimum + onnxruntime).
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend != "onnx":
+        return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+    model_kwargs: dict[str, Any] = {"provider": "CPUExecutionProvider"}
+    if onnx_file:
+        model_kwargs["file_name"] = onnx_file
+    if onnx_threads:
+        import onnxruntime
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = onnx_threads
+        model_kwargs["session_options"] = session_options
+    return SentenceTransformer(
+        onnx_path or EMBEDDING_MODEL_NAME, backend="onnx", model_kwargs=model_kwargs
+    )
+
+
+def get_embedding_model() -> SentenceTransformer | None:
+    """
+    Return the shared model, loading it on the first call; None if loading failed.
+    An ONNX backend that cannot load falls back to PyTorch.
+    """
+    global _model, _model_version, _load_failed
+    if _model is not None or _load_failed:
+        return _model
+    with _load_lock:
+        if _model is None and not _load_failed:
+            backend = settings.embedding_backend
+            if backend == "onnx":
+                try:
+                    model = load_embedding_model(
+                        "onnx",
+                        settings.embedding_onnx_path,
+                        settings.embedding_onnx_file,
+                        settings.embedding_onnx_threads,
+                    )
+                    # Set before `_model`, which unlocked readers check first.
+                    _model_version = (
+                        f"{settings.embedding_onnx_path or EMBEDDING_MODEL_NAME}:onnx:"
+                        f"{settings.embedding_onnx_file or 'onnx/model.onnx'}"
+                    )
+                    _model = model
+                    logger.info(
+                        f"Loaded ONNX embedding model "
+                        f"{settings.embedding_onnx_path or EMBEDDING_MODEL_NAME} "
+                        f"({settings.embedding_onnx_file or 'onnx/model.onnx'})"
+                    )
+                    return _model
+                except Exception as e:
+                    logger.error(f"Could not load ONNX embedding model, using PyTorch: {e}")
+            try:
+                model = load_embedding_model("torch")
+                _model_version = f"{EMBEDDING_MODEL_NAME}:torch"
+                _model = model
+                logger.info(f"Loaded embedding model {EMBEDDING_MODEL_NAME}")
+            except Exception as e:
+                logger.critical(f"Could not load sentence-transformer model: {e}")
+                _load_failed = True
+    return _model
+
+
+def embedding_model_version() -> str | None:
+    """
+    Identify the loaded model and backend, e.g. for content hashes of stored
+    vectors (a different model or quantization produces different vectors).
+    None when the model is not loaded.
+    """
+    return _model_version if get_embedding_model() is not None else None
+
+
+def require_embedding_model() -> SentenceTransformer:
+    model = get_embedding_model()
+    if model is None:
+        raise RuntimeError("Embedding model is not loaded.")
+    return model
+
+
+def encode(text: str) -> list[float]:
+    """Embed one text; raises RuntimeError when the model is unavailable."""
+    model = require_embedding_model()
+    with _encode_lock:
+        return model.encode(text, show_progress_bar=False).tolist()
+
+
+def encode_batch(texts: Sequence[str]) -> list[list[float]]:
+    """Embed several texts in one model call, in order."""
+    if not texts:
+        return []
+    model = require_embedding_model()
+    with _encode_lock:
+        vectors = model.encode(list(texts), show_progress_bar=False)
+    return [vector.tolist() for vector in vectors]
@@ -0,0 +1,196 @@
+"""
+Micro-batching embedding dispatcher.
+Concurrent requests that each need one embedding (search queries, asset
+writes) enqueue their text and await a future. A single worker collects
+requests until `embedding_batch_max_size` texts are waiting or
+`embedding_batch_max_wait_ms` has passed since the first, runs one
+`encode_batch` off the event loop and resolves every caller's future.
+The queue is bounded: when it is full, callers wait to enqueue.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from app.core.config import settings
+from app.core.config.logging import get_logger
+from app.services.embedding import encode, encode_batch
+
+logger = get_logger(__name__)
+
+# Recent batches kept for the mean and p95 figures in `stats()`.
+METRICS_WINDOW = 1024
+
+
+@dataclass
+class PendingEncode:
+    text: str
+    future: asyncio.Future[list[float]]
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+def percentile(values: deque[float], share: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+class EmbeddingDispatcher:
+    """Batches single-text encode requests from one event loop into model calls."""
+
+    def __init__(self, max_batch_size: int, max_wait_seconds: float, max_queue_size: int) -> None:
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        self.max_queue_size = max(1, max_queue_size)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[PendingEncode] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._batch: list[PendingEncode] = []
+        self.batches = 0
+        self.items = 0
+        self.max_batch_seen = 0
+        self.max_wait_ms_seen = 0.0
+        self._batch_sizes: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._waits_ms: deque[float] = deque(maxlen=METRICS_WINDOW)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> asyncio.Queue[PendingEncode]:
+        """Start the worker on the running event loop if needed; returns its queue."""
+        if self.running and self._queue is not None:
+            return self._queue
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[PendingEncode] = asyncio.Queue(maxsize=self.max_queue_size)
+        self._loop, self._queue = loop, queue
+        self._worker = loop.create_task(self._run(queue, loop), name="embedding-dispatcher")
+        return queue
+
+    async def stop(self) -> None:
+        """Stop the worker and fail requests that were still waiting."""
+        worker, queue = self._worker, self._queue
+        self._worker = None
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        stopped = RuntimeError("Embedding dispatcher stopped.")
+        for item in self._batch:
+            if not item.future.done():
+                item.future.set_exception(stopped)
+        self._batch = []
+        while queue is not None and not queue.empty():
+            item = queue.get_nowait()
+            if not item.future.done():
+                item.future.set_exception(stopped)
+
+    async def encode(self, text: str) -> list[float]:
+        """Embed one text as part of the next batch; raises RuntimeError without a model."""
+        queue = self.start()
+        item = PendingEncode(text, asyncio.get_running_loop().create_future())
+        await queue.put(item)
+        return await item.future
+
+    def encode_from_thread(self, text: str) -> list[float]:
+        """
+        Blocking form of `encode` for sync route handlers running in worker threads.
+        Encodes directly when the dispatcher is not running (scripts, tests).
+        """
+        loop = self._loop
+        if not self.running or loop is None or loop.is_closed():
+            return encode(text)
+        try:
+            if asyncio.get_running_loop() is loop:
+                return encode(text)
+        except RuntimeError:
+            pass
+        return asyncio.run_coroutine_threadsafe(self.encode(text), loop).result()
+
+    def stats(self) -> dict[str, float | int]:
+        """Batch size and queue wait (enqueue to encode start, including backpressure)."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_size": self.max_queue_size,
+            "mean_batch_size": round(statistics.fmean(self._batch_sizes), 2)
+            if self._batch_sizes
+            else 0.0,
+            "max_batch_size": self.max_batch_seen,
+            "mean_queue_wait_ms": round(statistics.fmean(self._waits_ms), 2)
+            if self._waits_ms
+            else 0.0,
+            "p95_queue_wait_ms": round(percentile(self._waits_ms, 0.95), 2),
+            "max_queue_wait_ms": round(self.max_wait_ms_seen, 2),
+        }
+
+    async def _run(
+        self, queue: asyncio.Queue[PendingEncode], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        while True:
+            self._batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(self._batch) < self.max_batch_size:
+                if not queue.empty():
+                    self._batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                getter = asyncio.ensure_future(queue.get())
+                try:
+                    done, _ = await asyncio.wait({getter}, timeout=remaining)
+                finally:
+                    # A cancelled get leaves its item in the queue for the next batch.
+                    getter.cancel()
+                if not done:
+                    break
+                self._batch.append(getter.result())
+            await self._dispatch(self._batch)
+            self._batch = []
+
+    async def _dispatch(self, batch: list[PendingEncode]) -> None:
+        # Callers that gave up (cancelled futures) are not encoded.
+        pending = [item for item in batch if not item.future.done()]
+        if not pending:
+            return
+        started = time.perf_counter()
+        self.record(len(pending), [(started - item.enqueued_at) * 1000 for item in pending])
+
+        texts = list(dict.fromkeys(item.text for item in pending))
+        try:
+            vectors = dict(zip(texts, await asyncio.to_thread(encode_batch, texts)))
+        except Exception as e:
+            logger.error(f"Batched encode of {len(texts)} texts failed: {e}")
+            for item in pending:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        for item in pending:
+            if not item.future.done():
+                item.future.set_result(vectors[item.text])
+        logger.debug(
+            f"Encoded batch of {len(pending)} requests ({len(texts)} texts) in "
+            f"{round((time.perf_counter() - started) * 1000, 2)} ms"
+        )
+
+    def record(self, batch_size: int, waits_ms: list[float]) -> None:
+        self.batches += 1
+        self.items += batch_size
+        self.max_batch_seen = max(self.max_batch_seen, batch_size)
+        self.max_wait_ms_seen = max(self.max_wait_ms_seen, *waits_ms)
+        self._batch_sizes.append(batch_size)
+        self._waits_ms.extend(waits_ms)
+
+
+embedding_dispatcher = EmbeddingDispatcher(
+    max_batch_size=settings.embedding_batch_max_size,
+    max_wait_seconds=settings.embedding_batch_max_wait_ms / 1000,
+    max_queue_size=settings.embedding_batch_queue_size,
+)
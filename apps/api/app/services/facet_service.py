@@ -0,0 +1,164 @@
+"""
+Search facet service.
+Counts the assets a search would rank by price bucket, bedrooms and asset
+type in a single GROUPING SETS query over the same WHERE clause as
+`hybrid_search`. Results are cached per catalog version, so ingests and asset
+writes refresh them.
+"""
+
+import json
+from typing import Any
+
+from sqlalchemy.sql import text
+from sqlmodel import Session
+
+from app.core.cache import LRUCache, normalize_text_key
+from app.core.config import settings
+from app.core.config.constants import FACET_PRICE_EDGES
+from app.core.config.logging import get_logger
+from app.schemas.search import (
+    AssetTypeCountSchema,
+    BedroomCountSchema,
+    PriceBucketSchema,
+    SearchFacetsRequestSchema,
+    SearchFacetsResponseSchema,
+)
+from app.services.catalog_version import current_catalog_version
+from app.services.parser_service import parse_query_to_json
+from app.services.search_service import (
+    SEARCH_FROM_CLAUSE,
+    coerce_parsed_query,
+    is_browse_request,
+    resolve_location,
+    search_where_clause,
+)
+
+logger = get_logger(__name__)
+
+# GROUPING() bitmask of (price_bucket, bedrooms, asset_type_id): set bits are rolled up.
+GROUPING_PRICE = 0b011
+GROUPING_BEDROOMS = 0b101
+GROUPING_ASSET_TYPE = 0b110
+GROUPING_TOTAL = 0b111
+
+facet_cache: LRUCache[SearchFacetsResponseSchema] = LRUCache(
+    maxsize=settings.search_facet_cache_size,
+    ttl_seconds=settings.search_facet_cache_ttl_seconds,
+)
+
+
+def facet_cache_key(request: SearchFacetsRequestSchema, version: int) -> str:
+    """Key a facet request by catalog version and its normalized, order-independent fields."""
+    payload = request.model_dump(mode="json")
+    payload["query_text"] = normalize_text_key(request.query_text)
+    if request.filters.asset_type_id:
+        payload["filters"]["asset_type_id"] = sorted(set(request.filters.asset_type_id))
+    return f"{version}:{json.dumps(payload, sort_keys=True, ensure_ascii=False)}"
+
+
+def facets_query(from_where: str) -> str:
+    return f"""
+        WITH matched AS (
+            SELECT
+                width_bucket(assets.price, CAST(:price_edges AS numeric[])) AS price_bucket,
+                assets.price,
+                assets.bedrooms,
+                assets.asset_type_id,
+                assettype.name_th AS asset_type_name_th,
+                assettype.name_en AS asset_type_name_en
+            {from_where}
+        )
+        SELECT
+            GROUPING(price_bucket, bedrooms, asset_type_id) AS grouping_id,
+            price_bucket,
+            bedrooms,
+            asset_type_id,
+            MIN(asset_type_name_th) AS asset_type_name_th,
+            MIN(asset_type_name_en) AS asset_type_name_en,
+            COUNT(*) AS asset_count,
+            MIN(price) AS price_min,
+            MAX(price) AS price_max
+        FROM matched
+        GROUP BY GROUPING SETS ((price_bucket), (bedrooms), (asset_type_id), ())
+    """
+
+
+def price_bucket_bounds(bucket: int) -> tuple[int | None, int | None]:
+    """Edges of a `width_bucket` bucket: 0 is below the first edge, len(edges) is open-ended."""
+    price_from = FACET_PRICE_EDGES[bucket - 1] if bucket > 0 else None
+    price_to = FACET_PRICE_EDGES[bucket] if bucket < len(FACET_PRICE_EDGES) else None
+    return price_from, price_to
+
+
+def build_facets_response(rows: list[Any]) -> SearchFacetsResponseSchema:
+    """Split GROUPING SETS rows into the histogram and count lists; null values are left out."""
+    response = SearchFacetsResponseSchema(
+        total_count=0, price_histogram=[], bedrooms=[], asset_types=[]
+    )
+    for row in rows:
+        grouping_id = row.grouping_id
+        if grouping_id == GROUPING_TOTAL:
+            response.total_count = row.asset_count
+            response.price_min = float(row.price_min) if row.price_min is not None else None
+            response.price_max = float(row.price_max) if row.price_max is not None else None
+        elif grouping_id == GROUPING_PRICE and row.price_bucket is not None:
+            price_from, price_to = price_bucket_bounds(row.price_bucket)
+            response.price_histogram.append(
+                PriceBucketSchema(price_from=price_from, price_to=price_to, count=row.asset_count)
+            )
+        elif grouping_id == GROUPING_BEDROOMS and row.bedrooms is not None:
+            response.bedrooms.append(
+                BedroomCountSchema(bedrooms=row.bedrooms, count=row.asset_count)
+            )
+        elif grouping_id == GROUPING_ASSET_TYPE and row.asset_type_id is not None:
+            response.asset_types.append(
+                AssetTypeCountSchema(
+                    asset_type_id=row.asset_type_id,
+                    name_th=row.asset_type_name_th,
+                    name_en=row.asset_type_name_en,
+                    count=row.asset_count,
+                )
+            )
+
+    response.price_histogram.sort(key=lambda bucket: bucket.price_from or 0)
+    response.bedrooms.sort(key=lambda count: count.bedrooms)
+    response.asset_types.sort(key=lambda count: (-count.count, count.asset_type_id))
+    return response
+
+
+async def search_facets(
+    request: SearchFacetsRequestSchema, db: Session
+) -> SearchFacetsResponseSchema:
+    """
+    Facet counts for the assets `hybrid_search` would rank for the same query
+    text and filters. The query is parsed and geocoded as in search (parsed
+    bedrooms and location narrow the set), but no embedding is needed.
+    Requests without query text or filters count the whole catalog.
+    """
+    cache_key = facet_cache_key(request, current_catalog_version())
+    cached = facet_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Facet cache hit; stats={facet_cache.stats()}")
+        return cached
+
+    if is_browse_request(request):
+        from_where = SEARCH_FROM_CLAUSE
+        params: dict[str, Any] = {}
+    else:
+        query_text = request.query_text
+        parsed_query = coerce_parsed_query(
+            await parse_query_to_json(query_text) if query_text.strip() else None, query_text
+        )
+        raw_parsed_filters = parsed_query.get("filters")
+        parsed_filters: dict[str, Any] = (
+            raw_parsed_filters if isinstance(raw_parsed_filters, dict) else {}
+        )
+        location_coords = await resolve_location(parsed_query, query_text)
+        where_string, params = search_where_clause(request.filters, parsed_filters, location_coords)
+        from_where = f"{SEARCH_FROM_CLAUSE} {where_string}"
+
+    params["price_edges"] = list(FACET_PRICE_EDGES)
+    rows = db.exec(text(facets_query(from_where)).bindparams(**params)).fetchall()
+    response = build_facets_response(rows)
+    facet_cache.set(cache_key, response)
+    return response
@@ -0,0 +1,241 @@
+"""
+Geocoding service.
+Resolves location names against an offline Thai gazetteer (districts,
+subdistricts, BTS/MRT/ARL stations, landmarks, provinces) and only falls back
+to Nominatim, off the event loop and cached, when the gazetteer has no match.
+Fuzzy matching only scores names that share a trigram with the query.
+"""
+
+import asyncio
+import difflib
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.config.constants import GEOCODER_TIMEOUT_SECONDS
+from app.core.config.logging import get_logger
+
+if TYPE_CHECKING:
+    from geopy.geocoders import Nominatim
+
+logger = get_logger(__name__)
+
+GAZETTEER_PATH = Path(__file__).resolve().parents[2] / "data" / "gazetteer_th.json"
+
+# Administrative / transit prefixes that users add or omit freely.
+PREFIX_PATTERN = re.compile(
+    r"^(?:เขต|แขวง|อำเภอ|อ\.|ตำบล|ต\.|จังหวัด|จ\.|สถานี|ถนน|ถ\.|bts|mrt|arl)\s*"
+)
+SUFFIX_PATTERN = re.compile(r"\s+(?:district|station|road|province)$")
+THAI_CHAR_PATTERN = re.compile(r"[\u0e00-\u0e7f]")
+# Thai vowel and tone marks are not \w, so keep the whole Thai block.
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s\u0e00-\u0e7f]")
+
+# Shorter keys produce too many accidental substring hits inside longer queries.
+MIN_CONTAINED_KEY_LENGTH = 4
+MAX_NGRAM_TOKENS = 4
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    """A named place with its representative coordinates."""
+
+    name_th: str
+    name_en: str
+    kind: str
+    latitude: float
+    longitude: float
+
+    @property
+    def coords(self) -> tuple[float, float]:
+        return (self.latitude, self.longitude)
+
+
+def normalize_place_name(value: str) -> str:
+    """Casefold, drop punctuation and common prefixes/suffixes, collapse whitespace."""
+    value = value.casefold().replace(".", ". ")
+    value = PREFIX_PATTERN.sub("", value.strip())
+    value = PUNCTUATION_PATTERN.sub(" ", value)
+    value = " ".join(value.split())
+    value = PREFIX_PATTERN.sub("", value)
+    return SUFFIX_PATTERN.sub("", value)
+
+
+def compact(value: str) -> str:
+    """Remove all whitespace; Thai text does not separate words with spaces."""
+    return "".join(value.split())
+
+
+def load_gazetteer(path: Path = GAZETTEER_PATH) -> dict[str, GazetteerEntry]:
+    """Load the gazetteer file into a map of compact normalized name -> entry."""
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            rows = json.load(file)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load gazetteer from {path}: {e}")
+        return {}
+
+    index: dict[str, GazetteerEntry] = {}
+    for row in rows:
+        entry = GazetteerEntry(
+            name_th=row["name_th"],
+            name_en=row["name_en"],
+            kind=row.get("kind", "area"),
+            latitude=float(row["latitude"]),
+            longitude=float(row["longitude"]),
+        )
+        for name in [entry.name_th, entry.name_en, *row.get("aliases", [])]:
+            key = compact(normalize_place_name(name))
+            # First entry wins so districts take precedence over same-named stations.
+            if key and key not in index:
+                index[key] = entry
+    logger.info(f"Loaded gazetteer with {len(index)} names from {path.name}")
+    return index
+
+
+def trigrams(key: str) -> set[str]:
+    """Character trigrams of a key, padded so short keys still produce some."""
+    padded = f" {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def build_trigram_index(keys: list[str]) -> dict[str, list[str]]:
+    """Map of trigram -> gazetteer keys containing it, for fuzzy candidate lookup."""
+    index: dict[str, list[str]] = defaultdict(list)
+    for key in keys:
+        for gram in trigrams(key):
+            index[gram].append(key)
+    return dict(index)
+
+
+gazetteer = load_gazetteer()
+gazetteer_keys = list(gazetteer)
+# Thai names long enough to be matched as substrings of unspaced query text.
+contained_thai_keys = [
+    key
+    for key in gazetteer_keys
+    if len(key) >= MIN_CONTAINED_KEY_LENGTH and THAI_CHAR_PATTERN.search(key)
+]
+gazetteer_trigrams = build_trigram_index(gazetteer_keys)
+
+
+@cache
+def get_geolocator() -> "Nominatim":
+    """Nominatim client, created (and geopy imported) on the first fallback lookup."""
+    from geopy.geocoders import Nominatim
+
+    return Nominatim(user_agent="proptech-ai-backend", timeout=GEOCODER_TIMEOUT_SECONDS)
+
+
+# Nominatim results (including misses) keyed by normalized location text.
+geocode_cache: LRUCache[tuple[float, float] | None] = LRUCache(
+    maxsize=settings.geocode_cache_size,
+    ttl_seconds=settings.geocode_cache_ttl_seconds,
+)
+
+_NOT_CACHED = object()
+
+
+def match_gazetteer(location_text: str) -> tuple[str, GazetteerEntry] | None:
+    """
+    Match location text against the gazetteer: exact name, then the longest
+    known name contained in the text, then a fuzzy match on the whole text.
+    Returns the matched gazetteer key (compact normalized name) and its entry.
+    """
+    normalized = normalize_place_name(location_text)
+    key = compact(normalized)
+    if not key:
+        return None
+
+    entry = gazetteer.get(key)
+    if entry:
+        return key, entry
+
+    # Thai names can sit anywhere inside the unspaced text; Latin names must
+    # line up with whole words, so compare them against token n-grams instead.
+    tokens = normalized.split()
+    contained = [name for name in contained_thai_keys if name in key]
+    contained += [
+        ngram
+        for start in range(len(tokens))
+        for end in range(start + 1, min(start + MAX_NGRAM_TOKENS, len(tokens)) + 1)
+        if (ngram := "".join(tokens[start:end])) in gazetteer
+        and len(ngram) >= MIN_CONTAINED_KEY_LENGTH
+    ]
+    if contained:
+        longest = max(contained, key=len)
+        return longest, gazetteer[longest]
+
+    close = fuzzy_gazetteer_key(key)
+    if close:
+        return close, gazetteer[close]
+    return None
+
+
+def fuzzy_gazetteer_key(key: str) -> str | None:
+    """
+    Closest gazetteer key to a compact normalized text within the fuzzy cutoff.
+    Names that similar share trigrams with the text, so only those are scored.
+    """
+    candidates = {name for gram in trigrams(key) for name in gazetteer_trigrams.get(gram, ())}
+    close = difflib.get_close_matches(
+        key, list(candidates), n=1, cutoff=settings.gazetteer_fuzzy_cutoff
+    )
+    return close[0] if close else None
+
+
+def lookup_gazetteer(location_text: str) -> GazetteerEntry | None:
+    """Gazetteer entry for location text (see `match_gazetteer`), if any."""
+    match = match_gazetteer(location_text)
+    return match[1] if match else None
+
+
+def nominatim_geocode(location_text: str) -> tuple[float, float] | None:
+    """Blocking Nominatim lookup for (lat, lon); run it via a worker thread."""
+    search_query = f"{location_text}, Thailand"
+    logger.debug(f"Geocoding with Nominatim: {search_query}")
+    location = get_geolocator().geocode(search_query)
+    if location:
+        return (location.latitude, location.longitude)
+    return None
+
+
+async def get_coords(location_text: str) -> tuple[float, float] | None:
+    """Resolve a location name to (lat, lon) using the gazetteer, then cached Nominatim."""
+    entry = lookup_gazetteer(location_text)
+    if entry:
+        logger.info(f"Gazetteer matched '{location_text}' to {entry.name_en} {entry.coords}")
+        return entry.coords
+
+    if not settings.geocoder_nominatim_fallback:
+        return None
+
+    cache_key = compact(normalize_place_name(location_text))
+    cached = geocode_cache.get(cache_key, _NOT_CACHED)
+    if cached is not _NOT_CACHED:
+        return cached
+
+    from geopy.exc import GeocoderUnavailable
+
+    try:
+        coords = await asyncio.to_thread(nominatim_geocode, location_text)
+    except GeocoderUnavailable:
+        logger.warning("Geocoder service is unavailable.")
+        return None
+    except Exception as e:
+        logger.error(f"Error geocoding '{location_text}': {e}")
+        return None
+
+    # Misses are cached too so unknown names do not hit the public rate limit again.
+    geocode_cache.set(cache_key, coords)
+    if coords:
+        logger.info(f"Geocoded '{location_text}' to {coords}")
+    else:
+        logger.warning(f"Geocoding failed for: {location_text}")
+    return coords
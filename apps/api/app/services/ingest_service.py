@@ -2,28 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from collections.abc import Iterable
 from pathlib import Path
 
-from sentence_transformers import SentenceTransformer
+from geoalchemy2.elements import WKTElement
 from sqlalchemy.sql import text
 from sqlmodel import Session
 
 from app.core.config.constants import INGESTION_BATCH_SIZE
 from app.core.config.logging import get_logger
 from app.models.asset import Asset, AssetType
+from app.services.catalog_version import bump_catalog_version
+from app.services.embedding import embedding_model_version, encode, get_embedding_model
+from app.services.embedding_dispatcher import embedding_dispatcher
+from app.services.projection import project_vector
 
 logger = get_logger(__name__)
 
-MODEL_NAME = "paraphrase-multilingual-mpnet-base-v2"
-
-try:
-    embedding_model = SentenceTransformer(MODEL_NAME)
-except Exception as exc:  # pragma: no cover - startup failure path
-    logger.critical("Failed to load embedding model %s: %s", MODEL_NAME, exc)
-    embedding_model = None
-
 
 def load_json_file(path: Path) -> list[dict[str, object]]:
     """Load JSON file containing a list of dicts."""
@@ -36,12 +33,45 @@ def load_json_file(path: Path) -> list[dict[str, object]]:
     return data
 
 
-def embed_record(doc: str) -> list[float] | None:
-    """Encode text into a vector if the model is available."""
-    if embedding_model is None:
+def embed_record(doc: str, batched: bool = False) -> list[float] | None:
+    """
+    Encode text into a vector if the model is available. With `batched`, the
+    encode joins concurrent requests in the embedding dispatcher (for request
+    handlers; bulk ingest encodes directly rather than waiting on batch windows).
+    """
+    if get_embedding_model() is None:
         logger.error("Embedding model is not loaded; skipping vector generation.")
         return None
-    return embedding_model.encode(doc, show_progress_bar=False).tolist()
+    if batched:
+        return embedding_dispatcher.encode_from_thread(doc)
+    return encode(doc)
+
+
+def embedding_hash(doc: str, model_version: str) -> str:
+    """Content hash of an embedding input: the model version and the `build_doc` text."""
+    return hashlib.sha256(f"{model_version}\n{doc}".encode()).hexdigest()
+
+
+def embed_if_changed(
+    doc: str, asset: Asset | None, batched: bool = False
+) -> tuple[list[float] | None, str | None, bool]:
+    """
+    Return (vector, embedding_hash, encoded) for `doc`. The asset's stored vector
+    is reused without encoding when its `embedding_hash` matches; vector and
+    hash are None if the model is not loaded.
+    """
+    model_version = embedding_model_version()
+    if model_version is None:
+        logger.error("Embedding model is not loaded; skipping vector generation.")
+        return None, None, False
+    content_hash = embedding_hash(doc, model_version)
+    if (
+        asset is not None
+        and asset.asset_vector is not None
+        and asset.embedding_hash == content_hash
+    ):
+        return asset.asset_vector, content_hash, False
+    return embed_record(doc, batched), content_hash, True
 
 
 def build_doc(record: dict[str, object]) -> str:
@@ -53,6 +83,17 @@ def build_doc(record: dict[str, object]) -> str:
     return f"TH: {name_th} {desc_th} EN: {name_en} {desc_en}"
 
 
+def build_search_document(record: dict[str, object]) -> str:
+    """Create the lexical search text (names and descriptions) indexed with pg_trgm."""
+    parts = [
+        record.get("name_th"),
+        record.get("name_en"),
+        record.get("asset_details_description_th") or record.get("description_th"),
+        record.get("asset_details_description_en") or record.get("description_en"),
+    ]
+    return " ".join(str(part) for part in parts if part)
+
+
 def to_int(value: object) -> int | None:
     if value is None:
         return None
@@ -71,6 +112,22 @@ def to_float(value: object) -> float | None:
         return None
 
 
+def apply_location(asset: Asset) -> None:
+    """Sync the PostGIS geometry and geography columns with the asset's lat/lon."""
+    if asset.location_latitude is None or asset.location_longitude is None:
+        asset.location_geom = None
+        asset.location_geog = None
+        return
+    point = f"POINT({asset.location_longitude} {asset.location_latitude})"
+    asset.location_geom = WKTElement(point, srid=4326)
+    asset.location_geog = WKTElement(point, srid=4326)
+
+
+def apply_projection(asset: Asset) -> None:
+    """Sync the reduced (PCA-projected) vector with the asset's full vector."""
+    asset.asset_vector_reduced = project_vector(asset.asset_vector)
+
+
 def upsert_asset_types(rows: Iterable[dict[str, object]], session: Session) -> int:
     """Insert or ignore asset types by id."""
     inserted = 0
@@ -95,9 +152,14 @@ def upsert_asset_types(rows: Iterable[dict[str, object]], session: Session) -> i
 
 def upsert_assets(
     rows: Iterable[dict[str, object]], session: Session, *, embed: bool = True
-) -> int:
-    """Insert or update assets; compute vectors and update geom later."""
+) -> dict[str, int]:
+    """
+    Insert or update assets; compute vectors and update geom later. Rows whose
+    embedding text is unchanged keep their vector without being re-encoded.
+    """
     processed = 0
+    encoded = 0
+    skipped = 0
     for idx, row in enumerate(rows, start=1):
         asset_id = row.get("id")
         existing = session.get(Asset, asset_id) if asset_id is not None else None
@@ -107,7 +169,14 @@ def upsert_assets(
         bathrooms = to_int(row.get("asset_details_number_of_bathrooms") or row.get("bathrooms"))
 
         doc = build_doc(row)
-        vector = embed_record(doc) if embed else existing.asset_vector if existing else None
+        if embed:
+            vector, content_hash, was_encoded = embed_if_changed(doc, existing)
+            encoded += was_encoded
+            skipped += not was_encoded and vector is not None
+        elif existing:
+            vector, content_hash = existing.asset_vector, existing.embedding_hash
+        else:
+            vector, content_hash = None, None
 
         payload = {
             "asset_code": str(row.get("asset_code") or ""),
@@ -123,13 +192,20 @@ def upsert_assets(
             "location_longitude": to_float(row.get("location_longitude")),
             "images_main_id": to_int(row.get("images_main_id")),
             "asset_vector": vector,
+            "embedding_hash": content_hash,
+            "search_document": build_search_document(row),
         }
 
         if existing:
             for key, value in payload.items():
                 setattr(existing, key, value)
+            apply_location(existing)
+            apply_projection(existing)
         else:
-            session.add(Asset(id=asset_id, **payload))
+            asset = Asset(id=asset_id, **payload)
+            apply_location(asset)
+            apply_projection(asset)
+            session.add(asset)
 
         processed += 1
 
@@ -138,21 +214,30 @@ def upsert_assets(
             logger.info("Committed %s assets...", idx)
 
     session.commit()
-    return processed
+    if embed:
+        logger.info("Encoded %s assets; skipped %s with unchanged embedding text", encoded, skipped)
+    return {
+        "assets_processed": processed,
+        "assets_encoded": encoded,
+        "encodes_skipped": skipped,
+    }
 
 
 def update_geometry(session: Session) -> None:
-    """Populate PostGIS geometry column from lat/lon."""
+    """Populate PostGIS geometry and geography columns from lat/lon where missing."""
     session.execute(
         text(
             """
             UPDATE asset
             SET location_geom = ST_SetSRID(
-                ST_MakePoint(location_longitude, location_latitude), 4326
-            )
+                    ST_MakePoint(location_longitude, location_latitude), 4326
+                ),
+                location_geog = ST_SetSRID(
+                    ST_MakePoint(location_longitude, location_latitude), 4326
+                )::geography
             WHERE location_longitude IS NOT NULL
               AND location_latitude IS NOT NULL
-              AND location_geom IS NULL;
+              AND (location_geom IS NULL OR location_geog IS NULL);
             """
         )
     )
@@ -173,10 +258,11 @@ def ingest_from_payload(
     assets_data = assets or load_json_file(base_dir / "assets_rows.json")
 
     inserted_types = upsert_asset_types(types_data, session)
-    processed_assets = upsert_assets(assets_data, session, embed=embed)
+    asset_counts = upsert_assets(assets_data, session, embed=embed)
     update_geometry(session)
+    bump_catalog_version()
 
     return {
         "asset_types_inserted": inserted_types,
-        "assets_processed": processed_assets,
+        **asset_counts,
     }
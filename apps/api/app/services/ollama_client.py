@@ -0,0 +1,81 @@
+"""
+Shared Ollama HTTP client.
+One pooled `httpx.AsyncClient` (opened and closed by the app lifespan) keeps
+connections to Ollama alive across requests, and a circuit breaker makes
+callers fall back immediately while Ollama is down or timing out.
+"""
+
+from typing import Any
+
+import httpx
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.core.config.constants import OLLAMA_CONNECT_TIMEOUT_SECONDS, OLLAMA_TIMEOUT_SECONDS
+from app.core.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+ollama_breaker = CircuitBreaker(
+    failure_threshold=settings.ollama_circuit_failure_threshold,
+    reset_seconds=settings.ollama_circuit_reset_seconds,
+)
+
+_client: httpx.AsyncClient | None = None
+
+
+class OllamaUnavailableError(Exception):
+    """Raised instead of calling Ollama while its circuit is open."""
+
+
+def start_ollama_client() -> httpx.AsyncClient:
+    """Create the shared client if needed; scripts without the app lifespan get one lazily."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=settings.OLLAMA_BASE_URL,
+            timeout=httpx.Timeout(OLLAMA_TIMEOUT_SECONDS, connect=OLLAMA_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=settings.ollama_max_connections,
+                max_keepalive_connections=settings.ollama_max_connections,
+            ),
+        )
+    return _client
+
+
+async def close_ollama_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def ollama_post(path: str, body: dict[str, Any]) -> httpx.Response:
+    """
+    POST to Ollama through the shared client and circuit breaker.
+    Raises OllamaUnavailableError without a network call while the circuit is
+    open, and httpx errors for transport failures and error statuses.
+    """
+    if not ollama_breaker.allow():
+        raise OllamaUnavailableError(f"Ollama circuit is open ({ollama_breaker.failures} failures)")
+
+    try:
+        response = await start_ollama_client().post(path, json=body)
+        response.raise_for_status()
+    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+        # 4xx means Ollama answered (e.g. unknown model); only count outages.
+        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+            ollama_breaker.record_success()
+        else:
+            ollama_breaker.record_failure()
+            if ollama_breaker.state != "closed":
+                logger.warning(
+                    f"Ollama circuit opened after {ollama_breaker.failures} failures; "
+                    f"retrying in {ollama_breaker.reset_seconds}s"
+                )
+        raise
+    except BaseException:
+        ollama_breaker.release()
+        raise
+    ollama_breaker.record_success()
+    return response
@@ -0,0 +1,39 @@
+"""
+Keyset (cursor) pagination helpers.
+Cursors are opaque URL-safe tokens carrying the sort key of the last row
+served, so the next page starts after it instead of skipping OFFSET rows.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+def encode_cursor(kind: str, key: list[Any]) -> str:
+    """Encode the last row's sort key for the given listing kind."""
+    payload = json.dumps({"k": kind, "v": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(kind: str, token: str, size: int) -> list[Any]:
+    """
+    Decode a cursor produced by `encode_cursor` for the same listing kind.
+    Raises ValueError when the token is malformed or belongs to another listing.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    if not isinstance(payload, dict) or payload.get("k") != kind:
+        raise ValueError("Pagination cursor does not match this listing")
+    key = payload.get("v")
+    if (
+        not isinstance(key, list)
+        or len(key) != size
+        or not all(isinstance(value, int | float) for value in key)
+    ):
+        raise ValueError("Invalid pagination cursor")
+    return key
@@ -1,20 +1,24 @@
 """
 Query parsing service using Ollama LLM.
-Parses natural language queries into structured search parameters.
+Parses natural language queries into structured search parameters, with a
+rule-based fast path for simple queries.
 """
 
+import asyncio
 import json
 from typing import Any
 
 import httpx
 
+from app.core.cache import LRUCache, SQLiteCacheStore, normalize_text_key
 from app.core.config import settings
 from app.core.config.logging import get_logger
+from app.services.ollama_client import OllamaUnavailableError, ollama_post
+from app.services.rule_parser import parse_rules
 
 logger = get_logger(__name__)
 
 OLLAMA_MODEL = "gemma3:4b"
-OLLAMA_URL = settings.OLLAMA_BASE_URL
 
 PARSER_PROMPT_TEMPLATE = (
     "You are a JSON-only API for a real estate search engine. "
@@ -41,10 +45,91 @@ PARSER_PROMPT_TEMPLATE = (
 )
 
 
+# Parsed queries keyed by normalized query text. The optional disk store is
+# consulted on memory misses and keeps results across restarts and workers.
+parse_cache: LRUCache[dict[str, Any]] = LRUCache(
+    maxsize=settings.parser_cache_size,
+    ttl_seconds=settings.parser_cache_ttl_seconds,
+)
+
+parse_cache_store: SQLiteCacheStore | None = None
+if settings.parser_cache_path:
+    try:
+        parse_cache_store = SQLiteCacheStore(
+            settings.parser_cache_path,
+            table="parsed_query",
+            ttl_seconds=settings.parser_cache_ttl_seconds,
+        )
+    except Exception as e:
+        logger.error(f"Could not open parser cache at {settings.parser_cache_path}: {e}")
+
+
+async def get_cached_parse(cache_key: str) -> dict[str, Any] | None:
+    """Look up a parsed query in memory, then in the persistent store (off the event loop)."""
+    cached = parse_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    if parse_cache_store is None:
+        return None
+    try:
+        stored = await asyncio.to_thread(parse_cache_store.get, cache_key)
+    except Exception as e:
+        logger.warning(f"Parser cache read failed: {e}")
+        return None
+    if isinstance(stored, dict):
+        parse_cache.set(cache_key, stored)
+        return stored
+    return None
+
+
+async def store_parse(cache_key: str, parsed: dict[str, Any]) -> None:
+    """Remember a successful LLM parse in memory and, if configured, on disk."""
+    parse_cache.set(cache_key, parsed)
+    if parse_cache_store is None:
+        return
+    try:
+        await asyncio.to_thread(parse_cache_store.set, cache_key, parsed)
+    except Exception as e:
+        logger.warning(f"Parser cache write failed: {e}")
+
+
+def copy_parse(parsed: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached parse so callers can mutate it without touching the cache."""
+    filters = parsed.get("filters")
+    return {**parsed, "filters": dict(filters) if isinstance(filters, dict) else {}}
+
+
 async def parse_query_to_json(query_text: str) -> dict[str, Any]:
+    """
+    Returns the structured parse of the user's query text. Repeat queries come
+    from the parse cache; simple queries the rule parser fully explains skip
+    the LLM; everything else calls Ollama, falling back to the rule parse.
+    Fallback responses are not cached so a recovered Ollama is used next time.
+    """
+    cache_key = normalize_text_key(query_text)
+    cached = await get_cached_parse(cache_key)
+    if cached is not None:
+        logger.debug(f"Parser cache hit for: {query_text[:50]}")
+        return copy_parse(cached)
+
+    rule_parse = parse_rules(query_text)
+    if rule_parse.confidence >= settings.rule_parser_min_confidence:
+        logger.debug(f"Rule parser confidence {rule_parse.confidence}; skipping LLM")
+        return rule_parse.parsed
+
+    parsed = await request_ollama_parse(query_text)
+    if parsed is None:
+        return rule_parse.parsed
+
+    await store_parse(cache_key, parsed)
+    return copy_parse(parsed)
+
+
+async def request_ollama_parse(query_text: str) -> dict[str, Any] | None:
     """
     Calls the Ollama server to parse the user's query text into a
-    structured JSON object. Includes robust error handling and defaults.
+    structured JSON object. Returns None when Ollama is unavailable (or its
+    circuit is open) or its response cannot be parsed.
     """
     default_response: dict[str, Any] = {
         "semantic_query": query_text,
@@ -62,39 +147,26 @@ async def parse_query_to_json(query_text: str) -> dict[str, Any]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                await client.get(OLLAMA_URL)
-            except httpx.RequestError:
-                logger.warning(f"Ollama is NOT running at {OLLAMA_URL}. Using fallback.")
-                return default_response
-
-            response = await client.post(
-                f"{OLLAMA_URL}/api/generate",
-                json=request_body,
-            )
-            response.raise_for_status()
-
-            ollama_response = response.json()
-            json_string = ollama_response.get("response", "{}")
-
-            try:
-                parsed_data = json.loads(json_string)
-            except json.JSONDecodeError as e:
-                logger.error(
-                    f"Error parsing Ollama JSON response: {e}. "
-                    f"Response: {json_string[:200]}"
-                )
-                return default_response
-
-            final_data = default_response.copy()
-            final_data.update({k: v for k, v in parsed_data.items() if v is not None})
-
-            return final_data
-
-    except httpx.RequestError as e:
-        logger.error(f"Error calling Ollama parser (RequestError): {e}")
-        return default_response
-    except Exception as e:
-        logger.error(f"Unexpected error in Ollama parser: {type(e).__name__}: {e}")
-        return default_response
+        response = await ollama_post("/api/generate", request_body)
+    except OllamaUnavailableError:
+        logger.debug("Ollama circuit is open. Using fallback.")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"Error calling Ollama parser ({type(e).__name__}): {e}")
+        return None
+
+    try:
+        ollama_response = response.json()
+        json_string = ollama_response.get("response", "{}")
+        parsed_data = json.loads(json_string)
+    except (ValueError, AttributeError) as e:
+        logger.error(f"Error parsing Ollama JSON response: {e}. Response: {response.text[:200]}")
+        return None
+
+    if not isinstance(parsed_data, dict):
+        logger.error(f"Ollama returned non-object JSON: {json_string[:200]}")
+        return None
+
+    final_data = default_response.copy()
+    final_data.update({k: v for k, v in parsed_data.items() if v is not None})
+    return final_data
@@ -0,0 +1,81 @@
+"""
+Learned embedding projection.
+A PCA basis fitted on catalog embeddings (`data/fit_projection.py`) maps model
+vectors down to `PROJECTION_DIMENSION` dims for a smaller, faster ANN index.
+Full vectors stay the source of truth and are used to re-rank its shortlist.
+"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.config.constants import EMBEDDING_DIMENSION, PROJECTION_DIMENSION
+from app.core.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PROJECTION_PATH = Path(__file__).resolve().parents[2] / "data" / "embedding_projection.npz"
+
+
+class EmbeddingProjection:
+    """Centering mean and principal components; `project` returns unit vectors."""
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray) -> None:
+        if components.shape != (PROJECTION_DIMENSION, EMBEDDING_DIMENSION):
+            raise ValueError(
+                f"Projection must be {PROJECTION_DIMENSION}x{EMBEDDING_DIMENSION}, "
+                f"got {components.shape[0]}x{components.shape[1]}"
+            )
+        self.mean = mean.astype(np.float32)
+        self.components = components.astype(np.float32)
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray) -> tuple["EmbeddingProjection", float]:
+        """Fit PCA on an (n, EMBEDDING_DIMENSION) matrix; also returns explained variance."""
+        if len(vectors) < PROJECTION_DIMENSION:
+            raise ValueError(
+                f"Need at least {PROJECTION_DIMENSION} vectors to fit the projection, "
+                f"got {len(vectors)}"
+            )
+        mean = vectors.mean(axis=0)
+        _, singular_values, basis = np.linalg.svd(vectors - mean, full_matrices=False)
+        variance = singular_values**2
+        explained = float(variance[:PROJECTION_DIMENSION].sum() / variance.sum())
+        return cls(mean, basis[:PROJECTION_DIMENSION]), explained
+
+    @classmethod
+    def load(cls, path: Path) -> "EmbeddingProjection | None":
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return cls(data["mean"], data["components"])
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"Could not load embedding projection from {path}: {e}")
+            return None
+
+    def save(self, path: Path) -> None:
+        np.savez(path, mean=self.mean, components=self.components)
+
+    def project_many(self, vectors: np.ndarray) -> np.ndarray:
+        projected = (np.asarray(vectors, dtype=np.float32) - self.mean) @ self.components.T
+        norms = np.linalg.norm(projected, axis=-1, keepdims=True)
+        return projected / np.where(norms == 0, 1, norms)
+
+    def project(self, vector: Sequence[float]) -> list[float]:
+        return self.project_many(np.asarray(vector, dtype=np.float32)).tolist()
+
+
+projection_path = Path(settings.embedding_projection_path or DEFAULT_PROJECTION_PATH)
+embedding_projection = EmbeddingProjection.load(projection_path)
+if embedding_projection is not None:
+    logger.info(f"Loaded {PROJECTION_DIMENSION}-dim embedding projection from {projection_path}")
+
+
+def project_vector(vector: Sequence[float] | None) -> list[float] | None:
+    """Reduced vector for the `asset_vector_reduced` column, or None without a projection."""
+    if embedding_projection is None or vector is None:
+        return None
+    return embedding_projection.project(vector)
@@ -1,5 +1,8 @@
 """Recommendation service: item-based, user-based, and profile updates."""
 
+import asyncio
+import json
+
 import numpy as np
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import text
@@ -20,7 +23,14 @@ from app.core.config.logging import get_logger
 from app.models.asset import Asset
 from app.models.user_profile import UserProfile
 from app.schemas.search import AssetResultSchema
-from app.services.search_service import mock_image_url
+from app.services.search_service import fetch_assets_by_ids, mock_image_url
+from app.services.vector_mirror import vector_mirror
+from app.services.vector_search import (
+    apply_vector_search_options,
+    nearest_assets_params,
+    nearest_assets_sql,
+    vector_candidate_count,
+)
 
 logger = get_logger(__name__)
 
@@ -35,8 +45,7 @@ def get_item_recommendations(asset_id: int, db: Session) -> list[AssetResultSche
                 price,
                 bedrooms,
                 asset_type_id,
-                location_latitude,
-                location_longitude
+                location_geog
             FROM asset WHERE id = :asset_id
         )
         SELECT
@@ -63,29 +72,13 @@ def get_item_recommendations(asset_id: int, db: Session) -> list[AssetResultSche
                     ELSE 0
                 END +
                 :weight_location * CASE
-                    WHEN asset.location_latitude IS NOT NULL
-                         AND asset.location_longitude IS NOT NULL
-                         AND target.location_latitude IS NOT NULL
-                         AND target.location_longitude IS NOT NULL THEN
+                    WHEN asset.location_geog IS NOT NULL
+                         AND target.location_geog IS NOT NULL THEN
                         GREATEST(
                             0,
                             1 - (
-                                ST_Distance(
-                                    ST_SetSRID(
-                                        ST_MakePoint(
-                                            asset.location_longitude,
-                                            asset.location_latitude
-                                        ),
-                                        4326
-                                    )::geography,
-                                    ST_SetSRID(
-                                        ST_MakePoint(
-                                            target.location_longitude,
-                                            target.location_latitude
-                                        ),
-                                        4326
-                                    )::geography
-                                ) / :distance_norm
+                                ST_Distance(asset.location_geog, target.location_geog)
+                                / :distance_norm
                             )
                         )
                     ELSE 0
@@ -128,13 +121,31 @@ def get_item_recommendations(asset_id: int, db: Session) -> list[AssetResultSche
     ]
 
 
-def get_user_recommendations(client_id: str, db: Session) -> list[AssetResultSchema]:
+async def get_user_recommendations(client_id: str, db: Session) -> list[AssetResultSchema]:
     """Return assets most similar to a user's profile vector."""
-    query = text(
-        """
-        WITH user_vector AS (
-            SELECT profile_vector FROM userprofile WHERE client_id = :client_id
+    # Resolve the profile vector up front and bind it as a constant so the
+    # planner can drive the ORDER BY ... LIMIT from the HNSW index.
+    profile_vector = db.exec(
+        text(
+            "SELECT profile_vector::text FROM userprofile "
+            "WHERE client_id = :client_id AND profile_vector IS NOT NULL"
+        ).bindparams(client_id=client_id)
+    ).scalar_one_or_none()
+    if profile_vector is None:
+        return []
+
+    mirror = vector_mirror.current()
+    if mirror is not None:
+        asset_ids, _ = await asyncio.to_thread(
+            mirror.top_k, json.loads(profile_vector), USER_RECOMMENDATIONS_LIMIT
         )
+        return fetch_assets_by_ids(db, asset_ids.tolist())
+
+    nearest = nearest_assets_sql(
+        "FROM asset AS assets WHERE assets.asset_vector IS NOT NULL", "user_limit"
+    )
+    query = text(
+        f"""
         SELECT
             assets.id,
             assets.asset_code,
@@ -143,17 +154,22 @@ def get_user_recommendations(client_id: str, db: Session) -> list[AssetResultSch
             assets.images_main_id,
             assets.location_latitude,
             assets.location_longitude
-        FROM asset AS assets, user_vector
-        WHERE assets.asset_vector IS NOT NULL
-          AND user_vector.profile_vector IS NOT NULL
-        ORDER BY assets.asset_vector <=> user_vector.profile_vector
-        LIMIT :user_limit
+        FROM ({nearest}) AS nearest
+        JOIN asset AS assets ON assets.id = nearest.id
+        ORDER BY nearest.vector_distance, nearest.id
         """
     )
 
+    apply_vector_search_options(
+        db, min_candidates=vector_candidate_count(USER_RECOMMENDATIONS_LIMIT)
+    )
     rows = db.exec(
         query,
-        {"client_id": client_id, "user_limit": USER_RECOMMENDATIONS_LIMIT},
+        {
+            "query_vector": profile_vector,
+            "user_limit": USER_RECOMMENDATIONS_LIMIT,
+            **nearest_assets_params(USER_RECOMMENDATIONS_LIMIT, json.loads(profile_vector)),
+        },
     ).fetchall()
 
     return [
@@ -0,0 +1,54 @@
+"""
+Search result cache.
+Remembers the ranked asset ids and totals of normalized search requests.
+Entries are keyed by the catalog version (see `catalog_version`) that asset
+writes and ingests bump, so a write makes every earlier entry unreachable
+instead of serving it stale.
+"""
+
+import json
+from dataclasses import dataclass
+
+from app.core.cache import LRUCache, normalize_text_key
+from app.core.config import settings
+from app.schemas.search import SearchRequestSchema, SearchResponseSchema
+
+
+@dataclass(frozen=True)
+class CachedSearchResult:
+    """Page of a ranked search: asset ids in rank order plus totals and paging."""
+
+    asset_ids: tuple[int, ...]
+    total_pages: int | None
+    total_count: int | None
+    total_count_exact: bool
+    total_count_label: str | None
+    next_cursor: str | None
+
+    @classmethod
+    def from_response(cls, response: SearchResponseSchema) -> "CachedSearchResult":
+        return cls(
+            asset_ids=tuple(result.id for result in response.results),
+            total_pages=response.total_pages,
+            total_count=response.total_count,
+            total_count_exact=response.total_count_exact,
+            total_count_label=response.total_count_label,
+            next_cursor=response.next_cursor,
+        )
+
+
+search_result_cache: LRUCache[CachedSearchResult] = LRUCache(
+    maxsize=settings.search_result_cache_size,
+    ttl_seconds=settings.search_result_cache_ttl_seconds,
+)
+
+
+def search_cache_key(request: SearchRequestSchema, version: int) -> str:
+    """Key a request by catalog version and its normalized, order-independent fields."""
+    payload = request.model_dump(mode="json")
+    payload["query_text"] = normalize_text_key(request.query_text)
+    # Only non-speculative pages are cached, and those do not depend on the budget.
+    payload["options"].pop("latency_budget_ms", None)
+    if request.filters.asset_type_id:
+        payload["filters"]["asset_type_id"] = sorted(set(request.filters.asset_type_id))
+    return f"{version}:{json.dumps(payload, sort_keys=True, ensure_ascii=False)}"
@@ -0,0 +1,210 @@
+"""
+Rule-based query parser.
+Extracts price ranges, bedroom counts, asset types and gazetteer locations
+from Thai/English queries with regexes and lexicons in microseconds. It also
+scores how much of the query it explained, so the caller can skip the LLM
+parser when the score is high.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.core.config.logging import get_logger
+from app.services.geocode_service import match_gazetteer
+
+logger = get_logger(__name__)
+
+ASSET_TYPES_PATH = Path(__file__).resolve().parents[2] / "data" / "asset_type_rows.json"
+
+THAI_DIGITS = str.maketrans("๐๑๒๓๔๕๖๗๘๙", "0123456789")
+
+NUMBER = r"\d+(?:,\d{3})*(?:\.\d+)?"
+PRICE_UNITS = {
+    "ล้าน": 1_000_000,
+    "แสน": 100_000,
+    "หมื่น": 10_000,
+    "million": 1_000_000,
+    "mil": 1_000_000,
+    "mb": 1_000_000,
+    "m": 1_000_000,
+    "k": 1_000,
+    "บาท": 1,
+    "baht": 1,
+    "thb": 1,
+}
+UNIT = r"(?:ล้าน|แสน|หมื่น|million|mil|mb|m(?![a-z²2])|k(?![a-z])|บาท|baht|thb)(?:\s*บาท)?"
+PRICE_MAX_WORDS = (
+    r"ไม่เกิน|ไม่ถึง|ต่ำกว่า|น้อยกว่า|สูงสุด|งบประมาณ|งบ|under|below|less than|cheaper than"
+    r"|at most|maximum|max|up to|within|budget|<=|<"
+)
+PRICE_MIN_WORDS = (
+    r"ตั้งแต่|มากกว่า|สูงกว่า|เกิน|ขั้นต่ำ|อย่างน้อย|over|above|more than|at least"
+    r"|minimum|min|from|>=|>"
+)
+PRICE_RANGE_PATTERN = re.compile(
+    rf"(?:ระหว่าง|ตั้งแต่|between|from)?\s*(?P<low>{NUMBER})\s*(?P<low_unit>{UNIT})?"
+    rf"\s*(?:-|–|to|ถึง|and|และ)\s*(?P<high>{NUMBER})\s*(?P<unit>{UNIT})"
+)
+PRICE_PATTERN = re.compile(
+    rf"(?:(?P<max>{PRICE_MAX_WORDS})|(?P<min>{PRICE_MIN_WORDS}))?"
+    rf"\s*(?P<amount>{NUMBER})\s*(?P<unit>{UNIT})?"
+)
+# Bare numbers only count as prices after a qualifier and from this amount up.
+MIN_UNITLESS_PRICE = 10_000
+
+COUNT_WORDS = {
+    "หนึ่ง": 1,
+    "สอง": 2,
+    "สาม": 3,
+    "สี่": 4,
+    "ห้า": 5,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+}
+COUNT = r"\d+|" + "|".join(COUNT_WORDS)
+BEDROOM_PATTERN = re.compile(
+    rf"(?:at least\s*|อย่างน้อย\s*)?(?P<count>{COUNT})\s*\+?\s*-?\s*"
+    r"(?:ห้องนอน|นอน|bedrooms?|beds?|bdrs?|br(?![a-z]))"
+    rf"|ห้องนอน\s*(?P<count_after>{COUNT})(?:\s*ห้อง)?"
+)
+
+# Keywords beyond the type names themselves, keyed by `assettype.name_en`.
+ASSET_TYPE_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "condominium": ("คอนโด", "คอนโดมิเนียม", "ห้องชุด", "อาคารชุด", "condo"),
+    "townhouse": ("ทาวน์เฮาส์", "ทาวน์โฮม", "townhome", "town house"),
+    "detached house": ("single house", "single-detached house"),
+    "semi-detached house": ("twin house", "semi detached house"),
+    "vacant land": ("ที่ดิน", "land", "plot"),
+    "commercial building": ("ตึกแถว", "shophouse", "shop house"),
+    "apartment": ("อพาร์ตเมนต์", "apartment"),
+}
+# Words that only make the query read naturally; they carry no filter.
+FILLER_PATTERN = re.compile(
+    r"ใกล้|แถว|ย่าน|ทำเล|โซน|ราคา|ขาย|ให้เช่า|บ้าน|ห้อง|สถานี|เขต|แขวง|ถนน|ซอย"
+    r"|(?<![a-z])(?:near|in|at|around|close to|for|sale|rent|the|a|an|with|price|priced"
+    r"|house|home|property|bts|mrt|arl|station|district|road|soi)(?![a-z])"
+)
+# A type keyword right after one of these names a nearby place, not the asset type.
+PROXIMITY_PATTERN = re.compile(r"(?:ใกล้|ติด|แถว|near|close to|next to)\s*$")
+
+
+@dataclass(frozen=True)
+class RuleParse:
+    """Parser output in the LLM schema, plus the share of the query it explained (0-1)."""
+
+    parsed: dict[str, Any]
+    confidence: float
+
+
+def load_asset_type_keywords(path: Path = ASSET_TYPES_PATH) -> dict[str, tuple[int, ...]]:
+    """Map casefolded type names, their "/" parts and synonyms to asset type ids."""
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            rows = json.load(file)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load asset types from {path}: {e}")
+        return {}
+
+    keywords: dict[str, set[int]] = {}
+    for row in rows:
+        names = [str(row.get("name_th") or ""), str(row.get("name_en") or "")]
+        names += [part for name in names for part in name.split("/")]
+        names += ASSET_TYPE_SYNONYMS.get(str(row.get("name_en") or "").casefold(), ())
+        for name in names:
+            keyword = name.strip().casefold()
+            if keyword:
+                keywords.setdefault(keyword, set()).add(int(row["id"]))
+    return {keyword: tuple(sorted(ids)) for keyword, ids in keywords.items()}
+
+
+asset_type_keywords = load_asset_type_keywords()
+# Longest first so "ห้องชุดพักอาศัย" wins over "ห้องชุด"; Latin keywords need word edges.
+ASSET_TYPE_PATTERN = re.compile(
+    "|".join(
+        rf"(?<![a-z]){re.escape(keyword)}(?![a-z])" if keyword.isascii() else re.escape(keyword)
+        for keyword in sorted(asset_type_keywords, key=len, reverse=True)
+    )
+    or r"(?!)"
+)
+
+
+def to_amount(number: str, unit: str | None) -> int:
+    multiplier = 1
+    if unit:
+        multiplier = PRICE_UNITS[re.sub(r"\s*บาท$", "", unit) or "บาท"]
+    return int(round(float(number.replace(",", "")) * multiplier))
+
+
+def to_count(value: str) -> int:
+    return COUNT_WORDS.get(value) or int(value)
+
+
+def blank(text: str, start: int, end: int) -> str:
+    """Replace a matched span with spaces so offsets stay valid and it is not re-read."""
+    return text[:start] + " " * (end - start) + text[end:]
+
+
+def letter_count(text: str) -> int:
+    return sum(char.isalnum() for char in text)
+
+
+def parse_rules(query_text: str) -> RuleParse:
+    """Parse `query_text` without the LLM; `confidence` is the explained share of letters."""
+    text = " ".join(query_text.translate(THAI_DIGITS).casefold().split())
+    total_letters = letter_count(text)
+    filters: dict[str, Any] = {}
+
+    for match in BEDROOM_PATTERN.finditer(text):
+        count = to_count(match.group("count") or match.group("count_after"))
+        filters["bedrooms_min"] = max(filters.get("bedrooms_min", 0), count)
+        text = blank(text, *match.span())
+
+    for match in PRICE_RANGE_PATTERN.finditer(text):
+        unit = match.group("unit")
+        filters["price_min"] = to_amount(match.group("low"), match.group("low_unit") or unit)
+        filters["price_max"] = to_amount(match.group("high"), unit)
+        text = blank(text, *match.span())
+
+    for match in PRICE_PATTERN.finditer(text):
+        unit = match.group("unit")
+        qualified = match.group("max") or match.group("min")
+        amount = to_amount(match.group("amount"), unit)
+        if not unit and not (qualified and amount >= MIN_UNITLESS_PRICE):
+            continue
+        filters["price_min" if match.group("min") else "price_max"] = amount
+        text = blank(text, *match.span())
+
+    asset_type_ids: set[int] = set()
+    for match in ASSET_TYPE_PATTERN.finditer(text):
+        if PROXIMITY_PATTERN.search(text[: match.start()]):
+            continue
+        asset_type_ids.update(asset_type_keywords[match.group(0)])
+        text = blank(text, *match.span())
+    if asset_type_ids:
+        filters["asset_type_id"] = sorted(asset_type_ids)
+
+    # Look places up before dropping filler words, which can be part of a name.
+    location_text = None
+    place = match_gazetteer(text) if letter_count(text) else None
+    for match in FILLER_PATTERN.finditer(text):
+        text = blank(text, *match.span())
+
+    unexplained = letter_count(text)
+    if place is not None:
+        key, entry = place
+        location_text = entry.name_th
+        unexplained = max(0, unexplained - letter_count(key))
+
+    confidence = 1 - unexplained / total_letters if total_letters else 0.0
+    parsed = {
+        "semantic_query": query_text,
+        "location_text": location_text,
+        "filters": filters,
+    }
+    return RuleParse(parsed=parsed, confidence=round(confidence, 3))
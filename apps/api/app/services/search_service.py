@@ -4,135 +4,156 @@ Combines vector search, attribute filtering, and geospatial filtering
 into a single SQL query.
 """
 
-from typing import Any
+import asyncio
+import re
+import time
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
-from geopy.exc import GeocoderUnavailable
-from geopy.geocoders import Nominatim
-from sentence_transformers import SentenceTransformer
 from sqlalchemy.sql import text
 from sqlmodel import Session
 
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.core.config.constants import (
-    EMBEDDING_MODEL_NAME,
+    FUSION_WEIGHT_LEXICAL,
+    FUSION_WEIGHT_VECTOR,
     GEOSPATIAL_RADIUS_METERS,
+    LEXICAL_WEIGHT_DOCUMENT,
+    LEXICAL_WEIGHT_NAME,
+    RRF_K,
 )
 from app.core.config.logging import get_logger
-from app.schemas.search import AssetResultSchema, SearchRequestSchema
+from app.schemas.search import (
+    AssetResultSchema,
+    SearchFacetsRequestSchema,
+    SearchFilterSchema,
+    SearchRequestSchema,
+    SearchResponseSchema,
+)
+from app.services.catalog_version import current_catalog_version
+from app.services.embedding import encode_batch, require_embedding_model
+from app.services.embedding_dispatcher import embedding_dispatcher
+from app.services.geocode_service import get_coords
+from app.services.pagination import decode_cursor, encode_cursor
 from app.services.parser_service import parse_query_to_json
+from app.services.result_cache import (
+    CachedSearchResult,
+    search_cache_key,
+    search_result_cache,
+)
+from app.services.vector_mirror import vector_mirror
+from app.services.vector_search import (
+    apply_vector_search_options,
+    nearest_assets_params,
+    nearest_assets_sql,
+    vector_candidate_count,
+)
 
 logger = get_logger(__name__)
 
-# Load embedding model once on startup
-try:
-    model = SentenceTransformer(EMBEDDING_MODEL_NAME)
-except Exception as e:
-    logger.critical(f"Could not load sentence-transformer model: {e}")
-    model = None
+T = TypeVar("T")
 
-geolocator = Nominatim(user_agent="proptech-ai-backend")
+# Pre-SQL stage output: (parsed_query, semantic_text, query_vector, location_coords)
+SearchInputs = tuple[dict[str, Any], str, list[float], tuple[float, float] | None]
 
+# Weighted word similarity of the query against the asset name and full document (0-1).
+LEXICAL_SCORE_SQL = (
+    "(:weight_name * word_similarity(:search_text, COALESCE(assets.name_th, ''))"
+    " + :weight_document * word_similarity(:search_text, assets.search_document))"
+    " / (:weight_name + :weight_document)"
+)
 
-def get_coords(location_text: str) -> tuple[float, float] | None:
-    """Uses Nominatim to get (lat, lon) for a location name."""
-    try:
-        search_query = f"{location_text}, Thailand"
-        logger.debug(f"Geocoding: {search_query}")
-        location = geolocator.geocode(search_query)
-        if location:
-            coords = (location.latitude, location.longitude)
-            logger.info(f"Geocoded '{location_text}' to {coords}")
-            return coords
-        else:
-            logger.warning(f"Geocoding failed for: {location_text}")
-    except GeocoderUnavailable:
-        logger.warning("Geocoder service is unavailable.")
-    except Exception as e:
-        logger.error(f"Error geocoding '{location_text}': {e}")
-    return None
+# Assets a search ranks, with their type for lexical scoring and facets.
+SEARCH_FROM_CLAUSE = (
+    "FROM asset AS assets LEFT JOIN assettype ON assets.asset_type_id = assettype.id"
+)
 
+# Same rule as sqlalchemy text(): `:name` binds, `::type` casts do not.
+BIND_PARAM_PATTERN = re.compile(r"(?<![:\w]):(\w+)")
 
-def mock_image_url(asset_id: int, images_main_id: int | None) -> str:
-    """Mocks an image URL for the frontend."""
-    return f"https://placehold.co/600x400/EEE/333?text=Property+Image+{asset_id}"
+# Query embeddings keyed by normalized semantic text; repeat queries skip the encode.
+embedding_cache: LRUCache[list[float]] = LRUCache(
+    maxsize=settings.embedding_cache_size,
+    ttl_seconds=settings.embedding_cache_ttl_seconds,
+)
 
 
-async def hybrid_search(
-    request: SearchRequestSchema, db: Session
-) -> tuple[list[AssetResultSchema], int]:
+def embedding_cache_key(semantic_text: str) -> str:
     """
-    Performs hybrid search combining:
-    - Vector similarity (pgvector)
-    - Text matching (ILIKE)
-    - Attribute filters (price, bedrooms, asset_type)
-    - Geospatial filters (PostGIS ST_DWithin)
+    Collapse whitespace only: the embedding tokenizer is cased, so casefolding
+    (as `normalize_text_key` does) would share one vector between texts it
+    embeds differently.
+    """
+    return " ".join(semantic_text.split())
 
-    If no query_text or filters are provided, returns all assets with pagination.
+
+async def encode_query(semantic_text: str) -> list[float]:
     """
-    filters = request.filters
+    Return the query embedding. Cache misses go through the embedding
+    dispatcher, which batches them with other concurrent requests.
+    """
+    key = embedding_cache_key(semantic_text)
+    cached = embedding_cache.get(key)
+    if cached is not None:
+        return cached
+
+    vector = await embedding_dispatcher.encode(semantic_text)
+    embedding_cache.set(key, vector)
+    logger.debug(f"Embedding cache miss; stats={embedding_cache.stats()}")
+    return vector
+
+
+def encode_queries(semantic_texts: list[str]) -> list[list[float]]:
+    """Batch form of `encode_query`: all cache misses go through one model call."""
+    keys = [embedding_cache_key(semantic_text) for semantic_text in semantic_texts]
+    texts: dict[str, str] = {}
+    for key, semantic_text in zip(keys, semantic_texts):
+        texts.setdefault(key, semantic_text)
+    vectors = {key: embedding_cache.get(key) for key in texts}
+    missing = [key for key, vector in vectors.items() if vector is None]
+    if missing:
+        for key, vector in zip(missing, encode_batch([texts[key] for key in missing])):
+            vectors[key] = vector
+            embedding_cache.set(key, vector)
+        logger.debug(f"Batch-encoded {len(missing)} of {len(keys)} query texts")
+    return [vectors[key] for key in keys]
+
+
+# Bounded pool for CPU-bound pre-SQL stages (batch query encoding) so they run off the event loop.
+search_executor = ThreadPoolExecutor(
+    max_workers=settings.search_pipeline_workers, thread_name_prefix="search-pipeline"
+)
 
-    has_query_text = bool(request.query_text and request.query_text.strip())
-    has_filters = bool(
-        filters.price_min
-        or filters.price_max
-        or filters.bedrooms_min
-        or filters.asset_type_id
-    )
 
-    if not has_query_text and not has_filters:
-        simple_query = """
-            SELECT
-                assets.id,
-                assets.asset_code,
-                assets.name_th,
-                assets.price,
-                assets.images_main_id,
-                assets.location_latitude,
-                assets.location_longitude
-            FROM asset AS assets
-            LEFT JOIN assettype ON assets.asset_type_id = assettype.id
-            ORDER BY assets.id
-            LIMIT :limit OFFSET :offset
-        """
+async def timed(stage: str, awaitable: Awaitable[T], timings: dict[str, float]) -> T:
+    """Await a pipeline stage and record its wall time in milliseconds."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 2)
 
-        count_query = "SELECT COUNT(assets.id) FROM asset AS assets"
 
-        params: dict[str, Any] = {
-            "limit": request.pagination.page_size,
-            "offset": (request.pagination.page - 1) * request.pagination.page_size,
-        }
+def discard(task: asyncio.Future[Any]) -> None:
+    """Drop an unused speculative task without leaking an unretrieved exception."""
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
-        total_count_statement = text(count_query)
-        total_count_result = db.exec(total_count_statement).scalar_one()
-        total_pages = (
-            total_count_result + request.pagination.page_size - 1
-        ) // request.pagination.page_size
-
-        final_statement = text(simple_query).bindparams(**params)
-        results = db.exec(final_statement).fetchall()
-
-        formatted_results = [
-            AssetResultSchema(
-                id=row[0],
-                asset_code=row[1],
-                name_th=row[2],
-                price=row[3],
-                image_url=mock_image_url(row[0], row[4]),
-                location_latitude=row[5],
-                location_longitude=row[6],
-            )
-            for row in results
-        ]
 
-        return formatted_results, total_pages
+def is_short_location_query(query_text: str) -> bool:
+    """Short phrases without digits are likely bare location names."""
+    return len(query_text.split()) <= 3 and not any(char.isdigit() for char in query_text)
 
-    if model is None:
-        raise RuntimeError("Embedding model is not loaded.")
 
-    # Parse query using Ollama
-    if request.query_text:
-        parsed_query = await parse_query_to_json(request.query_text)
-    else:
-        parsed_query = {
+def coerce_parsed_query(parsed_query: Any, query_text: str) -> dict[str, Any]:
+    """Parser output as a dict; empty queries and non-dict output get a fallback."""
+    if parsed_query is None and not query_text.strip():
+        return {
             "semantic_query": "",
             "location_text": None,
             "filters": {},
@@ -140,77 +161,407 @@ async def hybrid_search(
 
     if not isinstance(parsed_query, dict):
         logger.warning(f"Parser returned non-dict: {repr(parsed_query)}. Using fallback.")
-        parsed_query = {
-            "semantic_query": request.query_text or "",
+        return {
+            "semantic_query": query_text or "",
             "location_text": None,
             "filters": {},
         }
+    return parsed_query
 
-    # Generate query vector
-    semantic_text = str(parsed_query.get("semantic_query") or request.query_text or "")
-    query_vector = model.encode(semantic_text, show_progress_bar=False).tolist()
 
-    # Geocode location
-    location_coords = None
+async def prepare_search_inputs(
+    query_text: str, timings: dict[str, float], parse_timeout: float | None = None
+) -> tuple[SearchInputs, bool]:
+    """
+    Runs the pre-SQL stages as a concurrent pipeline.
+
+    The Ollama parse starts together with speculative encoding of the raw
+    query text and, for short queries, a direct geocode of the raw text. Once
+    the parse lands, the speculative vector is reused when the semantic text
+    is unchanged, and only the stages that depend on the parse (re-encoding
+    rewritten text, geocoding the extracted location) run afterwards, also
+    concurrently. Returns (parsed_query, semantic_text, query_vector, coords)
+    and whether the parse was applied.
+
+    With `parse_timeout` (seconds), a parse that has not landed by then is
+    skipped: the inputs fall back to the raw-text vector with no parsed
+    filters or location. The parse keeps running in the background so that
+    its result reaches the parse cache for the next identical query.
+    """
+    query_stripped = query_text.strip()
+
+    parse_task: asyncio.Future[Any] | None = None
+    raw_encode_task: asyncio.Future[list[float]] | None = None
+    raw_geocode_task: asyncio.Future[tuple[float, float] | None] | None = None
+    if query_stripped:
+        parse_task = asyncio.ensure_future(
+            timed("parse", parse_query_to_json(query_text), timings)
+        )
+        raw_encode_task = asyncio.ensure_future(
+            timed("encode_raw", encode_query(query_text), timings)
+        )
+        if is_short_location_query(query_stripped):
+            raw_geocode_task = asyncio.ensure_future(
+                timed("geocode_raw", get_coords(query_stripped), timings)
+            )
+
+    if parse_task is not None and raw_encode_task is not None and parse_timeout is not None:
+        await asyncio.wait({parse_task}, timeout=parse_timeout)
+        if not parse_task.done():
+            logger.info(
+                f"Query parse missed the {round(parse_timeout * 1000)} ms latency budget; "
+                "ranking the raw query with explicit filters only"
+            )
+            discard(parse_task)
+            if raw_geocode_task is not None:
+                discard(raw_geocode_task)
+            speculative_query = {"semantic_query": query_text, "location_text": None, "filters": {}}
+            return (speculative_query, query_text, await raw_encode_task, None), False
+
+    parsed_query = coerce_parsed_query(
+        await parse_task if parse_task is not None else None, query_text
+    )
+
+    # Generate query vector, reusing the speculative raw-text encode when possible
+    semantic_text = str(parsed_query.get("semantic_query") or query_text or "")
+    if raw_encode_task is not None and embedding_cache_key(semantic_text) == embedding_cache_key(
+        query_text
+    ):
+        encode_task = raw_encode_task
+    else:
+        if raw_encode_task is not None:
+            discard(raw_encode_task)
+        encode_task = asyncio.ensure_future(
+            timed("encode", encode_query(semantic_text), timings)
+        )
+
+    # Geocode the parsed location while the vector is being computed
     location_text = parsed_query.get("location_text")
+    location_task: asyncio.Future[tuple[float, float] | None] | None = None
     if location_text and isinstance(location_text, str):
-        location_coords = get_coords(location_text)
-
-    # Fallback: if parser didn't extract location but query is simple (likely a location name),
-    # try geocoding the original query text directly
-    if not location_coords and request.query_text:
-        query_stripped = request.query_text.strip()
-        # If query is a single word or short phrase (likely a location name), try geocoding it
-        if len(query_stripped.split()) <= 3 and not any(
-            char.isdigit() for char in query_stripped
-        ):
+        location_task = asyncio.ensure_future(
+            timed("geocode", get_coords(location_text), timings)
+        )
+
+    location_coords = await location_task if location_task is not None else None
+
+    # Fallback: if parser didn't extract a location but the query is simple (likely a
+    # location name), use the speculative direct geocode of the original query text
+    if raw_geocode_task is not None:
+        if location_coords:
+            discard(raw_geocode_task)
+        else:
             logger.info(
-                f"Parser didn't extract location, trying direct geocoding for: "
-                f"{query_stripped}"
+                f"Parser didn't extract location, using direct geocoding for: {query_stripped}"
             )
-            location_coords = get_coords(query_stripped)
+            location_coords = await raw_geocode_task
             if location_coords:
                 logger.info(f"Successfully geocoded '{query_stripped}' to {location_coords}")
 
-    # Combine filters from request and parser
-    raw_parsed_filters = parsed_query.get("filters")
-    parsed_filters: dict[str, Any] = (
-        raw_parsed_filters if isinstance(raw_parsed_filters, dict) else {}
+    query_vector = await encode_task
+    return (parsed_query, semantic_text, query_vector, location_coords), True
+
+
+async def resolve_location(
+    parsed_query: dict[str, Any], query_text: str
+) -> tuple[float, float] | None:
+    """Geocode the parsed location, falling back to short raw queries (likely place names)."""
+    location_text = parsed_query.get("location_text")
+    if location_text and isinstance(location_text, str):
+        coords = await get_coords(location_text)
+        if coords:
+            return coords
+
+    query_stripped = query_text.strip()
+    if query_stripped and is_short_location_query(query_stripped):
+        return await get_coords(query_stripped)
+    return None
+
+
+async def prepare_batch_inputs(
+    query_texts: list[str], timings: dict[str, float]
+) -> list[SearchInputs]:
+    """
+    Pre-SQL stages for several queries at once: parses and geocodes run
+    concurrently, and every semantic text is encoded in a single batched call.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def parse(query_text: str) -> dict[str, Any]:
+        if not query_text.strip():
+            return coerce_parsed_query(None, query_text)
+        return coerce_parsed_query(await parse_query_to_json(query_text), query_text)
+
+    parsed_queries = await timed(
+        "parse", asyncio.gather(*(parse(query_text) for query_text in query_texts)), timings
+    )
+    semantic_texts = [
+        str(parsed_query.get("semantic_query") or query_text or "")
+        for parsed_query, query_text in zip(parsed_queries, query_texts)
+    ]
+    query_vectors, locations = await asyncio.gather(
+        timed(
+            "encode",
+            loop.run_in_executor(search_executor, encode_queries, semantic_texts),
+            timings,
+        ),
+        timed(
+            "geocode",
+            asyncio.gather(
+                *(
+                    resolve_location(parsed_query, query_text)
+                    for parsed_query, query_text in zip(parsed_queries, query_texts)
+                )
+            ),
+            timings,
+        ),
     )
+    return list(zip(parsed_queries, semantic_texts, query_vectors, locations))
 
-    # Build dynamic SQL query with hybrid scoring
-    base_query = """
-        SELECT
-            assets.id,
-            assets.asset_code,
-            assets.name_th,
-            assets.price,
-            assets.images_main_id,
-            assets.location_latitude,
-            assets.location_longitude,
-            (assets.asset_vector <=> :query_vector) AS vector_distance,
-            CASE
-                WHEN assets.name_th ILIKE '%' || :search_text || '%' THEN 1
-                WHEN assets.description_th ILIKE '%' || :search_text || '%' THEN 2
-                WHEN assets.description_en ILIKE '%' || :search_text || '%' THEN 2
-                ELSE 3
-            END AS text_match_rank
-        FROM asset AS assets
-        LEFT JOIN assettype ON assets.asset_type_id = assettype.id
+
+def mock_image_url(asset_id: int, images_main_id: int | None) -> str:
+    """Mocks an image URL for the frontend."""
+    return f"https://placehold.co/600x400/EEE/333?text=Property+Image+{asset_id}"
+
+
+def to_asset_result(row: Any) -> AssetResultSchema:
+    """Map a row starting with id, asset_code, name_th, price, images_main_id, lat, lon."""
+    return AssetResultSchema(
+        id=row[0],
+        asset_code=row[1],
+        name_th=row[2],
+        price=row[3],
+        image_url=mock_image_url(row[0], row[4]),
+        location_latitude=row[5],
+        location_longitude=row[6],
+    )
+
+
+def total_count_mode(request: SearchRequestSchema) -> str | None:
+    """
+    Count mode for the page query, or None on cursor pages: the client already
+    has the total from the first page, and counting would scan every match again.
+    """
+    return None if request.pagination.cursor else request.options.count_mode
+
+
+def total_count_column(from_where: str, count_mode: str | None) -> str:
     """
+    Select-list expression carrying the total match count in the page query.
+    `exact` uses a window count over the filtered rows; `capped` counts at most
+    `:count_probe` rows in an uncorrelated subquery so large result sets stop early;
+    None (cursor pages) selects NULL without counting.
+    """
+    if count_mode is None:
+        return "NULL::bigint AS total_count"
+    if count_mode == "capped":
+        return (
+            f"(SELECT COUNT(*) FROM (SELECT 1 {from_where} LIMIT :count_probe) AS matched)"
+            " AS total_count"
+        )
+    return "COUNT(*) OVER () AS total_count"
+
+
+def fetch_total_count(
+    db: Session, from_where: str, params: dict[str, Any], count_mode: str, with_clause: str = ""
+) -> int:
+    """Standalone count, only needed when the requested page is past the last row."""
+    limit = " LIMIT :count_probe" if count_mode == "capped" else ""
+    count_query = f"{with_clause} SELECT COUNT(*) FROM (SELECT 1 {from_where}{limit}) AS matched"
+    # text().bindparams() rejects names the statement does not use (vector, paging, ...)
+    used = set(BIND_PARAM_PATTERN.findall(count_query))
+    count_params = {key: value for key, value in params.items() if key in used}
+    return db.exec(text(count_query).bindparams(**count_params)).scalar_one()
+
+
+def page_offset(request: SearchRequestSchema) -> int:
+    """OFFSET for page-number pagination; keyset pages start after the cursor row."""
+    if request.pagination.cursor:
+        return 0
+    return (request.pagination.page - 1) * request.pagination.page_size
+
 
-    count_query = (
-        "SELECT COUNT(assets.id) FROM asset AS assets "
-        "LEFT JOIN assettype ON assets.asset_type_id = assettype.id"
+def keyset_page_query(inner_query: str, sort_columns: list[str], has_cursor: bool) -> str:
+    """
+    Wrap a ranked query with ORDER BY/LIMIT over `sort_columns` and, when a cursor
+    is given, a row-value predicate that starts after the last row served.
+    Window totals in `inner_query` are computed before the cursor filter applies.
+    """
+    order = ", ".join(f"page_rows.{column}" for column in sort_columns)
+    after = ", ".join(f":cursor_{column}" for column in sort_columns)
+    where = f"WHERE ({order}) > ({after})" if has_cursor else ""
+    return (
+        f"SELECT * FROM ({inner_query}) AS page_rows {where} "
+        f"ORDER BY {order} LIMIT :limit OFFSET :offset"
     )
 
+
+def build_search_response(
+    db: Session,
+    request: SearchRequestSchema,
+    inner_query: str,
+    from_where: str,
+    params: dict[str, Any],
+    sort_columns: list[str],
+    cursor_kind: str,
+    with_clause: str = "",
+) -> SearchResponseSchema:
+    """
+    Page through `inner_query` (whose last column is `total_count`, built with
+    `total_count_mode(request)`) by offset or by cursor, and build the response.
+    Rows and total come back in one round-trip; cursor pages carry no total.
+    `with_clause` holds CTEs that `from_where` depends on, for the standalone count.
+    """
+    params = dict(params)
+    cursor = request.pagination.cursor
+    if cursor:
+        key = decode_cursor(cursor_kind, cursor, len(sort_columns))
+        params.update({f"cursor_{column}": value for column, value in zip(sort_columns, key)})
+
+    count_mode = total_count_mode(request)
+    count_cap = request.options.count_cap or settings.search_count_cap
+    if count_mode == "capped":
+        # Probe one row past the cap to tell "exactly cap" apart from "more than cap".
+        params["count_probe"] = count_cap + 1
+
+    page_sql = keyset_page_query(inner_query, sort_columns, has_cursor=bool(cursor))
+    rows = db.exec(text(page_sql).bindparams(**params)).fetchall()
+    page_size = request.pagination.page_size
+    next_cursor = None
+    if len(rows) == page_size:
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(cursor_kind, [last[column] for column in sort_columns])
+    results = [to_asset_result(row) for row in rows]
+
+    if count_mode is None:
+        return SearchResponseSchema(results=results, total_pages=None, next_cursor=next_cursor)
+
+    if rows:
+        total_count = rows[0][-1]
+    elif params["offset"] == 0:
+        total_count = 0
+    else:
+        total_count = fetch_total_count(db, from_where, params, count_mode, with_clause)
+
+    total_count_exact = not (count_mode == "capped" and total_count > count_cap)
+    if not total_count_exact:
+        total_count = count_cap
+
+    return SearchResponseSchema(
+        results=results,
+        total_pages=(total_count + page_size - 1) // page_size,
+        total_count=total_count,
+        total_count_exact=total_count_exact,
+        total_count_label=str(total_count) if total_count_exact else f"{total_count}+",
+        next_cursor=next_cursor,
+    )
+
+
+def fetch_assets_by_ids(db: Session, asset_ids: list[int]) -> list[AssetResultSchema]:
+    """Load assets by primary key, keeping the given (rank) order; missing ids are skipped."""
+    if not asset_ids:
+        return []
+    rows = db.exec(
+        text(
+            """
+            SELECT
+                id,
+                asset_code,
+                name_th,
+                price,
+                images_main_id,
+                location_latitude,
+                location_longitude
+            FROM asset
+            WHERE id = ANY(:asset_ids)
+            """
+        ).bindparams(asset_ids=asset_ids)
+    ).fetchall()
+    rows_by_id = {row[0]: row for row in rows}
+    return [
+        to_asset_result(rows_by_id[asset_id]) for asset_id in asset_ids if asset_id in rows_by_id
+    ]
+
+
+def cached_search_response(db: Session, cached: CachedSearchResult) -> SearchResponseSchema:
+    """Rebuild a cached page by loading its assets by primary key in rank order."""
+    return SearchResponseSchema(
+        results=fetch_assets_by_ids(db, list(cached.asset_ids)),
+        total_pages=cached.total_pages,
+        total_count=cached.total_count,
+        total_count_exact=cached.total_count_exact,
+        total_count_label=cached.total_count_label,
+        next_cursor=cached.next_cursor,
+    )
+
+
+async def hybrid_search(request: SearchRequestSchema, db: Session) -> SearchResponseSchema:
+    """
+    Serves identical requests from the result cache until the catalog version
+    changes (see `result_cache`); otherwise ranks with `rank_assets` and caches
+    the page's asset ids and totals.
+    """
+    cache_key = search_cache_key(request, current_catalog_version())
+    cached = search_result_cache.get(cache_key)
+    if cached is not None:
+        logger.debug(f"Search result cache hit; stats={search_result_cache.stats()}")
+        return cached_search_response(db, cached)
+
+    response = await rank_assets(request, db)
+    # Speculative pages are not cached so the next request can use the (cached) parse.
+    if not response.speculative:
+        search_result_cache.set(cache_key, CachedSearchResult.from_response(response))
+    return response
+
+
+async def batch_search(
+    requests: list[SearchRequestSchema], db: Session
+) -> list[SearchResponseSchema]:
+    """
+    Runs several searches in one call: cached pages are served as in
+    `hybrid_search`, the remaining queries share one parse/geocode fan-out and
+    one batched embedding call, and all SQL runs over the same session.
+    """
+    version = current_catalog_version()
+    cache_keys = [search_cache_key(request, version) for request in requests]
+    responses: list[SearchResponseSchema | None] = [None] * len(requests)
+    ranked: list[int] = []
+    for index, cache_key in enumerate(cache_keys):
+        cached = search_result_cache.get(cache_key)
+        if cached is not None:
+            responses[index] = cached_search_response(db, cached)
+        elif not is_browse_request(requests[index]):
+            ranked.append(index)
+
+    inputs: dict[int, SearchInputs] = {}
+    if ranked:
+        require_embedding_model()
+        timings: dict[str, float] = {}
+        prepared = await prepare_batch_inputs(
+            [requests[index].query_text for index in ranked], timings
+        )
+        inputs = dict(zip(ranked, prepared))
+        logger.info(f"Batch search pipeline timings (ms) for {len(ranked)} queries: {timings}")
+
+    for index, request in enumerate(requests):
+        if responses[index] is None:
+            response = await rank_assets(request, db, inputs.get(index))
+            search_result_cache.set(cache_keys[index], CachedSearchResult.from_response(response))
+            responses[index] = response
+    return [response for response in responses if response is not None]
+
+
+def search_where_clause(
+    filters: SearchFilterSchema,
+    parsed_filters: dict[str, Any],
+    location_coords: tuple[float, float] | None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    WHERE clause and bind params for the set of assets a search ranks: vectorized
+    assets matching the request filters, parsed bedrooms and the location radius.
+    """
     where_clauses = ["assets.asset_vector IS NOT NULL"]
-    params: dict[str, Any] = {
-        "query_vector": str(query_vector),
-        "search_text": semantic_text,
-        "limit": request.pagination.page_size,
-        "offset": (request.pagination.page - 1) * request.pagination.page_size,
-    }
+    params: dict[str, Any] = {}
 
     # Price filters
     if filters.price_min:
@@ -235,7 +586,7 @@ async def hybrid_search(
     if location_coords:
         where_clauses.append(
             "ST_DWithin("
-            "assets.location_geom::geography, "
+            "assets.location_geog, "
             "ST_SetSRID(ST_MakePoint(:lon, :lat), 4326)::geography, "
             ":radius_meters)"
         )
@@ -243,58 +594,270 @@ async def hybrid_search(
         params["lat"] = location_coords[0]
         params["radius_meters"] = GEOSPATIAL_RADIUS_METERS
 
-    # Combine WHERE clauses
-    if where_clauses:
-        where_string = " WHERE " + " AND ".join(where_clauses)
-        base_query += where_string
-        count_query += where_string
-
-    # Add ORDER BY (hybrid scoring) and pagination
-    final_query = text(
-        base_query
-        + " ORDER BY text_match_rank ASC, vector_distance ASC"
-        + " LIMIT :limit OFFSET :offset"
+    return "WHERE " + " AND ".join(where_clauses), params
+
+
+def is_browse_request(request: SearchRequestSchema | SearchFacetsRequestSchema) -> bool:
+    """No query text and no filters: a plain listing of all assets."""
+    filters = request.filters
+    has_query_text = bool(request.query_text and request.query_text.strip())
+    has_filters = bool(
+        filters.price_min
+        or filters.price_max
+        or filters.bedrooms_min
+        or filters.asset_type_id
     )
+    return not has_query_text and not has_filters
 
-    # Execute count query (using execute for raw SQL text queries)
-    # Only include params that are actually used in the count query
-    count_params: dict[str, Any] = {}
-    if filters.price_min:
-        count_params["price_min"] = filters.price_min
-    if filters.price_max:
-        count_params["price_max"] = filters.price_max
-    bedrooms = filters.bedrooms_min or parsed_filters.get("bedrooms_min")
-    if bedrooms:
-        count_params["bedrooms_min"] = bedrooms
-    if filters.asset_type_id:
-        count_params["asset_type_id"] = filters.asset_type_id
-    if location_coords:
-        count_params["lon"] = location_coords[1]
-        count_params["lat"] = location_coords[0]
-        count_params["radius_meters"] = GEOSPATIAL_RADIUS_METERS
-
-    total_count_statement = text(count_query).bindparams(**count_params)
-    total_count_result = db.exec(total_count_statement).scalar_one()
-    total_pages = (
-        total_count_result + request.pagination.page_size - 1
-    ) // request.pagination.page_size
-
-    # Execute main search query
-    final_statement = final_query.bindparams(**params)
-    results = db.exec(final_statement).fetchall()
-
-    # Format results
-    formatted_results = [
-        AssetResultSchema(
-            id=row[0],
-            asset_code=row[1],
-            name_th=row[2],
-            price=row[3],
-            image_url=mock_image_url(row[0], row[4]),
-            location_latitude=row[5],
-            location_longitude=row[6],
+
+async def rank_assets(
+    request: SearchRequestSchema, db: Session, inputs: SearchInputs | None = None
+) -> SearchResponseSchema:
+    """
+    Performs hybrid search combining:
+    - Vector similarity (pgvector)
+    - Lexical matching (pg_trgm word similarity over names and descriptions)
+    - Attribute filters (price, bedrooms, asset_type)
+    - Geospatial filters (PostGIS ST_DWithin)
+
+    Rows and the total count are fetched in one statement; see `SearchOptionsSchema`
+    for exact vs. capped totals and the ranking mode (lexical-first or fusion).
+    Pages are addressed by `page` or by an opaque `cursor` from the previous
+    response's `next_cursor`. With a latency budget, a late query parse is
+    skipped and the response is marked `speculative`.
+    If no query_text or filters are provided, returns all assets with pagination.
+    `inputs` carries pre-SQL stage results already computed by a batch.
+    """
+    filters = request.filters
+    count_mode = total_count_mode(request)
+
+    if is_browse_request(request):
+        from_where = "FROM asset AS assets"
+        simple_query = f"""
+            SELECT
+                assets.id,
+                assets.asset_code,
+                assets.name_th,
+                assets.price,
+                assets.images_main_id,
+                assets.location_latitude,
+                assets.location_longitude,
+                {total_count_column(from_where, count_mode)}
+            {from_where}
+        """
+
+        params: dict[str, Any] = {
+            "limit": request.pagination.page_size,
+            "offset": page_offset(request),
+        }
+
+        return build_search_response(
+            db, request, simple_query, from_where, params, ["id"], "search_all"
         )
-        for row in results
-    ]
 
-    return formatted_results, total_pages
+    require_embedding_model()
+
+    timings: dict[str, float] = {}
+    pipeline_start = time.perf_counter()
+    parse_applied = True
+    if inputs is None:
+        latency_budget_ms = (
+            request.options.latency_budget_ms or settings.search_latency_budget_ms
+        )
+        inputs, parse_applied = await prepare_search_inputs(
+            request.query_text,
+            timings,
+            parse_timeout=latency_budget_ms / 1000 if latency_budget_ms else None,
+        )
+    parsed_query, semantic_text, query_vector, location_coords = inputs
+
+    # Combine filters from request and parser
+    raw_parsed_filters = parsed_query.get("filters")
+    parsed_filters: dict[str, Any] = (
+        raw_parsed_filters if isinstance(raw_parsed_filters, dict) else {}
+    )
+
+    where_string, params = search_where_clause(filters, parsed_filters, location_coords)
+    params.update(
+        {
+            "query_vector": str(query_vector),
+            "search_text": semantic_text,
+            "limit": request.pagination.page_size,
+            "offset": page_offset(request),
+        }
+    )
+
+    # Shared FROM/WHERE for the page rows and the total count
+    from_clause = SEARCH_FROM_CLAUSE
+    from_where = f"{from_clause} {where_string}"
+
+    # Lexical candidates come from the pg_trgm GIN index on search_document
+    # (`<%` = word similarity above the session threshold); only those rows
+    # get a weighted name/document score.
+    params["weight_name"] = LEXICAL_WEIGHT_NAME
+    params["weight_document"] = LEXICAL_WEIGHT_DOCUMENT
+    lexical_match = (
+        ":search_text <% assets.search_document" if semantic_text.strip() else "false"
+    )
+
+    ranking = request.options.ranking
+    with_clause = ""
+    min_candidates = params["limit"] + params["offset"]
+    if ranking == "lexical_first":
+        # Every filtered row is ranked: lexical matches first, then vector distance
+        lexical_cte = f"""
+            WITH lexical AS (
+                SELECT assets.id, {LEXICAL_SCORE_SQL} AS lexical_score
+                FROM asset AS assets
+                WHERE {lexical_match}
+            )
+        """
+
+        # Build dynamic SQL query with hybrid scoring and fused total; ordering and
+        # pagination (offset or keyset on lexical/vector distance, id) are applied around it
+        final_query = f"""
+            {lexical_cte}
+            SELECT
+                assets.id,
+                assets.asset_code,
+                assets.name_th,
+                assets.price,
+                assets.images_main_id,
+                assets.location_latitude,
+                assets.location_longitude,
+                (assets.asset_vector <=> :query_vector) AS vector_distance,
+                1 - COALESCE(lexical.lexical_score, 0) AS lexical_distance,
+                {total_count_column(from_where, count_mode)}
+            {from_clause}
+            LEFT JOIN lexical ON lexical.id = assets.id
+            {where_string}
+        """
+        sort_columns = ["lexical_distance", "vector_distance", "id"]
+    else:
+        # Fusion: top-K from the HNSW index (or the in-process vector mirror) and
+        # top-K from the trigram index are fetched separately (each leg bounded)
+        # and merged by RRF or by a weighted sum of similarities. Paging covers
+        # the fused candidates only.
+        fusion_k = request.options.fusion_k or settings.search_fusion_k
+        params["fusion_k"] = fusion_k
+        min_candidates = max(min_candidates, fusion_k)
+        if ranking == "rrf":
+            params["rrf_k"] = RRF_K
+            fusion_score = (
+                "COALESCE(1.0 / (:rrf_k + vector_leg.vector_rank), 0)"
+                " + COALESCE(1.0 / (:rrf_k + lexical_leg.lexical_rank), 0)"
+            )
+        else:
+            params["fusion_weight_vector"] = FUSION_WEIGHT_VECTOR
+            params["fusion_weight_lexical"] = FUSION_WEIGHT_LEXICAL
+            fusion_score = (
+                ":fusion_weight_vector * (1 - COALESCE(vector_leg.vector_distance, 1))"
+                " + :fusion_weight_lexical * COALESCE(lexical_leg.lexical_score, 0)"
+            )
+
+        mirror = vector_mirror.current()
+        if mirror is not None:
+            # Exact top-K from the in-process mirror, passed in as arrays in rank order
+            mirror_ids, mirror_distances = await asyncio.to_thread(
+                mirror.top_k,
+                query_vector,
+                fusion_k,
+                price_min=params.get("price_min"),
+                price_max=params.get("price_max"),
+                bedrooms_min=params.get("bedrooms_min"),
+                asset_type_ids=params.get("asset_type_id"),
+                near=location_coords,
+                radius_meters=params.get("radius_meters"),
+            )
+            params["mirror_ids"] = mirror_ids.tolist()
+            params["mirror_distances"] = mirror_distances.tolist()
+            del params["query_vector"]
+            vector_leg = """
+                SELECT mirror.id, mirror.vector_distance, mirror.vector_rank
+                FROM unnest(
+                    CAST(:mirror_ids AS integer[]),
+                    CAST(:mirror_distances AS double precision[])
+                ) WITH ORDINALITY AS mirror(id, vector_distance, vector_rank)
+            """
+        else:
+            vector_leg = f"""
+                SELECT
+                    nearest.id,
+                    nearest.vector_distance,
+                    ROW_NUMBER() OVER (ORDER BY nearest.vector_distance, nearest.id)
+                        AS vector_rank
+                FROM ({nearest_assets_sql(from_where, "fusion_k")}) AS nearest
+            """
+            params.update(nearest_assets_params(fusion_k, query_vector))
+            min_candidates = max(min_candidates, vector_candidate_count(fusion_k))
+
+        with_clause = f"""
+            WITH vector_leg AS (
+                {vector_leg}
+            ),
+            lexical_leg AS (
+                SELECT
+                    matched.id,
+                    matched.lexical_score,
+                    ROW_NUMBER() OVER (ORDER BY matched.lexical_score DESC, matched.id)
+                        AS lexical_rank
+                FROM (
+                    SELECT assets.id, {LEXICAL_SCORE_SQL} AS lexical_score
+                    {from_where} AND {lexical_match}
+                    ORDER BY lexical_score DESC
+                    LIMIT :fusion_k
+                ) AS matched
+            ),
+            fused AS (
+                SELECT
+                    COALESCE(vector_leg.id, lexical_leg.id) AS id,
+                    {fusion_score} AS fusion_score
+                FROM vector_leg
+                FULL OUTER JOIN lexical_leg ON lexical_leg.id = vector_leg.id
+            )
+        """
+        fused_from = "FROM fused"
+        final_query = f"""
+            {with_clause}
+            SELECT
+                assets.id,
+                assets.asset_code,
+                assets.name_th,
+                assets.price,
+                assets.images_main_id,
+                assets.location_latitude,
+                assets.location_longitude,
+                -fused.fusion_score AS fusion_distance,
+                {total_count_column(fused_from, count_mode)}
+            FROM fused
+            JOIN asset AS assets ON assets.id = fused.id
+        """
+        from_where = fused_from
+        sort_columns = ["fusion_distance", "id"]
+
+    timings["pre_sql"] = round((time.perf_counter() - pipeline_start) * 1000, 2)
+
+    # Execute main search query (rows + total in one round-trip)
+    apply_vector_search_options(
+        db,
+        ef_search=request.options.ef_search,
+        min_candidates=min_candidates,
+        lexical_threshold=settings.lexical_similarity_threshold,
+    )
+    stage_start = time.perf_counter()
+    response = build_search_response(
+        db,
+        request,
+        final_query,
+        from_where,
+        params,
+        sort_columns,
+        f"search_{ranking}",
+        with_clause,
+    )
+    timings["query"] = round((time.perf_counter() - stage_start) * 1000, 2)
+    timings["total"] = round((time.perf_counter() - pipeline_start) * 1000, 2)
+    logger.info(f"Search pipeline timings (ms): {timings}")
+
+    response.speculative = not parse_applied
+    return response
@@ -0,0 +1,238 @@
+"""
+In-memory autocomplete index.
+Asset names, asset type names and gazetteer place names are kept, per kind,
+as a sorted array of normalized keys (each name from its start and from every
+later word), so a prefix lookup is a binary search plus a short scan. The
+index is built at warmup and rebuilt when the catalog version changes, always
+off the request path: requests keep using the previous snapshot (or get no
+suggestions before the first build) while a rebuild runs in the background.
+"""
+
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlmodel import Session, select
+
+from app.core.cache import normalize_text_key
+from app.core.config import settings
+from app.core.config.constants import SUGGEST_SCAN_LIMIT
+from app.core.config.logging import get_logger
+from app.db.database import engine
+from app.models.asset import Asset, AssetType
+from app.services.catalog_version import current_catalog_version
+from app.services.geocode_service import gazetteer
+
+logger = get_logger(__name__)
+
+SuggestionKind = Literal["location", "asset_type", "asset"]
+
+# Kinds in the order their matches are listed.
+KIND_ORDER: tuple[SuggestionKind, ...] = ("location", "asset_type", "asset")
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """A completion: display text, its kind, and the asset or asset type id if any."""
+
+    text: str
+    kind: SuggestionKind
+    id: int | None = None
+
+
+@dataclass(frozen=True)
+class PrefixTable:
+    """Sorted keys with, per key, the suggestion it belongs to and whether it starts mid-name."""
+
+    keys: list[str]
+    positions: list[int]
+    mid_name: list[bool]
+
+    @classmethod
+    def build(cls, names: list[tuple[int, str]]) -> "PrefixTable":
+        entries: list[tuple[str, int, bool]] = []
+        for position, name in names:
+            key = normalize_text_key(name)
+            offset = 0
+            for word in key.split(" "):
+                entries.append((key[offset:], position, offset > 0))
+                offset += len(word) + 1
+        entries.sort()
+        return cls(
+            keys=[entry[0] for entry in entries],
+            positions=[entry[1] for entry in entries],
+            mid_name=[entry[2] for entry in entries],
+        )
+
+    def matches(self, prefix: str) -> dict[int, bool]:
+        """Suggestion positions matching `prefix`, mapped to "only matched mid-name"."""
+        start = bisect_left(self.keys, prefix)
+        found: dict[int, bool] = {}
+        for index in range(start, min(start + SUGGEST_SCAN_LIMIT, len(self.keys))):
+            if not self.keys[index].startswith(prefix):
+                break
+            position = self.positions[index]
+            found[position] = found.get(position, True) and self.mid_name[index]
+        return found
+
+
+@dataclass(frozen=True)
+class SuggestSnapshot:
+    """All suggestions with one prefix table per kind."""
+
+    suggestions: list[Suggestion]
+    tables: dict[SuggestionKind, PrefixTable]
+    version: int
+    loaded_at: float
+
+    @classmethod
+    def build(
+        cls, suggestions: list[Suggestion], version: int, loaded_at: float
+    ) -> "SuggestSnapshot":
+        tables = {
+            kind: PrefixTable.build(
+                [
+                    (position, suggestion.text)
+                    for position, suggestion in enumerate(suggestions)
+                    if suggestion.kind == kind
+                ]
+            )
+            for kind in KIND_ORDER
+        }
+        return cls(suggestions=suggestions, tables=tables, version=version, loaded_at=loaded_at)
+
+    def __len__(self) -> int:
+        return len(self.suggestions)
+
+    def lookup(self, prefix: str, limit: int) -> list[Suggestion]:
+        """
+        Suggestions with a name or a later word starting with `prefix`: places
+        first, then asset types, then assets; within a kind whole-name matches
+        come before mid-name ones, shorter names first. Each table scans at most
+        `SUGGEST_SCAN_LIMIT` keys, which bounds the cost of very short prefixes.
+        """
+        prefix = normalize_text_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        results: list[Suggestion] = []
+        for kind in KIND_ORDER:
+            found = self.tables[kind].matches(prefix)
+            ranked = heapq.nsmallest(
+                limit - len(results),
+                found,
+                key=lambda position: (
+                    found[position],
+                    len(self.suggestions[position].text),
+                    self.suggestions[position].text,
+                ),
+            )
+            results.extend(self.suggestions[position] for position in ranked)
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+
+def collect_suggestions(db: Session) -> list[Suggestion]:
+    """Place names from the gazetteer, then asset type and asset names from the database."""
+    suggestions: list[Suggestion] = []
+    seen: set[tuple[str, str]] = set()
+
+    def add(text: str | None, kind: SuggestionKind, item_id: int | None = None) -> None:
+        text = " ".join((text or "").split())
+        if not text:
+            return
+        # Places and types are deduplicated by name; assets are kept per id.
+        dedupe_key = (kind, normalize_text_key(text))
+        if kind != "asset":
+            if dedupe_key in seen:
+                return
+            seen.add(dedupe_key)
+        suggestions.append(Suggestion(text=text, kind=kind, id=item_id))
+
+    for entry in set(gazetteer.values()):
+        add(entry.name_th, "location")
+        add(entry.name_en, "location")
+    for type_id, name_th, name_en in db.exec(
+        select(AssetType.id, AssetType.name_th, AssetType.name_en)
+    ).all():
+        add(name_th, "asset_type", type_id)
+        add(name_en, "asset_type", type_id)
+    for asset_id, name_th, name_en in db.exec(select(Asset.id, Asset.name_th, Asset.name_en)).all():
+        add(name_th, "asset", asset_id)
+        if name_en and normalize_text_key(name_en) != normalize_text_key(name_th or ""):
+            add(name_en, "asset", asset_id)
+    return suggestions
+
+
+class SuggestIndex:
+    """
+    Holds the current `SuggestSnapshot`. It rebuilds after the catalog version
+    changes, or once the snapshot is older than `suggest_index_max_age_seconds`
+    (which covers writes that did not bump the catalog version). Builds run in
+    warmup or on a background thread, never in a request.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: SuggestSnapshot | None = None
+        self._lock = threading.Lock()
+        self._rebuilding = False
+
+    def load(self, db: Session) -> SuggestSnapshot:
+        start = time.perf_counter()
+        # Read the version first so writes racing with the load trigger another rebuild.
+        version = current_catalog_version()
+        snapshot = SuggestSnapshot.build(collect_suggestions(db), version, time.monotonic())
+        self._snapshot = snapshot
+        logger.info(
+            f"Built suggest index with {len(snapshot)} names "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return snapshot
+
+    def is_current(self, snapshot: SuggestSnapshot | None) -> bool:
+        max_age = settings.suggest_index_max_age_seconds
+        return (
+            snapshot is not None
+            and snapshot.version == current_catalog_version()
+            and not (max_age and time.monotonic() - snapshot.loaded_at > max_age)
+        )
+
+    def rebuild(self) -> None:
+        try:
+            with Session(engine) as session:
+                self.load(session)
+        except Exception as e:
+            logger.error(f"Could not rebuild suggest index: {e}")
+        finally:
+            self._rebuilding = False
+
+    def claim_rebuild(self) -> bool:
+        """Mark a rebuild as running; False when one already is."""
+        with self._lock:
+            if self._rebuilding:
+                return False
+            self._rebuilding = True
+            return True
+
+    def current(self) -> SuggestSnapshot | None:
+        """
+        Return the latest snapshot without blocking, or None before the first
+        build; missing or stale snapshots are rebuilt in the background.
+        """
+        snapshot = self._snapshot
+        if not self.is_current(snapshot) and self.claim_rebuild():
+            threading.Thread(target=self.rebuild, name="suggest-index-rebuild", daemon=True).start()
+        return snapshot
+
+
+suggest_index = SuggestIndex()
+
+
+def warm_suggest_index() -> None:
+    """Startup hook: build the index before the first keystroke needs it."""
+    if suggest_index.claim_rebuild():
+        suggest_index.rebuild()
@@ -0,0 +1,268 @@
+"""
+In-process vector index mirror.
+Keeps every asset vector (unit-normalized, one contiguous float32 matrix) and
+the attributes search filters on as numpy arrays. The vector + filter part of
+search and user recommendations becomes an exact in-memory top-k, and only
+the final ids go to Postgres for hydration. Off unless `vector_mirror_enabled`.
+"""
+
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.config.constants import EARTH_RADIUS_METERS, EMBEDDING_DIMENSION
+from app.core.config.logging import get_logger
+from app.db.database import engine
+from app.models.asset import Asset
+from app.services.catalog_version import changes_since, current_catalog_version
+
+logger = get_logger(__name__)
+
+MIRROR_COLUMNS = (
+    Asset.id,
+    Asset.asset_vector,
+    Asset.price,
+    Asset.bedrooms,
+    Asset.asset_type_id,
+    Asset.location_latitude,
+    Asset.location_longitude,
+)
+
+
+def haversine_meters(
+    latitude: np.ndarray, longitude: np.ndarray, origin_lat: float, origin_lon: float
+) -> np.ndarray:
+    """Great-circle distance from an origin; all angles in radians, NaN stays NaN."""
+    half_dlat = (latitude - origin_lat) / 2
+    half_dlon = (longitude - origin_lon) / 2
+    a = np.sin(half_dlat) ** 2 + np.cos(latitude) * np.cos(origin_lat) * np.sin(half_dlon) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+@dataclass(frozen=True)
+class MirrorSnapshot:
+    """
+    Column arrays for one catalog version. Snapshots are never mutated; a
+    refresh builds a new one, so readers need no lock.
+    """
+
+    version: int
+    loaded_at: float
+    ids: np.ndarray  # int64
+    vectors: np.ndarray  # float32 (n, EMBEDDING_DIMENSION), unit rows; NaN for zero vectors
+    price: np.ndarray  # float64, NaN when unknown
+    bedrooms: np.ndarray  # float64, NaN when unknown
+    asset_type_id: np.ndarray  # int64, -1 when unknown
+    latitude: np.ndarray  # float64 radians, NaN when unknown
+    longitude: np.ndarray  # float64 radians, NaN when unknown
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], version: int, loaded_at: float) -> "MirrorSnapshot":
+        """Build a snapshot from rows selected with `MIRROR_COLUMNS`."""
+        count = len(rows)
+        vectors = np.empty((count, EMBEDDING_DIMENSION), dtype=np.float32)
+        for index, row in enumerate(rows):
+            vectors[index] = row[1]
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        # pgvector gives NaN cosine distance for zero vectors; NaN rows rank last here too.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vectors /= norms
+
+        def column(position: int, dtype: Any, missing: Any) -> np.ndarray:
+            return np.array(
+                [missing if row[position] is None else row[position] for row in rows],
+                dtype=dtype,
+            )
+
+        return cls(
+            version=version,
+            loaded_at=loaded_at,
+            ids=column(0, np.int64, -1),
+            vectors=vectors,
+            price=column(2, np.float64, np.nan),
+            bedrooms=column(3, np.float64, np.nan),
+            asset_type_id=column(4, np.int64, -1),
+            latitude=np.radians(column(5, np.float64, np.nan)),
+            longitude=np.radians(column(6, np.float64, np.nan)),
+        )
+
+    def patched(self, changed_ids: frozenset[int], fresh: "MirrorSnapshot") -> "MirrorSnapshot":
+        """Drop rows for `changed_ids` and append their re-read versions from `fresh`."""
+        keep = ~np.isin(self.ids, np.fromiter(changed_ids, dtype=np.int64))
+        arrays = {
+            name: np.concatenate([getattr(self, name)[keep], getattr(fresh, name)])
+            for name in (field.name for field in fields(self))
+            if name not in ("version", "loaded_at")
+        }
+        return replace(self, version=fresh.version, **arrays)
+
+    def top_k(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        price_min: float | None = None,
+        price_max: float | None = None,
+        bedrooms_min: int | None = None,
+        asset_type_ids: Sequence[int] | None = None,
+        near: tuple[float, float] | None = None,
+        radius_meters: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Exact cosine top-k as (ids, distances) among rows passing the filters,
+        in the order of SQL `ORDER BY asset_vector <=> :query_vector, id`.
+        `near` is (lat, lon) in degrees and keeps rows within `radius_meters`.
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if k <= 0 or norm == 0 or len(self) == 0:
+            return empty
+
+        mask = np.ones(len(self), dtype=bool)
+        if price_min is not None:
+            mask &= self.price >= price_min
+        if price_max is not None:
+            mask &= self.price <= price_max
+        if bedrooms_min is not None:
+            mask &= self.bedrooms >= bedrooms_min
+        if asset_type_ids:
+            mask &= np.isin(self.asset_type_id, np.asarray(asset_type_ids, dtype=np.int64))
+        if near is not None and radius_meters is not None:
+            origin_lat, origin_lon = np.radians(near[0]), np.radians(near[1])
+            mask &= haversine_meters(self.latitude, self.longitude, origin_lat, origin_lon) <= (
+                radius_meters
+            )
+
+        if mask.all():
+            candidates = np.arange(len(self))
+            matrix = self.vectors
+        else:
+            candidates = np.flatnonzero(mask)
+            if candidates.size == 0:
+                return empty
+            matrix = self.vectors[candidates]
+
+        distances = 1.0 - (matrix @ (query / norm)).astype(np.float64)
+        distances = np.nan_to_num(distances, nan=np.inf)
+        if candidates.size > k:
+            # Keep every row tied with the k-th distance so the id tie-break matches SQL.
+            kth = np.partition(distances, k - 1)[k - 1]
+            within = np.flatnonzero(distances <= kth)
+            candidates, distances = candidates[within], distances[within]
+        order = np.lexsort((self.ids[candidates], distances))[:k]
+        return self.ids[candidates[order]], distances[order]
+
+
+class VectorMirror:
+    """
+    Holds the current `MirrorSnapshot`. It refreshes only the rows named in the
+    catalog changelog, and reloads in full after bulk writes or when the
+    snapshot is older than `vector_mirror_max_age_seconds`. The age limit
+    covers writes that did not bump the catalog version. Refreshes run on a background thread
+    while the previous snapshot keeps serving; until the first load finishes,
+    callers get None and use the SQL path.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: MirrorSnapshot | None = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
+    def fetch_rows(self, db: Session, asset_ids: frozenset[int] | None = None) -> list[Any]:
+        stmt = select(*MIRROR_COLUMNS).where(Asset.asset_vector.is_not(None))
+        if asset_ids is not None:
+            stmt = stmt.where(Asset.id.in_(asset_ids))
+        return list(db.exec(stmt).all())
+
+    def load(self, db: Session) -> MirrorSnapshot:
+        """Read every vectorized asset into a new snapshot."""
+        start = time.perf_counter()
+        # Read the version first so writes racing with the load trigger a refresh.
+        version = current_catalog_version()
+        snapshot = MirrorSnapshot.from_rows(self.fetch_rows(db), version, time.monotonic())
+        self._snapshot = snapshot
+        logger.info(
+            f"Loaded vector mirror with {len(snapshot)} assets "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return snapshot
+
+    def is_current(self, snapshot: MirrorSnapshot | None) -> bool:
+        max_age = settings.vector_mirror_max_age_seconds
+        return (
+            snapshot is not None
+            and snapshot.version == current_catalog_version()
+            and not (max_age and time.monotonic() - snapshot.loaded_at > max_age)
+        )
+
+    def refresh_now(self, db: Session) -> MirrorSnapshot:
+        """Blocking refresh: patch changed rows, or reload in full when that is not possible."""
+        with self._refresh_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and self.is_current(snapshot):
+                return snapshot
+            max_age = settings.vector_mirror_max_age_seconds
+            if snapshot is None or (max_age and time.monotonic() - snapshot.loaded_at > max_age):
+                return self.load(db)
+
+            changed = changes_since(snapshot.version)
+            if changed is None:
+                return self.load(db)
+            version = current_catalog_version()
+            fresh = MirrorSnapshot.from_rows(
+                self.fetch_rows(db, changed), version, snapshot.loaded_at
+            )
+            self._snapshot = snapshot.patched(changed, fresh)
+            logger.debug(f"Refreshed {len(changed)} assets in vector mirror (v{version})")
+            return self._snapshot
+
+    def refresh(self) -> None:
+        try:
+            with Session(engine) as session:
+                self.refresh_now(session)
+        except Exception as e:
+            logger.error(f"Could not refresh vector mirror: {e}")
+        finally:
+            self._refreshing = False
+
+    def current(self) -> MirrorSnapshot | None:
+        """
+        Return the latest snapshot without blocking, or None when disabled or not
+        loaded yet; a stale snapshot is served while it refreshes in the background.
+        """
+        if not settings.vector_mirror_enabled:
+            return None
+        snapshot = self._snapshot
+        if not self.is_current(snapshot):
+            with self._lock:
+                if not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(
+                        target=self.refresh, name="vector-mirror-refresh", daemon=True
+                    ).start()
+        return snapshot
+
+
+vector_mirror = VectorMirror()
+
+
+def warm_vector_mirror() -> None:
+    """Startup hook: build the snapshot before the first request needs it."""
+    if not settings.vector_mirror_enabled:
+        return
+    try:
+        with Session(engine) as session:
+            vector_mirror.refresh_now(session)
+    except Exception as e:
+        logger.error(f"Could not load vector mirror; it will load on first use: {e}")
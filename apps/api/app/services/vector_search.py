@@ -0,0 +1,150 @@
+"""
+Search index session helpers.
+Applies pgvector HNSW (and pg_trgm) search parameters to the current
+transaction so callers can trade recall for latency per request, and builds
+nearest-neighbour subqueries over full, compact (quantized) or projected
+vector indexes.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.sql import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.config.constants import (
+    ASSET_VECTOR_INDEXES,
+    EMBEDDING_DIMENSION,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH_MAX,
+    HNSW_M,
+)
+from app.services.projection import embedding_projection, project_vector
+
+# Indexed expression and operator class per candidate mode (see `vector_index_ddl`).
+VECTOR_INDEX_COLUMNS = {
+    "full": "asset_vector vector_cosine_ops",
+    "halfvec": f"(asset_vector::halfvec({EMBEDDING_DIMENSION})) halfvec_cosine_ops",
+    "binary": f"(binary_quantize(asset_vector)::bit({EMBEDDING_DIMENSION})) bit_hamming_ops",
+    "projected": "asset_vector_reduced vector_cosine_ops",
+}
+
+# Compact distances matching the HNSW expression indexes on asset.asset_vector;
+# the ORDER BY must repeat the indexed expression exactly.
+COMPACT_DISTANCE_SQL = {
+    "halfvec": (
+        f"(assets.asset_vector::halfvec({EMBEDDING_DIMENSION}))"
+        f" <=> CAST(:query_vector AS halfvec({EMBEDDING_DIMENSION}))"
+    ),
+    "binary": (
+        f"(binary_quantize(assets.asset_vector)::bit({EMBEDDING_DIMENSION}))"
+        f" <~> binary_quantize(CAST(:query_vector AS vector({EMBEDDING_DIMENSION})))"
+    ),
+    # PCA-projected column with its own HNSW index (migration e5b8c1d2a7f4)
+    "projected": "assets.asset_vector_reduced <=> :query_vector_reduced",
+}
+
+
+def candidate_mode(mode: str | None = None) -> str:
+    """Requested candidate mode, falling back to `full` when no projection is loaded."""
+    mode = mode or settings.vector_candidate_mode
+    if mode == "projected" and embedding_projection is None:
+        return "full"
+    return mode
+
+
+def vector_candidate_count(limit: int, mode: str | None = None) -> int:
+    """Rows the index scan must produce: `limit`, or the re-rank shortlist in compact modes."""
+    mode = candidate_mode(mode)
+    return limit if mode == "full" else limit * settings.vector_rerank_factor
+
+
+def vector_index_ddl(mode: str, concurrently: bool = False) -> str:
+    """`CREATE INDEX` statement for the HNSW index serving candidate `mode`."""
+    return (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        f"{ASSET_VECTOR_INDEXES[mode]} ON asset USING hnsw ({VECTOR_INDEX_COLUMNS[mode]}) "
+        f"WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    )
+
+
+def nearest_assets_params(
+    limit: int, query_vector: Sequence[float], mode: str | None = None
+) -> dict[str, Any]:
+    """
+    Extra bind parameters for `nearest_assets_sql`: the shortlist size in compact
+    modes, plus the projected query vector in `projected` mode.
+    """
+    mode = candidate_mode(mode)
+    if mode == "full":
+        return {}
+    params: dict[str, Any] = {"vector_shortlist": vector_candidate_count(limit, mode)}
+    if mode == "projected":
+        params["query_vector_reduced"] = str(project_vector(query_vector))
+    return params
+
+
+def nearest_assets_sql(from_where: str, limit_param: str, mode: str | None = None) -> str:
+    """
+    Subquery of (id, vector_distance) for the `limit_param` assets nearest to
+    `:query_vector` by full-precision cosine distance. `full` mode orders by the
+    float32 distance (an HNSW scan only if its index was built, else exact);
+    `halfvec`/`binary`/`projected` take `:vector_shortlist` candidates (see
+    `vector_candidate_count`) from a much smaller index and re-rank only those
+    with the full vectors.
+    """
+    mode = candidate_mode(mode)
+    exact_distance = "(assets.asset_vector <=> :query_vector)"
+    if mode == "full":
+        return f"""
+            SELECT assets.id, {exact_distance} AS vector_distance
+            {from_where}
+            ORDER BY assets.asset_vector <=> :query_vector
+            LIMIT :{limit_param}
+        """
+    return f"""
+        SELECT shortlist.id, shortlist.vector_distance
+        FROM (
+            SELECT assets.id, {exact_distance} AS vector_distance
+            {from_where}
+            ORDER BY {COMPACT_DISTANCE_SQL[mode]}
+            LIMIT :vector_shortlist
+        ) AS shortlist
+        ORDER BY shortlist.vector_distance, shortlist.id
+        LIMIT :{limit_param}
+    """
+
+
+def apply_vector_search_options(
+    db: Session,
+    ef_search: int | None = None,
+    min_candidates: int = 0,
+    lexical_threshold: float | None = None,
+) -> int:
+    """
+    Set `hnsw.ef_search` (and `hnsw.iterative_scan` when configured) for the
+    current transaction only, via `set_config(..., is_local => true)`.
+
+    `ef_search` is raised to at least `min_candidates` (capped at the pgvector
+    maximum) because an HNSW scan never returns more rows than its candidate
+    list; callers pass `LIMIT + OFFSET` so deep pages are not silently cut short.
+    `lexical_threshold` sets `pg_trgm.word_similarity_threshold` (used by `<%`) in
+    the same round-trip. Returns the effective `ef_search`.
+    """
+    effective = max(ef_search or settings.hnsw_ef_search, min_candidates)
+    effective = min(effective, HNSW_EF_SEARCH_MAX)
+
+    statements = ["set_config('hnsw.ef_search', :ef_search, true)"]
+    params: dict[str, Any] = {"ef_search": str(effective)}
+    if settings.hnsw_iterative_scan:
+        statements.append("set_config('hnsw.iterative_scan', :iterative_scan, true)")
+        params["iterative_scan"] = settings.hnsw_iterative_scan
+    if lexical_threshold is not None:
+        statements.append(
+            "set_config('pg_trgm.word_similarity_threshold', :lexical_threshold, true)"
+        )
+        params["lexical_threshold"] = str(lexical_threshold)
+
+    db.exec(text("SELECT " + ", ".join(statements)).bindparams(**params))
+    return effective
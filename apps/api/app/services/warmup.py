@@ -0,0 +1,145 @@
+"""
+Startup warmup and readiness.
+The app lifespan runs `warm_up` as a background task, so the worker answers
+liveness probes (`GET /health`) as soon as it boots. Warmup loads the
+embedding model, builds the chat chains and the in-memory snapshots in
+parallel threads, runs a dummy encode and asks Ollama to load its models.
+`GET /health/ready` reports ready once every stage has finished and the
+embedding stage succeeded; failures of other stages only degrade their
+features. With `startup_ready_after_embedding` the worker turns ready as
+soon as the embedding stage succeeds, while the rest finish in the background.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Literal
+
+import httpx
+
+from app.core.config import settings
+from app.core.config.constants import (
+    LLM_MODEL_NAME,
+    OLLAMA_PRELOAD_TIMEOUT_SECONDS,
+    PARSER_MODEL_NAME,
+)
+from app.core.config.logging import get_logger
+from app.services.ai_chat_service import init_ai_chat_service
+from app.services.chat_service import init_chat_service
+from app.services.embedding import get_embedding_model
+from app.services.embedding_dispatcher import embedding_dispatcher
+from app.services.ollama_client import start_ollama_client
+from app.services.suggest_index import warm_suggest_index
+from app.services.vector_mirror import warm_vector_mirror
+
+logger = get_logger(__name__)
+
+# Thai and English texts so both tokenizer paths are exercised before traffic.
+WARMUP_TEXTS = ("คอนโด ใกล้ BTS อโศก", "house near the river")
+# Search and asset writes cannot work without embeddings; other stages only degrade.
+EMBEDDING_STAGE = "embedding"
+
+
+@dataclass
+class Readiness:
+    """Warmup progress: wall time per stage (ms) and errors of stages that failed."""
+
+    ready: bool = False
+    finished: bool = False
+    started_at: float = field(default_factory=time.perf_counter)
+    ready_ms: float | None = None
+    startup_ms: float | None = None
+    stages: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def status(self) -> Literal["starting", "ready", "failed"]:
+        if self.ready:
+            return "ready"
+        return "failed" if EMBEDDING_STAGE in self.errors else "starting"
+
+
+readiness = Readiness()
+
+
+async def run_stage(name: str, stage: Callable[[], Awaitable[object]]) -> None:
+    """Run one warmup stage, recording its duration; failures are logged, not raised."""
+    start = time.perf_counter()
+    try:
+        await stage()
+    except Exception as e:
+        readiness.errors[name] = str(e) or type(e).__name__
+        logger.error(f"Startup stage '{name}' failed: {e}")
+    finally:
+        readiness.stages[name] = round((time.perf_counter() - start) * 1000, 2)
+
+
+async def load_embedding() -> None:
+    if await asyncio.to_thread(get_embedding_model) is None:
+        raise RuntimeError("Embedding model could not be loaded.")
+    # The first encodes pay for lazy kernel and tokenizer setup; do them before traffic.
+    await asyncio.gather(*(embedding_dispatcher.encode(text) for text in WARMUP_TEXTS))
+
+
+async def preload_ollama_models() -> None:
+    """
+    Ask Ollama to load the chat and parser models (a generate call without a
+    prompt). Bypasses the parser's circuit breaker, so a slow cold load does
+    not count as an outage.
+    """
+    client = start_ollama_client()
+    for model in dict.fromkeys((PARSER_MODEL_NAME, LLM_MODEL_NAME)):
+        try:
+            response = await client.post(
+                "/api/generate",
+                json={"model": model, "stream": False},
+                timeout=OLLAMA_PRELOAD_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Could not preload Ollama model {model}: {e}") from e
+        logger.info(f"Ollama model {model} loaded")
+
+
+def mark_ready() -> None:
+    readiness.ready = EMBEDDING_STAGE not in readiness.errors
+    readiness.ready_ms = round((time.perf_counter() - readiness.started_at) * 1000, 2)
+    logger.info(f"Worker {readiness.status} after {readiness.ready_ms} ms")
+
+
+async def warm_up() -> None:
+    """
+    Load models and snapshots in parallel and mark the worker ready once all
+    stages finish (or, with `startup_ready_after_embedding`, once the
+    embedding stage does).
+    """
+    stages: dict[str, Callable[[], Awaitable[object]]] = {
+        EMBEDDING_STAGE: load_embedding,
+        "chat": lambda: asyncio.to_thread(init_chat_service),
+        "ai_chat": lambda: asyncio.to_thread(init_ai_chat_service),
+        "vector_mirror": lambda: asyncio.to_thread(warm_vector_mirror),
+        "suggest_index": lambda: asyncio.to_thread(warm_suggest_index),
+    }
+    if settings.startup_preload_ollama:
+        stages["ollama"] = preload_ollama_models
+
+    tasks = {name: asyncio.create_task(run_stage(name, stage)) for name, stage in stages.items()}
+    try:
+        if settings.startup_ready_after_embedding:
+            await tasks[EMBEDDING_STAGE]
+            mark_ready()
+        await asyncio.gather(*tasks.values())
+    finally:
+        # Shutdown cancels warmup; stop the stages still running with it.
+        for task in tasks.values():
+            task.cancel()
+    if not settings.startup_ready_after_embedding:
+        mark_ready()
+
+    readiness.startup_ms = round((time.perf_counter() - readiness.started_at) * 1000, 2)
+    readiness.finished = True
+    logger.info(
+        f"Startup warmup finished in {readiness.startup_ms} ms "
+        f"(ready={readiness.ready}, stages={readiness.stages})"
+    )
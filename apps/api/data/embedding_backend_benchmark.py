@@ -0,0 +1,112 @@
+"""CLI script to compare embedding backends: latency, throughput and agreement with PyTorch."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.services.embedding import load_embedding_model
+from app.services.ingest_service import build_doc
+
+DATA_DIR = Path(__file__).resolve().parent
+DEFAULT_ONNX_PATH = DATA_DIR / "embedding_onnx"
+
+
+def load_texts(limit: int) -> tuple[list[str], list[str]]:
+    """Asset documents (ingest-style) and short search queries from the bundled data."""
+    with (DATA_DIR / "assets_rows.json").open("r", encoding="utf-8") as file:
+        documents = [build_doc(row) for row in json.load(file)][:limit]
+    with (DATA_DIR / "parser_labeled_queries.json").open("r", encoding="utf-8") as file:
+        queries = [item["query"] for item in json.load(file)][:limit]
+    return documents, queries
+
+
+def encode(model, texts: list[str], batch_size: int) -> np.ndarray:
+    return model.encode(
+        texts, batch_size=batch_size, show_progress_bar=False, normalize_embeddings=True
+    )
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Embedding backend benchmark")
+    parser.add_argument("--texts", type=int, default=256, help="Documents and queries to encode")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--onnx-path", default=str(DEFAULT_ONNX_PATH))
+    parser.add_argument(
+        "--onnx-files",
+        nargs="*",
+        default=["onnx/model.onnx"],
+        help="ONNX files inside --onnx-path to compare, e.g. onnx/model_qint8_avx512_vnni.onnx",
+    )
+    parser.add_argument("--threads", type=int, default=None, help="ONNX intra-op threads")
+    args = parser.parse_args()
+
+    # Without a local export, the hub model is exported to ONNX on load.
+    onnx_path = args.onnx_path if Path(args.onnx_path).exists() else None
+    documents, queries = load_texts(args.texts)
+    if not documents:
+        print("No asset documents to encode.")
+        return
+
+    backends = [("torch", lambda: load_embedding_model("torch"))]
+    for onnx_file in args.onnx_files:
+        backends.append(
+            (
+                f"onnx:{onnx_file}",
+                lambda onnx_file=onnx_file: load_embedding_model(
+                    "onnx", onnx_path, onnx_file, args.threads
+                ),
+            )
+        )
+
+    print(
+        f"{len(documents)} documents (batch {args.batch_size}), {len(queries)} single queries, "
+        f"onnx threads={args.threads or 'default'}"
+    )
+    print(
+        f"{'backend':<42} {'load s':>7} {'docs/s':>8} {'q p50 ms':>9} {'q p95 ms':>9} "
+        f"{'cos mean':>9} {'cos min':>8}"
+    )
+    reference: np.ndarray | None = None
+    for name, load in backends:
+        start = time.perf_counter()
+        try:
+            model = load()
+        except Exception as e:
+            print(f"{name:<42} failed to load: {e}")
+            continue
+        load_seconds = time.perf_counter() - start
+
+        encode(model, documents[: args.batch_size], args.batch_size)  # warm up
+        start = time.perf_counter()
+        vectors = encode(model, documents, args.batch_size)
+        throughput = len(documents) / (time.perf_counter() - start)
+
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            encode(model, [query], 1)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        if reference is None:
+            reference = vectors
+        agreement = np.sum(vectors * reference, axis=1)
+        print(
+            f"{name:<42} {load_seconds:>7.1f} {throughput:>8.1f} "
+            f"{statistics.median(latencies):>9.2f} {percentile(latencies, 0.95):>9.2f} "
+            f"{agreement.mean():>9.5f} {agreement.min():>8.5f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""CLI script to export the embedding model to ONNX, optionally with int8 quantization."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from app.core.config.constants import EMBEDDING_MODEL_NAME
+from app.services.embedding import load_embedding_model
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "embedding_onnx"
+QUANTIZATION_CONFIGS = ("arm64", "avx2", "avx512", "avx512_vnni")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the embedding model to ONNX")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Model directory")
+    parser.add_argument(
+        "--quantize",
+        choices=QUANTIZATION_CONFIGS,
+        default=None,
+        help="Also write a dynamically int8-quantized model for this CPU instruction set",
+    )
+    args = parser.parse_args()
+
+    # Loading on the ONNX backend exports the model when no ONNX file exists yet.
+    model = load_embedding_model("onnx")
+    model.save_pretrained(str(args.output))
+    print(f"Exported {EMBEDDING_MODEL_NAME} to {args.output / 'onnx' / 'model.onnx'}")
+
+    file_name = "onnx/model.onnx"
+    if args.quantize:
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        export_dynamic_quantized_onnx_model(
+            model, quantization_config=args.quantize, model_name_or_path=str(args.output)
+        )
+        file_name = f"onnx/model_qint8_{args.quantize}.onnx"
+        print(f"Wrote int8-quantized model {args.output / file_name}")
+
+    print(
+        "Serve it with:\n"
+        "  EMBEDDING_BACKEND=onnx\n"
+        f"  EMBEDDING_ONNX_PATH={args.output}\n"
+        f"  EMBEDDING_ONNX_FILE={file_name}\n"
+        "Compare against PyTorch first with `python -m data.embedding_backend_benchmark`."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""CLI script to fit the PCA embedding projection and backfill asset_vector_reduced."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy.sql import text
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.config.constants import INGESTION_BATCH_SIZE
+from app.db.database import engine
+from app.models.asset import Asset
+from app.services.projection import EmbeddingProjection, projection_path
+
+
+def report(vectors: np.ndarray, reduced: np.ndarray, queries: int, k: int) -> None:
+    """Shortlist recall and brute-force distance timing, full vs. projected vectors."""
+    rng = np.random.default_rng(0)
+    full = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sample = rng.choice(len(full), size=min(queries, len(full)), replace=False)
+    shortlist = k * settings.vector_rerank_factor
+
+    recalls = []
+    full_seconds = reduced_seconds = 0.0
+    for position in sample:
+        start = time.perf_counter()
+        exact = np.argsort(full @ -full[position])[:k]
+        full_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        candidates = np.argsort(reduced @ -reduced[position])[:shortlist]
+        reduced_seconds += time.perf_counter() - start
+        recalls.append(len(np.intersect1d(exact, candidates)) / k)
+
+    print(
+        f"Shortlist recall@{k} (top {shortlist} projected, then exact re-rank): "
+        f"{np.mean(recalls):.4f} over {len(sample)} queries"
+    )
+    print(
+        f"Brute-force scan per query: full {full_seconds / len(sample) * 1000:.2f} ms, "
+        f"projected {reduced_seconds / len(sample) * 1000:.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fit PCA projection for asset embeddings")
+    parser.add_argument("--output", type=Path, default=projection_path)
+    parser.add_argument(
+        "--no-backfill", action="store_true", help="Only fit and save the projection"
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Queries for the recall report")
+    parser.add_argument("--k", type=int, default=20)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        rows = session.exec(
+            select(Asset.id, Asset.asset_vector).where(Asset.asset_vector.is_not(None))
+        ).all()
+        if not rows:
+            print("No vectorized assets to fit a projection on.")
+            return
+
+        vectors = np.array([row[1] for row in rows], dtype=np.float32)
+        try:
+            projection, explained = EmbeddingProjection.fit(vectors)
+        except ValueError as e:
+            print(f"Cannot fit projection: {e}")
+            return
+        projection.save(args.output)
+        print(
+            f"Fitted {projection.components.shape[0]}-dim projection on {len(rows)} assets "
+            f"({explained:.1%} variance explained), saved to {args.output}"
+        )
+
+        reduced = projection.project_many(vectors)
+        report(vectors, reduced, args.queries, args.k)
+
+        if args.no_backfill:
+            return
+        update = text(
+            "UPDATE asset SET asset_vector_reduced = CAST(:vector AS vector) WHERE id = :id"
+        )
+        for offset in range(0, len(rows), INGESTION_BATCH_SIZE):
+            batch = [
+                {"id": row[0], "vector": str(vector.tolist())}
+                for row, vector in zip(
+                    rows[offset : offset + INGESTION_BATCH_SIZE],
+                    reduced[offset : offset + INGESTION_BATCH_SIZE],
+                )
+            ]
+            session.execute(update, batch)
+            session.commit()
+        print(f"Backfilled asset_vector_reduced for {len(rows)} assets.")
+        print("Restart API workers to load the new projection; build its index and compare with")
+        print("  python -m data.vector_index --mode projected --keep-others")
+        print("  python -m data.vector_recall_benchmark --modes halfvec projected")
+
+
+if __name__ == "__main__":
+    main()
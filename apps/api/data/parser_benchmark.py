@@ -0,0 +1,107 @@
+"""CLI script to compare the rule-based query parser with the LLM parser on labeled queries."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+from app.services.parser_service import request_ollama_parse
+from app.services.rule_parser import parse_rules
+
+LABELED_QUERIES_PATH = Path(__file__).resolve().parent / "parser_labeled_queries.json"
+FIELDS = ("location_text", "bedrooms_min", "price_min", "price_max", "asset_type_id")
+
+
+def field_values(parsed: dict[str, Any] | None) -> dict[str, Any]:
+    parsed = parsed or {}
+    filters = parsed.get("filters") if isinstance(parsed.get("filters"), dict) else {}
+    values = {field: filters.get(field) for field in FIELDS}
+    values["location_text"] = parsed.get("location_text")
+    if values["asset_type_id"] is not None:
+        values["asset_type_id"] = sorted(values["asset_type_id"])
+    return values
+
+
+def correct_fields(parsed: dict[str, Any] | None, expected: dict[str, Any]) -> dict[str, bool]:
+    got = field_values(parsed)
+    want = field_values(expected)
+    return {field: got[field] == want[field] for field in FIELDS}
+
+
+def report(name: str, results: list[dict[str, bool]], latencies: list[float]) -> None:
+    if not results:
+        print(f"{name:<10} no queries")
+        return
+    accuracy = " ".join(
+        f"{statistics.mean(result[field] for result in results):>13.2f}" for field in FIELDS
+    )
+    exact = statistics.mean(all(result.values()) for result in results)
+    print(
+        f"{name:<10} {len(results):>4} {accuracy} {exact:>7.2f} "
+        f"{statistics.median(latencies):>9.3f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    with Path(args.queries).open("r", encoding="utf-8") as file:
+        labeled = json.load(file)
+
+    rule_results: list[dict[str, bool]] = []
+    rule_latencies: list[float] = []
+    fast_results: list[dict[str, bool]] = []
+    fast_latencies: list[float] = []
+    llm_results: list[dict[str, bool]] = []
+    llm_latencies: list[float] = []
+    for item in labeled:
+        start = time.perf_counter()
+        rule = parse_rules(item["query"])
+        elapsed = (time.perf_counter() - start) * 1000
+        result = correct_fields(rule.parsed, item)
+        rule_results.append(result)
+        rule_latencies.append(elapsed)
+        if rule.confidence >= args.min_confidence:
+            fast_results.append(result)
+            fast_latencies.append(elapsed)
+        if args.verbose:
+            wrong = ", ".join(field for field, ok in result.items() if not ok)
+            print(f"{rule.confidence:.3f} {item['query']} {'wrong: ' + wrong if wrong else ''}")
+
+        if args.llm:
+            start = time.perf_counter()
+            parsed = await request_ollama_parse(item["query"])
+            llm_latencies.append((time.perf_counter() - start) * 1000)
+            llm_results.append(correct_fields(parsed, item))
+
+    coverage = len(fast_results) / max(len(labeled), 1)
+    print(
+        f"{len(labeled)} queries, fast-path threshold {args.min_confidence}, "
+        f"coverage {coverage:.0%}"
+    )
+    print(
+        f"{'parser':<10} {'n':>4} "
+        + " ".join(f"{field:>13}" for field in FIELDS)
+        + f" {'exact':>7} {'p50 ms':>9}"
+    )
+    report("rules", rule_results, rule_latencies)
+    report("fast-path", fast_results, fast_latencies)
+    if args.llm:
+        report("llm", llm_results, llm_latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rule parser vs LLM parser benchmark")
+    parser.add_argument("--queries", default=str(LABELED_QUERIES_PATH), help="Labeled query file")
+    parser.add_argument("--min-confidence", type=float, default=settings.rule_parser_min_confidence)
+    parser.add_argument("--llm", action="store_true", help="Also run the Ollama parser")
+    parser.add_argument("--verbose", action="store_true", help="Print each rule parse")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
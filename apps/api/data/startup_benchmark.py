@@ -0,0 +1,110 @@
+"""CLI script to measure API import time and time until liveness and readiness."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+# Modules that should only load during warmup or on first use, not on `import app.main`.
+HEAVY_MODULES = ("torch", "sentence_transformers", "langchain_core", "langchain_postgres", "geopy")
+
+IMPORT_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+heavy = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure_import(runs: int) -> None:
+    timings: list[float] = []
+    heavy: list[str] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE], capture_output=True, text=True, check=True
+        )
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(probe["seconds"] * 1000)
+        heavy = probe["heavy"]
+    print(
+        f"import app.main: median {statistics.median(timings):.0f} ms, "
+        f"min {min(timings):.0f} ms over {runs} runs"
+    )
+    print(f"heavy modules imported eagerly: {', '.join(heavy) or 'none'}")
+
+
+def wait_for(client: httpx.Client, path: str, deadline: float) -> bool:
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(path).status_code == 200:
+                return True
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    return False
+
+
+def measure_serve(port: int, timeout: float) -> None:
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = start + timeout
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=5.0) as client:
+            if not wait_for(client, "/health", deadline):
+                print(f"liveness: not reached within {timeout:.0f} s")
+                return
+            print(f"liveness (/health): {(time.perf_counter() - start) * 1000:.0f} ms")
+            ready = wait_for(client, "/health/ready", deadline)
+            elapsed = (time.perf_counter() - start) * 1000
+            if not ready:
+                detail = client.get("/health/ready").json().get("detail", {})
+                print(f"readiness: not ready after {elapsed:.0f} ms: {detail}")
+                return
+            print(f"readiness (/health/ready): {elapsed:.0f} ms")
+            # With STARTUP_READY_AFTER_EMBEDDING, other stages keep warming up after readiness.
+            report = client.get("/health/ready").json()
+            while report["startup_ms"] is None and time.perf_counter() < deadline:
+                time.sleep(0.05)
+                report = client.get("/health/ready").json()
+            if report["startup_ms"] is None:
+                print(f"warmup: not finished within {timeout:.0f} s")
+            else:
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"all warmup stages finished: {elapsed:.0f} ms")
+            print(f"warmup stages (ms, run in parallel): {report['stages']}")
+            if report["errors"]:
+                print(f"failed stages: {report['errors']}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API startup time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters timing the import")
+    parser.add_argument(
+        "--serve", action="store_true", help="Also start uvicorn and time liveness/readiness"
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds to wait for ready")
+    args = parser.parse_args()
+
+    measure_import(args.runs)
+    if args.serve:
+        measure_serve(args.port, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""CLI script to build the asset vector ANN index for a candidate mode and drop the others."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy.sql import text
+
+from app.core.config import settings
+from app.core.config.constants import ASSET_VECTOR_INDEXES
+from app.db.database import engine
+from app.services.vector_search import vector_index_ddl
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Asset vector index for a candidate mode")
+    parser.add_argument(
+        "--mode",
+        default=settings.vector_candidate_mode,
+        choices=ASSET_VECTOR_INDEXES,
+        help="Candidate mode to index (default: VECTOR_CANDIDATE_MODE)",
+    )
+    parser.add_argument(
+        "--keep-others",
+        action="store_true",
+        help="Keep the other modes' indexes (e.g. to compare them with the recall benchmark)",
+    )
+    args = parser.parse_args()
+
+    # CONCURRENTLY keeps asset writes going during the build but cannot run in a transaction.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        start = time.perf_counter()
+        connection.execute(text(vector_index_ddl(args.mode, concurrently=True)))
+        elapsed = time.perf_counter() - start
+        print(f"Index {ASSET_VECTOR_INDEXES[args.mode]} ready in {elapsed:.1f} s")
+        if not args.keep_others:
+            for mode, index_name in ASSET_VECTOR_INDEXES.items():
+                if mode != args.mode:
+                    connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+            print("Dropped the other candidate modes' indexes.")
+
+        sizes = connection.execute(
+            text(
+                "SELECT indexrelname, pg_size_pretty(pg_relation_size(indexrelid)) "
+                "FROM pg_stat_user_indexes WHERE indexrelname = ANY(:names) ORDER BY 1"
+            ).bindparams(names=list(ASSET_VECTOR_INDEXES.values()))
+        ).all()
+        for index_name, size in sizes:
+            print(f"  {index_name}: {size}")
+    if args.mode != settings.vector_candidate_mode:
+        print(f"Set VECTOR_CANDIDATE_MODE={args.mode} and restart the API to use it.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""CLI script to check the in-process vector mirror against exact SQL vector search."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+
+from sqlalchemy.sql import text
+from sqlmodel import Session
+
+from app.db.database import engine
+from app.services.vector_mirror import vector_mirror
+
+EXACT_QUERY = text(
+    """
+    SELECT id, asset_vector <=> :query_vector AS vector_distance
+    FROM asset
+    WHERE asset_vector IS NOT NULL
+      AND (CAST(:asset_type_id AS integer) IS NULL OR asset_type_id = :asset_type_id)
+    ORDER BY vector_distance, id
+    LIMIT :k
+    """
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare vector mirror top-k with SQL")
+    parser.add_argument("--queries", type=int, default=50, help="Asset vectors used as queries")
+    parser.add_argument("--k", type=int, default=20, help="Result size compared per query")
+    parser.add_argument(
+        "--tolerance", type=float, default=1e-5, help="Allowed cosine distance difference"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        snapshot = vector_mirror.load(session)
+        if len(snapshot) == 0:
+            print("No vectorized assets to compare.")
+            return
+
+        # Sequential scan so SQL returns the exact neighbours, not the HNSW approximation.
+        session.exec(text("SELECT set_config('enable_indexscan', 'off', true)"))
+        rng = random.Random(args.seed)
+        positions = rng.sample(range(len(snapshot)), min(args.queries, len(snapshot)))
+
+        failures = 0
+        max_delta = 0.0
+        for position in positions:
+            query_vector = snapshot.vectors[position].tolist()
+            asset_type_id = int(snapshot.asset_type_id[position])
+            for type_filter in (None, asset_type_id if asset_type_id >= 0 else None):
+                mirror_ids, mirror_distances = snapshot.top_k(
+                    query_vector,
+                    args.k,
+                    asset_type_ids=[type_filter] if type_filter is not None else None,
+                )
+                rows = session.exec(
+                    EXACT_QUERY.bindparams(
+                        query_vector=str(query_vector), asset_type_id=type_filter, k=args.k
+                    )
+                ).fetchall()
+                sql_distances = {row[0]: row[1] for row in rows}
+                deltas = [
+                    abs(distance - sql_distances[asset_id])
+                    for asset_id, distance in zip(mirror_ids.tolist(), mirror_distances.tolist())
+                    if asset_id in sql_distances
+                ]
+                max_delta = max([max_delta, *deltas])
+                # Ids may only differ where distances tie within the tolerance.
+                if len(rows) != len(mirror_ids) or any(
+                    abs(mirror_distance - row[1]) > args.tolerance
+                    for mirror_distance, row in zip(mirror_distances.tolist(), rows)
+                ):
+                    failures += 1
+                    print(f"Mismatch for asset {int(snapshot.ids[position])} (type={type_filter})")
+
+    checks = len(positions) * 2
+    print(f"Parity: {checks - failures}/{checks} checks passed, max distance delta {max_delta:.2e}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
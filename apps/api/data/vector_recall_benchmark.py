@@ -0,0 +1,110 @@
+"""CLI script to measure recall and latency of the vector candidate modes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+from sqlalchemy.sql import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.config.constants import ASSET_VECTOR_INDEXES
+from app.db.database import engine
+from app.services.vector_search import (
+    apply_vector_search_options,
+    candidate_mode,
+    nearest_assets_params,
+    nearest_assets_sql,
+    vector_candidate_count,
+)
+
+ASSET_FROM_WHERE = "FROM asset AS assets WHERE assets.asset_vector IS NOT NULL"
+
+
+def set_index_scan(session: Session, enabled: bool) -> None:
+    session.exec(
+        text("SELECT set_config('enable_indexscan', :value, true)").bindparams(
+            value="on" if enabled else "off"
+        )
+    )
+
+
+def nearest_ids(session: Session, query_vector: str, k: int, mode: str) -> list[int]:
+    query = text(nearest_assets_sql(ASSET_FROM_WHERE, "k", mode))
+    params = {
+        "query_vector": query_vector,
+        "k": k,
+        **nearest_assets_params(k, json.loads(query_vector), mode),
+    }
+    return [row[0] for row in session.exec(query.bindparams(**params)).fetchall()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vector candidate mode recall benchmark")
+    parser.add_argument("--queries", type=int, default=100, help="Asset vectors used as queries")
+    parser.add_argument("--k", type=int, default=20, help="Neighbours compared per query")
+    parser.add_argument(
+        "--modes", nargs="+", default=list(ASSET_VECTOR_INDEXES), choices=ASSET_VECTOR_INDEXES
+    )
+    parser.add_argument("--rerank-factor", type=int, default=settings.vector_rerank_factor)
+    parser.add_argument("--ef-search", type=int, default=None)
+    args = parser.parse_args()
+    settings.vector_rerank_factor = args.rerank_factor
+
+    with Session(engine) as session:
+        session.exec(text("SELECT setseed(0)"))
+        sample = text(
+            "SELECT asset_vector::text FROM asset WHERE asset_vector IS NOT NULL "
+            "ORDER BY random() LIMIT :queries"
+        ).bindparams(queries=args.queries)
+        query_vectors = session.exec(sample).scalars().all()
+        if not query_vectors:
+            print("No vectorized assets to benchmark.")
+            return
+
+        # Ground truth from an exact sequential scan.
+        set_index_scan(session, False)
+        truth = [set(nearest_ids(session, vector, args.k, "full")) for vector in query_vectors]
+        set_index_scan(session, True)
+
+        print(f"{len(query_vectors)} queries, k={args.k}, rerank factor={args.rerank_factor}")
+        print(f"{'mode':<8} {'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8} {'index size':>11}")
+        for mode in args.modes:
+            if candidate_mode(mode) != mode:
+                print(f"{mode:<8} skipped (no embedding projection loaded)")
+                continue
+            index_size = session.exec(
+                text(
+                    "SELECT pg_size_pretty(pg_relation_size(to_regclass(:index_name)))"
+                ).bindparams(index_name=ASSET_VECTOR_INDEXES[mode])
+            ).scalar_one()
+            if index_size is None and mode != "full":
+                # Without its index the mode is a sequential scan; nothing to compare.
+                print(f"{mode:<8} skipped (build it: python -m data.vector_index --mode {mode})")
+                continue
+            apply_vector_search_options(
+                session,
+                ef_search=args.ef_search,
+                min_candidates=vector_candidate_count(args.k, mode),
+            )
+            recalls: list[float] = []
+            latencies: list[float] = []
+            for vector, expected in zip(query_vectors, truth):
+                start = time.perf_counter()
+                found = nearest_ids(session, vector, args.k, mode)
+                latencies.append((time.perf_counter() - start) * 1000)
+                recalls.append(len(expected.intersection(found)) / max(len(expected), 1))
+
+            latencies.sort()
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(
+                f"{mode:<8} {statistics.mean(recalls):>9.4f} "
+                f"{statistics.median(latencies):>8.2f} {p95:>8.2f} {index_size or '-':>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 -- Database initialization script for PostgreSQL
--- Enables required extensions for pgvector and PostGIS
+-- Enables required extensions for pgvector, PostGIS and pg_trgm
 
 -- Enable PostGIS extension for geospatial queries
 CREATE EXTENSION IF NOT EXISTS postgis;
@@ -7,9 +7,12 @@ CREATE EXTENSION IF NOT EXISTS postgis;
 -- Enable pgvector extension for vector similarity search
 CREATE EXTENSION IF NOT EXISTS vector;
 
+-- Enable pg_trgm for indexed lexical (trigram) matching in search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Verify extensions are installed
 SELECT
     extname AS "Extension",
     extversion AS "Version"
 FROM pg_extension
-WHERE extname IN ('vector', 'postgis');
+WHERE extname IN ('vector', 'postgis', 'pg_trgm');
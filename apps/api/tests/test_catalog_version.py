@@ -0,0 +1,53 @@
+"""
+Shared catalog version: bumps are written to the `catalog_change` table, so a
+worker that did not make the write still sees the new version and which
+assets changed. Runs when DATABASE_URL points at a migrated database. Run
+with `uv run python -m unittest discover -s tests`.
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.services import catalog_version  # noqa: E402
+
+
+class CatalogVersionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from sqlalchemy.exc import SQLAlchemyError
+        from sqlalchemy.sql import text
+
+        from app.db.database import engine
+
+        try:
+            with engine.connect() as connection:
+                migrated = connection.execute(
+                    text("SELECT to_regclass('catalog_change')")
+                ).scalar_one()
+        except SQLAlchemyError as e:
+            self.skipTest(f"database unavailable: {e}")
+        if migrated is None:
+            self.skipTest("catalog_change table not migrated")
+
+    def forget_local_version(self) -> None:
+        """Make the next read behave like a worker that has not seen recent bumps."""
+        catalog_version._checked_at = None
+
+    def test_other_workers_see_bumps(self) -> None:
+        before = catalog_version.read_catalog_version()
+        version = catalog_version.bump_catalog_version([3, 1, 3])
+        self.assertGreater(version, before)
+        self.forget_local_version()
+        self.assertEqual(catalog_version.current_catalog_version(), version)
+        self.assertEqual(catalog_version.changes_since(before), frozenset({1, 3}))
+        self.assertEqual(catalog_version.changes_since(version), frozenset())
+
+    def test_bulk_write_requires_full_reload(self) -> None:
+        before = catalog_version.bump_catalog_version([7])
+        catalog_version.bump_catalog_version()
+        self.assertIsNone(catalog_version.changes_since(before))
+
+
+if __name__ == "__main__":
+    unittest.main()
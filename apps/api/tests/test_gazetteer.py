@@ -0,0 +1,51 @@
+"""
+Offline gazetteer: subdistrict and station coverage, and trigram-filtered fuzzy
+matching agreeing with a full fuzzy scan. Run with
+`uv run python -m unittest discover -s tests`.
+"""
+
+import difflib
+import os
+import random
+import unittest
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.core.config import settings  # noqa: E402
+from app.services.geocode_service import (  # noqa: E402
+    fuzzy_gazetteer_key,
+    gazetteer_keys,
+    lookup_gazetteer,
+)
+
+
+class GazetteerTest(unittest.TestCase):
+    def test_subdistricts_and_stations(self):
+        for text, name_en in [
+            ("แขวงสามเสนใน", "Samsen Nai"),
+            ("คอนโดใกล้ BTS รัชโยธิน", "Ratchayothin"),
+            ("MRT Wong Sawang", "Wong Sawang"),
+            ("near Punnawithi station", "Punnawithi"),
+            ("บ้านเดี่ยว ศรีนุช", "Si Nut"),
+        ]:
+            entry = lookup_gazetteer(text)
+            self.assertIsNotNone(entry, text)
+            self.assertEqual(entry.name_en, name_en, text)
+
+    def test_fuzzy_matches_agree_with_full_scan(self):
+        rng = random.Random(0)
+        for key in rng.sample(gazetteer_keys, 150):
+            position = rng.randrange(len(key))
+            for typo in (
+                key[: position + 1] + key[position:],
+                key[:position] + key[position + 1 :],
+                key[:position] + "x" + key[position + 1 :],
+            ):
+                expected = difflib.get_close_matches(
+                    typo, gazetteer_keys, n=1, cutoff=settings.gazetteer_fuzzy_cutoff
+                )
+                self.assertEqual(fuzzy_gazetteer_key(typo), next(iter(expected), None), typo)
+
+
+if __name__ == "__main__":
+    unittest.main()
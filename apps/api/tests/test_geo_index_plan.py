@@ -0,0 +1,65 @@
+"""
+Plan regression check for the search radius filter: `ST_DWithin` on
+asset.location_geog must be answerable from the GiST index
+`idx_asset_location_geog` (a cast such as `location_geom::geography` would
+silently turn it into a per-row computation). Runs when DATABASE_URL points at
+a migrated database. Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.schemas.search import SearchFilterSchema  # noqa: E402
+from app.services.search_service import search_where_clause  # noqa: E402
+
+GEOG_INDEX = "idx_asset_location_geog"
+# Central Bangkok (lat, lon)
+LOCATION = (13.7563, 100.5018)
+
+
+def index_names(plan):
+    """Every index named anywhere in an EXPLAIN (FORMAT JSON) plan tree."""
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= index_names(child)
+    return names
+
+
+class GeoIndexPlanTest(unittest.TestCase):
+    def setUp(self) -> None:
+        from sqlalchemy.exc import SQLAlchemyError
+        from sqlalchemy.sql import text
+        from sqlmodel import Session
+
+        from app.db.database import engine
+
+        try:
+            self.session = Session(engine)
+            migrated = self.session.exec(text("SELECT to_regclass('asset')")).scalar_one()
+        except SQLAlchemyError as e:
+            self.skipTest(f"database unavailable: {e}")
+        self.addCleanup(self.session.close)
+        if migrated is None:
+            self.skipTest("asset table not migrated")
+
+    def explain(self, sql, params):
+        from sqlalchemy.sql import text
+
+        # Small catalogs make a sequential scan cheaper; disabling it shows whether the
+        # index can serve the predicate at all.
+        self.session.exec(text("SELECT set_config('enable_seqscan', 'off', true)"))
+        plan = self.session.exec(
+            text(f"EXPLAIN (FORMAT JSON) {sql}").bindparams(**params)
+        ).scalar_one()
+        return plan[0]["Plan"]
+
+    def test_search_radius_filter_uses_gist_index(self) -> None:
+        where, params = search_where_clause(SearchFilterSchema(), {}, LOCATION)
+        plan = self.explain(f"SELECT assets.id FROM asset AS assets {where}", params)
+        self.assertIn(GEOG_INDEX, index_names(plan), plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
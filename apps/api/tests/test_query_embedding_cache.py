@@ -0,0 +1,48 @@
+"""
+Query embedding cache: keys ignore whitespace only and the model sees the
+original (cased) text. Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.services import search_service  # noqa: E402
+
+
+def fake_vector(text):
+    return [float(len(text)), float(sum(map(ord, text)))]
+
+
+class QueryEmbeddingCacheTest(unittest.TestCase):
+    def setUp(self):
+        search_service.embedding_cache.clear()
+
+    def test_encode_query_embeds_original_text(self):
+        encode = mock.AsyncMock(side_effect=fake_vector)
+        with mock.patch.object(search_service.embedding_dispatcher, "encode", encode):
+            first = asyncio.run(search_service.encode_query("Condo  near Silom"))
+            again = asyncio.run(search_service.encode_query("Condo near Silom "))
+            lower = asyncio.run(search_service.encode_query("condo near silom"))
+        self.assertEqual(
+            [call.args[0] for call in encode.await_args_list],
+            ["Condo  near Silom", "condo near silom"],
+        )
+        self.assertEqual(first, again)
+        self.assertNotEqual(first, lower)
+
+    def test_encode_queries_embeds_original_texts(self):
+        with mock.patch.object(
+            search_service, "encode_batch", side_effect=lambda texts: list(map(fake_vector, texts))
+        ) as encode_batch:
+            vectors = search_service.encode_queries(["House BTS", "house bts", "House  BTS"])
+        encode_batch.assert_called_once_with(["House BTS", "house bts"])
+        self.assertEqual(vectors[0], vectors[2])
+        self.assertNotEqual(vectors[0], vectors[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Search totals are counted on the first page only; cursor pages skip the count.
+Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.schemas.search import SearchRequestSchema  # noqa: E402
+from app.services import search_service  # noqa: E402
+from app.services.pagination import encode_cursor  # noqa: E402
+
+
+class Row(tuple):
+    @property
+    def _mapping(self):
+        return {"id": self[0]}
+
+
+def fake_db(rows):
+    db = mock.Mock()
+    db.exec.return_value.fetchall.return_value = rows
+    return db
+
+
+def page_sql(db):
+    return str(db.exec.call_args_list[0].args[0])
+
+
+class SearchTotalsTest(unittest.TestCase):
+    def browse(self, pagination, rows, **options):
+        request = SearchRequestSchema(pagination=pagination, options=options)
+        from_where = "FROM asset AS assets"
+        count_column = search_service.total_count_column(
+            from_where, search_service.total_count_mode(request)
+        )
+        db = fake_db(rows)
+        response = search_service.build_search_response(
+            db,
+            request,
+            f"SELECT assets.id, {count_column} {from_where}",
+            from_where,
+            {"limit": request.pagination.page_size, "offset": 0},
+            ["id"],
+            "search_all",
+        )
+        return db, response
+
+    def test_first_page_counts(self):
+        rows = [Row((1, "A1", "a", 1.0, None, None, None, 45))]
+        db, response = self.browse({"page_size": 1}, rows)
+        self.assertIn("COUNT(*) OVER ()", page_sql(db))
+        self.assertEqual((response.total_count, response.total_pages), (45, 45))
+        self.assertIsNotNone(response.next_cursor)
+
+    def test_cursor_page_skips_count(self):
+        cursor = encode_cursor("search_all", [1])
+        db, response = self.browse(
+            {"page_size": 2, "cursor": cursor}, [], count_mode="capped", count_cap=10
+        )
+        self.assertNotIn("COUNT", page_sql(db))
+        self.assertEqual(db.exec.call_count, 1)
+        self.assertIsNone(response.total_count)
+        self.assertIsNone(response.total_pages)
+
+
+if __name__ == "__main__":
+    unittest.main()
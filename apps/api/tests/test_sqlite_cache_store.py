@@ -0,0 +1,59 @@
+"""
+SQLiteCacheStore: one reused connection per process and purging of expired rows.
+Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from app.core.cache import SQLiteCacheStore
+
+
+class SQLiteCacheStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / "cache.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def row_count(self, store):
+        with sqlite3.connect(store.path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {store.table}").fetchone()[0]
+
+    def test_round_trip_reuses_connection(self):
+        store = SQLiteCacheStore(self.path, table="entries")
+        connection = store._conn
+        store.set("key", {"filters": {"bedrooms": 2}, "text": "คอนโด"})
+        self.assertEqual(store.get("key"), {"filters": {"bedrooms": 2}, "text": "คอนโด"})
+        self.assertIsNone(store.get("missing"))
+        self.assertIs(store._conn, connection)
+        store.close()
+
+    def test_expired_rows_are_hidden_and_purged_on_write(self):
+        store = SQLiteCacheStore(
+            self.path, table="entries", ttl_seconds=0.05, purge_interval_seconds=0.0
+        )
+        store.set("old", 1)
+        time.sleep(0.1)
+        self.assertIsNone(store.get("old"))
+        store.set("new", 2)
+        self.assertEqual(self.row_count(store), 1)
+        self.assertEqual(store.get("new"), 2)
+        store.close()
+
+    def test_purge_expired(self):
+        store = SQLiteCacheStore(self.path, table="entries", ttl_seconds=0.05)
+        store.set("a", 1)
+        store.set("b", 2)
+        time.sleep(0.1)
+        self.assertEqual(store.purge_expired(), 2)
+        self.assertEqual(self.row_count(store), 0)
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Autocomplete index: requests never build the index themselves. Before the
+first build they get no snapshot while the build runs in the background.
+Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.services import suggest_index as suggest_module  # noqa: E402
+from app.services.suggest_index import (  # noqa: E402
+    SuggestIndex,
+    Suggestion,
+    SuggestSnapshot,
+)
+
+SUGGESTIONS = [
+    Suggestion(text="Asok", kind="location"),
+    Suggestion(text="Condo", kind="asset_type", id=1),
+    Suggestion(text="Asoke Residence", kind="asset", id=7),
+]
+
+
+class SuggestIndexTest(unittest.TestCase):
+    def test_current_does_not_block_before_first_build(self):
+        index = SuggestIndex()
+        release = threading.Event()
+        built = threading.Event()
+
+        def slow_load(db):
+            release.wait(5)
+            index._snapshot = SuggestSnapshot.build(SUGGESTIONS, 0, time.monotonic())
+            built.set()
+            return index._snapshot
+
+        with (
+            mock.patch.object(suggest_module, "Session", mock.MagicMock()),
+            mock.patch.object(suggest_module, "current_catalog_version", lambda: 0),
+            mock.patch.object(index, "load", slow_load),
+        ):
+            start = time.perf_counter()
+            self.assertIsNone(index.current())
+            self.assertIsNone(index.current())
+            self.assertLess(time.perf_counter() - start, 0.1)
+            # A second call while the build runs does not start another one.
+            self.assertFalse(index.claim_rebuild())
+
+            release.set()
+            self.assertTrue(built.wait(5))
+            snapshot = index.current()
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(
+            [item.text for item in snapshot.lookup("aso", 5)], ["Asok", "Asoke Residence"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Parity of the in-process vector mirror with pgvector ordering.
+The synthetic cases run anywhere; the database case compares against exact
+(sequential scan) `ORDER BY asset_vector <=> :query_vector, id` and runs when
+DATABASE_URL points at a database with vectorized assets.
+Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import os
+import random
+import unittest
+
+import numpy as np
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.core.config.constants import EMBEDDING_DIMENSION  # noqa: E402
+from app.services.vector_mirror import MirrorSnapshot  # noqa: E402
+
+TOLERANCE = 1e-5
+
+
+def reference_top_k(rows, query, k, keep=lambda row: True):
+    """pgvector semantics: cosine distance in float64, ties broken by id, NULL last."""
+    query = np.asarray(query, dtype=np.float64)
+    ranked = []
+    for row in rows:
+        if not keep(row):
+            continue
+        vector = np.asarray(row[1], dtype=np.float64)
+        denominator = np.linalg.norm(vector) * np.linalg.norm(query)
+        distance = 1 - vector @ query / denominator if denominator else np.inf
+        ranked.append((distance, row[0]))
+    ranked.sort()
+    return ranked[:k]
+
+
+def assert_same_ranking(case, mirror, expected):
+    mirror_ids, mirror_distances = mirror
+    case.assertEqual(len(mirror_ids), len(expected))
+    for rank, (asset_id, distance, (expected_distance, expected_id)) in enumerate(
+        zip(mirror_ids.tolist(), mirror_distances.tolist(), expected)
+    ):
+        case.assertAlmostEqual(distance, expected_distance, delta=TOLERANCE, msg=f"rank {rank}")
+        # Ids may only differ where distances tie within the tolerance.
+        if asset_id != expected_id:
+            tied = [d for d, i in expected if i == asset_id]
+            case.assertTrue(tied and abs(tied[0] - expected_distance) <= TOLERANCE)
+
+
+class SyntheticParityTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(7)
+        self.rows = []
+        for asset_id in range(1, 401):
+            vector = [rng.gauss(0, 1) for _ in range(EMBEDDING_DIMENSION)]
+            if asset_id % 50 == 0:
+                vector = list(self.rows[-1][1])  # exact duplicates exercise the id tie-break
+            self.rows.append(
+                (
+                    asset_id,
+                    vector,
+                    rng.choice([None, rng.uniform(5e5, 2e7)]),
+                    rng.choice([None, 1, 2, 3, 4]),
+                    rng.choice([None, 1, 2, 3]),
+                    rng.uniform(13.6, 13.9),
+                    rng.uniform(100.4, 100.7),
+                )
+            )
+        self.snapshot = MirrorSnapshot.from_rows(self.rows, version=0, loaded_at=0.0)
+        self.queries = [self.rows[position][1] for position in (0, 49, 123, 399)]
+
+    def test_unfiltered_order_matches(self) -> None:
+        for query in self.queries:
+            assert_same_ranking(
+                self, self.snapshot.top_k(query, 20), reference_top_k(self.rows, query, 20)
+            )
+
+    def test_filtered_order_matches(self) -> None:
+        def keep(row):
+            return (
+                row[2] is not None
+                and 1e6 <= row[2] <= 1e7
+                and row[3] is not None
+                and row[3] >= 2
+                and row[4] in (1, 3)
+            )
+
+        for query in self.queries:
+            mirror = self.snapshot.top_k(
+                query,
+                20,
+                price_min=1e6,
+                price_max=1e7,
+                bedrooms_min=2,
+                asset_type_ids=[1, 3],
+            )
+            assert_same_ranking(self, mirror, reference_top_k(self.rows, query, 20, keep))
+
+    def test_patched_snapshot_matches_rebuild(self) -> None:
+        changed = frozenset({3, 17, 250})
+        updated = [
+            (row[0], [value * -1 for value in row[1]], *row[2:])
+            for row in self.rows
+            if row[0] in changed
+        ]
+        fresh = MirrorSnapshot.from_rows(updated, version=1, loaded_at=0.0)
+        patched = self.snapshot.patched(changed, fresh)
+        rows = [row for row in self.rows if row[0] not in changed] + updated
+        for query in self.queries:
+            assert_same_ranking(self, patched.top_k(query, 20), reference_top_k(rows, query, 20))
+
+
+class DatabaseParityTest(unittest.TestCase):
+    """Mirror top-k against pgvector's own exact ordering on the configured database."""
+
+    def setUp(self) -> None:
+        from sqlalchemy.exc import SQLAlchemyError
+        from sqlmodel import Session
+
+        from app.db.database import engine
+        from app.services.vector_mirror import vector_mirror
+
+        try:
+            self.session = Session(engine)
+            self.snapshot = vector_mirror.load(self.session)
+        except SQLAlchemyError as e:
+            self.skipTest(f"database unavailable: {e}")
+        self.addCleanup(self.session.close)
+        if len(self.snapshot) == 0:
+            self.skipTest("no vectorized assets")
+
+    def test_matches_exact_sql_order(self) -> None:
+        from sqlalchemy.sql import text
+
+        # Sequential scan so SQL returns the exact neighbours, not the HNSW approximation.
+        self.session.exec(text("SELECT set_config('enable_indexscan', 'off', true)"))
+        query = text(
+            """
+            SELECT asset_vector <=> :query_vector AS vector_distance, id
+            FROM asset
+            WHERE asset_vector IS NOT NULL
+              AND (CAST(:asset_type_id AS integer) IS NULL OR asset_type_id = :asset_type_id)
+            ORDER BY vector_distance, id
+            LIMIT :k
+            """
+        )
+        positions = random.Random(0).sample(range(len(self.snapshot)), min(20, len(self.snapshot)))
+        for position in positions:
+            query_vector = self.snapshot.vectors[position].tolist()
+            asset_type_id = int(self.snapshot.asset_type_id[position])
+            for type_filter in (None, asset_type_id if asset_type_id >= 0 else None):
+                expected = [
+                    (row[0], row[1])
+                    for row in self.session.exec(
+                        query.bindparams(
+                            query_vector=str(query_vector), asset_type_id=type_filter, k=20
+                        )
+                    ).fetchall()
+                ]
+                mirror = self.snapshot.top_k(
+                    query_vector,
+                    20,
+                    asset_type_ids=[type_filter] if type_filter is not None else None,
+                )
+                assert_same_ranking(self, mirror, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
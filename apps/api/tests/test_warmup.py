@@ -0,0 +1,82 @@
+"""
+Startup readiness: the worker stays unready until every warmup stage,
+including the Ollama preload, has finished; `startup_ready_after_embedding`
+opts into turning ready once the embedding stage succeeds.
+Run with `uv run python -m unittest discover -s tests`.
+"""
+
+import asyncio
+import os
+import time
+import unittest
+from unittest import mock
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from app.services import warmup  # noqa: E402
+
+
+async def quick_stage():
+    await asyncio.sleep(0.01)
+
+
+async def failing_stage():
+    raise RuntimeError("Embedding model could not be loaded.")
+
+
+class WarmupReadinessTest(unittest.TestCase):
+    def run_warmup(self, load_embedding, ready_after_embedding=False):
+        readiness = warmup.Readiness()
+        observed = {}
+
+        async def preload_ollama_models():
+            await asyncio.sleep(0.3)
+            observed["ready_during_preload"] = readiness.ready
+
+        async def scenario():
+            task = asyncio.create_task(warmup.warm_up())
+            await asyncio.sleep(0.1)
+            observed["status"] = readiness.status
+            observed["finished"] = readiness.finished
+            await task
+
+        with (
+            mock.patch.object(warmup, "readiness", readiness),
+            mock.patch.object(warmup, "load_embedding", load_embedding),
+            mock.patch.object(warmup, "init_chat_service", lambda: time.sleep(0.2)),
+            mock.patch.object(warmup, "init_ai_chat_service", lambda: None),
+            mock.patch.object(warmup, "warm_vector_mirror", lambda: None),
+            mock.patch.object(warmup, "warm_suggest_index", lambda: None),
+            mock.patch.object(warmup, "preload_ollama_models", preload_ollama_models),
+            mock.patch.object(warmup.settings, "startup_preload_ollama", True),
+            mock.patch.object(
+                warmup.settings, "startup_ready_after_embedding", ready_after_embedding
+            ),
+        ):
+            asyncio.run(scenario())
+        return readiness, observed
+
+    def test_not_ready_until_ollama_preload_finishes(self):
+        readiness, observed = self.run_warmup(quick_stage)
+        self.assertEqual(observed["status"], "starting")
+        self.assertFalse(observed["ready_during_preload"])
+        self.assertTrue(readiness.ready)
+        self.assertIn("ollama", readiness.stages)
+        self.assertGreaterEqual(readiness.ready_ms, readiness.stages["ollama"])
+
+    def test_early_readiness_is_opt_in(self):
+        readiness, observed = self.run_warmup(quick_stage, ready_after_embedding=True)
+        self.assertEqual(observed["status"], "ready")
+        self.assertFalse(observed["finished"])
+        self.assertTrue(readiness.finished)
+        self.assertLess(readiness.ready_ms, readiness.startup_ms)
+
+    def test_failed_embedding_reports_failed_immediately(self):
+        readiness, observed = self.run_warmup(failing_stage)
+        self.assertEqual(observed["status"], "failed")
+        self.assertFalse(observed["finished"])
+        self.assertFalse(readiness.ready)
+
+
+if __name__ == "__main__":
+    unittest.main()